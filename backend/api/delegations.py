@@ -18,6 +18,7 @@ from backend.core.exceptions import (
 )
 from backend.core.logging_config import get_logger
 from backend.core.metrics import increment_delegation_metric
+from backend.core.post_commit import run_post_commit_hooks
 from backend.database import get_db
 from backend.models.delegation import Delegation, DelegationMode
 from backend.models.field import Field
@@ -239,6 +240,7 @@ async def create_delegation(
         )
 
         await db.commit()
+        await run_post_commit_hooks(db)
 
         # Track adoption telemetry
         try:
@@ -521,6 +523,7 @@ async def remove_delegation(
         # Revoke the user's delegation using the service
         await service.revoke_user_delegation(current_user.id)
         await db.commit()
+        await run_post_commit_hooks(db)
 
         logger.info(
             "Delegation revoked successfully",
@@ -830,21 +833,29 @@ async def get_my_delegations(
         result = await db.execute(query)
         delegations = result.scalars().all()
 
-        # Get chain trace for each delegation
+        # Resolve chain traces once per distinct scope
         delegation_service = DelegationService(db)
 
-        response = []
-        for delegation in delegations:
-            # Resolve chain trace
-            chain = await delegation_service.resolve_delegation_chain(
-                user_id=delegation.delegator_id,
-                poll_id=delegation.poll_id,
-                label_id=delegation.label_id,
-                field_id=delegation.field_id,
-                institution_id=delegation.institution_id,
-                value_id=delegation.value_id,
-                idea_id=delegation.idea_id,
+        scopes = [
+            (
+                delegation.poll_id,
+                delegation.label_id,
+                delegation.field_id,
+                delegation.institution_id,
+                delegation.value_id,
+                delegation.idea_id,
             )
+            for delegation in delegations
+        ]
+        chains_by_scope = {}
+        for scope in dict.fromkeys(scopes):
+            chains_by_scope[scope] = await delegation_service.resolve_delegation_chains_bulk(
+                [current_user.id], *scope
+            )
+
+        response = []
+        for delegation, scope in zip(delegations, scopes):
+            chain = chains_by_scope[scope].get(str(delegation.delegator_id), [])
 
             chain_trace = []
             for chain_delegation in chain:
@@ -920,6 +931,7 @@ async def revoke_delegation(
         delegation_service = DelegationService(db)
         await delegation_service.revoke_delegation(delegation_id)
         await db.commit()
+        await run_post_commit_hooks(db)
 
         logger.info(
             f"Delegation {delegation_id} revoked successfully",
@@ -1184,6 +1196,28 @@ async def get_adoption_telemetry(
         raise ServerError("Failed to get adoption telemetry")
 
 
+@router.get("/admin/cache-stats", response_model=dict)
+async def get_delegation_cache_stats(
+    current_user: User = Security(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Get delegation cache statistics (admin only).
+
+    Counters and histograms are those of the worker serving the request;
+    key counts are estimates shared by all workers.
+
+    Returns:
+        dict: Key-count estimates, tier counters and serialization timings
+    """
+    if not current_user.is_superuser:
+        raise AuthorizationError("Only admins can view delegation cache statistics")
+
+    service = DelegationService(db)
+    stats = await service.cache.get_cache_stats()
+    stats["generated_at"] = datetime.utcnow().isoformat()
+    return stats
+
+
 @router.get("/me/chain", response_model=dict)
 async def get_my_delegation_chain(
     current_user: User = Security(get_current_active_user),
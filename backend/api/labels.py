@@ -29,6 +29,7 @@ from backend.models.poll_label import poll_labels
 from backend.schemas.label import Label as LabelSchema, LabelCreate, LabelUpdate, generate_slug
 from backend.schemas.poll import PollSummary
 from backend.config import get_settings
+from backend.services.poll_version import bump_poll_versions
 
 router = APIRouter()
 public_router = APIRouter()
@@ -196,6 +197,7 @@ async def update_label(
     
     await db.commit()
     await db.refresh(label)
+    await _bump_labelled_poll_versions(label.id, db)
     
     logger.info(f"Label updated: {label.name} ({label.slug})", extra={
         "label_id": str(label.id),
@@ -235,6 +237,7 @@ async def delete_label(
     # Soft delete
     await label.soft_delete(db)
     await db.commit()
+    await _bump_labelled_poll_versions(label.id, db)
     
     logger.info(f"Label deleted: {label.name} ({label.slug})", extra={
         "label_id": str(label.id),
@@ -244,6 +247,14 @@ async def delete_label(
     return {"message": "Label deleted successfully"}
 
 
+async def _bump_labelled_poll_versions(label_id, db: AsyncSession) -> None:
+    """Invalidate the poll detail ETags of every poll carrying a label."""
+    result = await db.execute(
+        select(poll_labels.c.poll_id).where(poll_labels.c.label_id == label_id)
+    )
+    await bump_poll_versions(result.scalars().all())
+
+
 @router.get("/{slug}/overview")
 async def get_label_overview(
     slug: str,
@@ -1,8 +1,11 @@
-from typing import Any, Dict, List
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy import select, and_, text, insert
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status, Request, Response
+from sqlalchemy import select, and_, case, func, text, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -16,15 +19,36 @@ from backend.core.exceptions import (
 from backend.core.logging_config import get_logger
 from backend.core.audit_mw import audit_event
 from backend.database import get_db
+from backend.models.delegation import Delegation
 from backend.models.poll import Poll
 from backend.models.user import User
 from backend.models.vote import Vote
 from backend.models.label import Label
 from backend.models.poll_label import poll_labels
 from backend.schemas.poll import Poll as PollSchema
-from backend.schemas.poll import PollCreate, PollUpdate, VoteStatus, PollResult
+from backend.schemas.poll import (
+    PollCreate,
+    PollUpdate,
+    VoteStatus,
+    PollResult,
+    PollResultsBatch,
+    PollResultsBatchRequest,
+)
 from backend.services.delegation import DelegationService
-from backend.services.poll import get_poll_results
+from backend.services.delegation.cache_warming import warm_poll_chain_cache
+from backend.services.poll import (
+    get_closed_poll_snapshot,
+    get_poll_results,
+    get_poll_results_batch,
+)
+from backend.services.poll_version import (
+    bump_poll_versions,
+    drop_poll_versions,
+    get_poll_version,
+    poll_detail_etag,
+    schedule_poll_version_change,
+    seed_poll_version,
+)
 from backend.config import get_settings
 
 router = APIRouter()
@@ -35,6 +59,7 @@ logger = get_logger(__name__)
 async def create_poll(
     request: Request,
     poll_data: PollCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Poll:
@@ -103,6 +128,12 @@ async def create_poll(
         )
         poll = poll_result.scalar_one()
 
+        # Precompute the audience's delegation chains before its first requests
+        if settings.DELEGATION_CACHE_WARMING_ENABLED:
+            background_tasks.add_task(
+                warm_poll_chain_cache, poll.id, [label.id for label in poll.labels]
+            )
+
         # Broadcast new proposal to activity feed
         try:
             from backend.core.websocket import manager
@@ -153,25 +184,39 @@ async def create_poll(
 
 @router.get("/", response_model=List[PollSchema])
 async def list_polls(
+    response: Response,
     skip: int = 0, 
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
     label: str = None,
     decision_type: str = None,
+    include_vote_status: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> List[Poll]:
-    """List all polls.
+    """List all polls, newest first.
+
+    Pages are keyed on (created_at, id): pass the X-Next-Cursor header of a
+    page as ``cursor`` to get the next one, at the same cost however deep
+    it is. ``skip`` still works for offset paging, and is ignored when a
+    cursor is given.
 
     Args:
+        response: Outgoing response (for the X-Next-Cursor header)
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Opaque position after which to continue
         label: Filter by label slug (comma-separated for multiple)
         decision_type: Filter by decision type (level_a, level_b)
+        include_vote_status: Add the current user's vote status to every poll
         db: Database session
         current_user: Currently authenticated user
 
     Returns:
         List[Poll]: List of polls
+
+    Raises:
+        ValidationError: If the cursor is invalid
     """
     settings = get_settings()
     query = select(Poll).options(selectinload(Poll.labels))
@@ -183,18 +228,35 @@ async def list_polls(
     # Apply label filter if feature is enabled
     if settings.LABELS_ENABLED and label:
         label_slugs = [slug.strip() for slug in label.split(',')]
-        # Join with labels table and filter by slug
-        query = query.join(Poll.labels).where(Label.slug.in_(label_slugs))
-    
-    query = query.offset(skip).limit(limit)
+        # EXISTS on poll_labels keeps one row per poll, so pages stay index-ordered
+        query = query.where(Poll.labels.any(Label.slug.in_(label_slugs)))
+
+    if cursor:
+        query = query.where(
+            tuple_(Poll.created_at, Poll.id) < tuple_(*_decode_poll_cursor(cursor))
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    # One extra row tells whether there is a next page
+    query = query.order_by(Poll.created_at.desc(), Poll.id.desc()).limit(limit + 1)
     result = await db.execute(query)
     polls = result.scalars().all()
+    if len(polls) > limit:
+        polls = polls[:limit]
+        response.headers["X-Next-Cursor"] = _encode_poll_cursor(polls[-1])
+
+    if include_vote_status and polls:
+        vote_statuses = await _get_vote_statuses(polls, current_user, db)
+        for poll in polls:
+            poll.your_vote_status = vote_statuses[str(poll.id)]
 
     logger.info(
         "Retrieved polls", 
         extra={
             "skip": skip, 
             "limit": limit,
+            "cursor": cursor,
             "label_filter": label,
             "decision_type_filter": decision_type,
             "count": len(polls),
@@ -204,16 +266,142 @@ async def list_polls(
     return polls
 
 
+async def _get_vote_statuses(
+    polls: List[Poll], current_user: User, db: AsyncSession
+) -> Dict[str, VoteStatus]:
+    """Vote status of the current user in each poll, keyed by poll ID.
+
+    Same statuses as the poll detail endpoint, computed with one vote query
+    for all polls and one chain resolution across their scopes.
+    """
+    settings = get_settings()
+    user_id = str(current_user.id)
+    poll_ids = [str(poll.id) for poll in polls]
+
+    vote_result = await db.execute(
+        select(Vote.poll_id).where(
+            and_(
+                Vote.user_id == current_user.id,
+                Vote.poll_id.in_(poll_ids),
+                Vote.is_deleted == False,
+            )
+        )
+    )
+    voted = {str(poll_id) for poll_id in vote_result.scalars().all()}
+    unvoted = [poll_id for poll_id in poll_ids if poll_id not in voted]
+
+    chains: Dict[str, List[str]] = {}
+    failed = False
+    if unvoted:
+        delegation_service = DelegationService(db)
+        try:
+            if settings.DELEGATION_RESOLUTION_TABLE_ENABLED:
+                resolutions = await delegation_service.get_poll_delegation_resolutions(
+                    current_user.id, unvoted
+                )
+                chains = {
+                    poll_id: json.loads(resolution.path)
+                    for poll_id, resolution in resolutions.items()
+                }
+            else:
+                resolved = await delegation_service.resolve_poll_delegation_chains(
+                    current_user.id, unvoted
+                )
+                chains = {
+                    poll_id: [user_id] + [str(delegation.delegatee_id) for delegation in chain]
+                    for poll_id, chain in resolved.items()
+                }
+        except Exception as e:
+            logger.error(
+                "Error in batched delegation chain resolution",
+                extra={"user_id": user_id, "poll_count": len(unvoted), "error": str(e)},
+                exc_info=settings.DEBUG,
+            )
+            failed = True
+
+    vote_statuses = {}
+    for poll_id in poll_ids:
+        vote_status = VoteStatus(
+            status="none",
+            resolved_vote_path=[current_user.id],
+            final_delegatee_id=current_user.id,
+        )
+        chain = chains.get(poll_id, [])
+        if poll_id in voted:
+            vote_status.status = "voted"
+        elif failed:
+            vote_status.status = "error"
+        elif len(chain) > 1 and chain[-1] != user_id:
+            vote_status.status = "delegated"
+            vote_status.final_delegatee_id = chain[-1]
+            vote_status.resolved_vote_path = chain
+        vote_statuses[poll_id] = vote_status
+    return vote_statuses
+
+
+async def _next_delegation_change(user_ids: List[str], db: AsyncSession) -> Optional[datetime]:
+    """Earliest future start or end of a delegation made by any of the users.
+
+    A chain only changes with time when one of its users' delegations starts
+    or ends, so this bounds how long a resolved vote status stays current.
+    """
+    now = datetime.utcnow()
+    pending = [
+        func.min(case((column > now, column)))
+        for column in (
+            Delegation.start_date,
+            Delegation.end_date,
+            Delegation.legacy_term_ends_at,
+        )
+    ]
+    result = await db.execute(
+        select(*pending).where(
+            and_(
+                Delegation.delegator_id.in_(user_ids),
+                Delegation.revoked_at.is_(None),
+                Delegation.is_deleted == False,
+            )
+        )
+    )
+    times = [value for value in result.one() if value is not None]
+    return min(times) if times else None
+
+
+def _encode_poll_cursor(poll: Poll) -> str:
+    """Opaque cursor for the (created_at, id) position of a poll."""
+    position = f"{poll.created_at.isoformat()}|{poll.id}"
+    return base64.urlsafe_b64encode(position.encode("utf-8")).decode("ascii")
+
+
+def _decode_poll_cursor(cursor: str):
+    """Decode a cursor into the (created_at, id) position it encodes."""
+    try:
+        created_at, poll_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+        return datetime.fromisoformat(created_at), str(UUID(poll_id))
+    except ValueError:
+        raise ValidationError("Invalid cursor")
+
+
 @router.get("/{poll_id}", response_model=PollSchema)
 async def get_poll(
     poll_id: UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Poll:
     """Get a poll by ID.
 
+    The response carries an ETag derived from the poll's version counter and
+    the current user; a matching If-None-Match returns 304 Not Modified
+    before the poll is loaded. The counter is only started once the poll
+    exists, and moves when the next delegation on the user's chain starts
+    or ends.
+
     Args:
         poll_id: ID of the poll
+        request: Incoming request (for conditional headers)
+        response: Outgoing response (for the ETag header)
         db: Database session
         current_user: Currently authenticated user
 
@@ -225,6 +413,14 @@ async def get_poll(
     """
     settings = get_settings()
     import traceback
+
+    version = await get_poll_version(poll_id)
+    etag = poll_detail_etag(poll_id, current_user.id, version) if version is not None else None
+    if etag is not None and _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+        )
     
     logger.info(
         "Starting poll detail request",
@@ -247,6 +443,11 @@ async def get_poll(
         
         logger.debug("Poll found", extra={"poll_id": str(poll_id), "poll_title": poll.title})
 
+        if version is None:
+            version = await seed_poll_version(poll_id)
+            if version is not None:
+                etag = poll_detail_etag(poll_id, current_user.id, version)
+
         # Check for direct vote
         logger.debug("Checking for direct vote", extra={"poll_id": str(poll_id), "user_id": str(current_user.id)})
         vote_result = await db.execute(
@@ -254,6 +455,7 @@ async def get_poll(
                 and_(
                     Vote.user_id == current_user.id,
                     Vote.poll_id == poll_id,
+                    Vote.is_deleted == False,
                 )
             )
         )
@@ -280,10 +482,21 @@ async def get_poll(
             logger.debug("Checking delegation chain", extra={"poll_id": str(poll_id), "user_id": str(current_user.id)})
             delegation_service = DelegationService(db)
             try:
-                chain = await delegation_service.resolve_delegation_chain(
-                    current_user.id, poll_id
-                )
-                final_delegatee = chain[-1] if chain else str(current_user.id)
+                if settings.DELEGATION_RESOLUTION_TABLE_ENABLED:
+                    # Materialized resolution: one indexed lookup, no chain walk
+                    resolution = await delegation_service.get_delegation_resolution(
+                        current_user.id, poll_id
+                    )
+                    chain = json.loads(resolution.path) if resolution else []
+                else:
+                    # Loaded delegations carry string IDs, which a UUID scope never matches
+                    delegations = await delegation_service.resolve_delegation_chain(
+                        current_user.id, str(poll_id)
+                    )
+                    chain = [str(current_user.id)] + [
+                        str(delegation.delegatee_id) for delegation in delegations
+                    ]
+                final_delegatee = chain[-1] if len(chain) > 1 else str(current_user.id)
                 logger.debug("Delegation chain resolved", extra={
                     "poll_id": str(poll_id),
                     "user_id": str(current_user.id),
@@ -318,6 +531,17 @@ async def get_poll(
         # Add vote status to poll
         poll.your_vote_status = vote_status
 
+        # A failed resolution must not be revalidated as if it were current
+        if etag is not None and vote_status.status != "error":
+            if vote_status.status != "voted":
+                change_at = await _next_delegation_change(
+                    [str(user_id) for user_id in vote_status.resolved_vote_path], db
+                )
+                if change_at is not None:
+                    await schedule_poll_version_change(poll_id, change_at)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "private, no-cache"
+
         logger.info(
             "Successfully retrieved poll with vote status",
             extra={
@@ -389,6 +613,7 @@ async def update_poll(
 
         await db.commit()
         await db.refresh(poll)
+        await bump_poll_versions([poll.id])
 
         logger.info("Poll updated successfully", extra={"poll_id": poll_id})
         return poll
@@ -434,21 +659,78 @@ async def delete_poll(
 
     await db.delete(poll)
     await db.commit()
+    await drop_poll_versions([poll_id])
 
     logger.info("Poll deleted successfully", extra={"poll_id": poll_id})
     return None
 
 
+@router.post("/results:batch", response_model=PollResultsBatch)
+async def get_poll_results_batch_endpoint(
+    batch: PollResultsBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PollResultsBatch:
+    """Get the results of several polls in one request.
+
+    List and label pages render many poll cards at once; their results are
+    computed with shared vote and delegation queries instead of one full
+    tally per card.
+
+    Args:
+        batch: IDs of the polls
+        db: Database session
+        current_user: Currently authenticated user
+
+    Returns:
+        PollResultsBatch: Results keyed by poll ID, and the IDs not found
+
+    Raises:
+        ValidationError: If too many polls are requested or results cannot be calculated
+    """
+    max_polls = get_settings().POLL_RESULTS_BATCH_MAX_POLLS
+    if len(batch.poll_ids) > max_polls:
+        raise ValidationError(f"At most {max_polls} polls can be requested at once")
+
+    try:
+        results = await get_poll_results_batch(batch.poll_ids, db)
+    except Exception as e:
+        logger.error(
+            "Failed to get batch poll results",
+            extra={"poll_count": len(batch.poll_ids), "error": str(e)},
+            exc_info=True,
+        )
+        raise ValidationError("Failed to calculate poll results")
+
+    logger.info(
+        "Retrieved batch poll results",
+        extra={
+            "user_id": current_user.id,
+            "requested_count": len(batch.poll_ids),
+            "results_count": len(results),
+        },
+    )
+    return PollResultsBatch(
+        results=results,
+        not_found=[poll_id for poll_id in batch.poll_ids if str(poll_id) not in results],
+    )
+
+
 @router.get("/{poll_id}/results", response_model=List[PollResult])
 async def get_poll_results_endpoint(
     poll_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> List[PollResult]:
     """Get poll results with delegation support.
 
+    Closed polls are served from their immutable results snapshot with a
+    strong ETag; a matching If-None-Match returns 304 Not Modified.
+
     Args:
         poll_id: ID of the poll
+        request: Incoming request (for conditional headers)
         db: Database session
         current_user: Currently authenticated user
 
@@ -460,6 +742,16 @@ async def get_poll_results_endpoint(
         ValidationError: If poll data is invalid
     """
     try:
+        snapshot = await get_closed_poll_snapshot(poll_id, db)
+        if snapshot is not None:
+            etag = f'"{snapshot.etag}"'
+            headers = {"ETag": etag, "Cache-Control": "private, max-age=3600"}
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            return Response(
+                content=snapshot.payload, media_type="application/json", headers=headers
+            )
+
         results = await get_poll_results(poll_id, db)
         
         logger.info(
@@ -482,3 +774,11 @@ async def get_poll_results_endpoint(
             exc_info=True,
         )
         raise ValidationError("Failed to calculate poll results")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against a strong ETag."""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
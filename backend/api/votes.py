@@ -6,6 +6,7 @@ from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.config import get_settings
 from backend.core.auth import get_current_active_user, oauth2_scheme
 from backend.core.exceptions import (
     AuthorizationError,
@@ -27,6 +28,8 @@ from backend.models.user import User
 from backend.models.vote import Vote
 from backend.schemas.vote import Vote as VoteSchema
 from backend.schemas.vote import VoteCreate, VoteUpdate
+from backend.services.live_tally import LiveTallyService
+from backend.services.poll_version import bump_poll_versions
 
 logger = get_logger(__name__)
 router = APIRouter(tags=["votes"])
@@ -36,6 +39,17 @@ for route in router.routes:
     logger.info(f"Available route: {route.path} [{route.methods}]")
 
 
+def _is_closed_poll_error(error: ValueError) -> bool:
+    """Whether a voting error rejects a write on a closed poll."""
+    return "closed" in str(error).lower()
+
+
+def _closed_poll_error(error: ValueError, **log_extra) -> ValidationError:
+    """Validation error for a vote write on a closed poll."""
+    logger.warning("Vote write on closed poll", extra=log_extra)
+    return ValidationError(str(error))
+
+
 @router.post("/", response_model=VoteSchema, status_code=status.HTTP_201_CREATED)
 async def create_new_vote(
     request: Request,
@@ -79,6 +93,16 @@ async def create_new_vote(
         except Exception as e:
             logger.warning(f"Failed to broadcast vote creation", extra={"error": str(e)})
         
+        # The voter's status on the poll detail changed
+        await bump_poll_versions([vote.poll_id])
+
+        # Apply the vote to the poll's live tally
+        if get_settings().LIVE_TALLY_ENABLED:
+            try:
+                await LiveTallyService(db).record_vote_cast(vote)
+            except Exception as e:
+                logger.warning("Failed to update live tally", extra={"error": str(e)})
+        
         logger.info(
             "Vote created successfully",
             extra={"vote_id": vote.id, "user_id": current_user.id},
@@ -97,6 +121,8 @@ async def create_new_vote(
         
         return vote
     except ValueError as e:
+        if _is_closed_poll_error(e):
+            raise _closed_poll_error(e, user_id=current_user.id)
         logger.warning(
             "Vote creation failed - validation error",
             extra={"user_id": current_user.id, "error": str(e)},
@@ -241,15 +267,35 @@ async def update_existing_vote(
         },
     )
     try:
+        previous = None
+        if get_settings().LIVE_TALLY_ENABLED:
+            result = await db.execute(
+                select(Vote.option_id, Vote.weight).where(Vote.id == vote_id)
+            )
+            previous = result.one_or_none()
+
         vote = await update_vote(
             db, vote_id, vote_in.model_dump(exclude_unset=True), current_user
         )
+        await bump_poll_versions([vote.poll_id])
+
+        # Move the vote within the poll's live tally
+        if previous is not None:
+            try:
+                await LiveTallyService(db).record_vote_changed(
+                    vote, previous.option_id, previous.weight
+                )
+            except Exception as e:
+                logger.warning("Failed to update live tally", extra={"error": str(e)})
+
         logger.info(
             "Vote updated successfully",
             extra={"vote_id": vote_id, "user_id": current_user.id},
         )
         return vote
     except ValueError as e:
+        if _is_closed_poll_error(e):
+            raise _closed_poll_error(e, vote_id=vote_id, user_id=current_user.id)
         error_msg = str(e)
         if "not found" in error_msg.lower() or "does not exist" in error_msg.lower():
             logger.warning(
@@ -297,17 +343,29 @@ async def delete_existing_vote(
     Raises:
         ResourceNotFoundError: If vote not found
         AuthorizationError: If user is not vote creator
+        ValidationError: If the poll is closed
         ServerError: If an unexpected error occurs
     """
     logger.info("Deleting vote", extra={"vote_id": vote_id, "user_id": current_user.id})
     try:
         vote = await delete_vote(db, vote_id, current_user)
+        await bump_poll_versions([vote.poll_id])
+
+        # Remove the vote from the poll's live tally
+        if get_settings().LIVE_TALLY_ENABLED:
+            try:
+                await LiveTallyService(db).record_vote_removed(vote)
+            except Exception as e:
+                logger.warning("Failed to update live tally", extra={"error": str(e)})
+
         logger.info(
             "Vote deleted successfully",
             extra={"vote_id": vote_id, "user_id": current_user.id},
         )
         return vote
     except ValueError as e:
+        if _is_closed_poll_error(e):
+            raise _closed_poll_error(e, vote_id=vote_id, user_id=current_user.id)
         logger.warning(
             "Vote not found", extra={"vote_id": vote_id, "user_id": current_user.id}
         )
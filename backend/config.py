@@ -84,6 +84,30 @@ class Settings(BaseSettings):
     UNIFIED_SEARCH_ENABLED: bool = os.getenv("UNIFIED_SEARCH_ENABLED", "true").lower() == "true"
     INSTITUTIONS_ENABLED: bool = os.getenv("INSTITUTIONS_ENABLED", "true").lower() == "true"
     
+    # Poll results performance
+    LIVE_TALLY_ENABLED: bool = os.getenv("LIVE_TALLY_ENABLED", "false").lower() == "true"
+    LIVE_TALLY_DELTA_BATCH_SIZE: int = 100  # Open polls routed together on delegation writes
+    POLL_RESULTS_BATCH_MAX_POLLS: int = 50  # Poll IDs accepted by one batch results request
+    
+    # Delegation chain resolution performance
+    DELEGATION_GRAPH_INDEX_ENABLED: bool = os.getenv("DELEGATION_GRAPH_INDEX_ENABLED", "false").lower() == "true"
+    DELEGATION_GRAPH_INDEX_SYNC_SECONDS: float = 1.0  # How often to replay other workers' writes
+    DELEGATION_GRAPH_INDEX_RELOAD_SECONDS: int = 600  # Full reload interval (safety net)
+    DELEGATION_CHAIN_CTE_ENABLED: bool = os.getenv("DELEGATION_CHAIN_CTE_ENABLED", "false").lower() == "true"
+    DELEGATION_RESOLUTION_TABLE_ENABLED: bool = os.getenv("DELEGATION_RESOLUTION_TABLE_ENABLED", "false").lower() == "true"
+    DELEGATION_CYCLE_CHECK_MAX_DEPTH: int = 1000  # Hops followed when checking a new delegation for cycles
+    DELEGATION_L1_CACHE_ENABLED: bool = os.getenv("DELEGATION_L1_CACHE_ENABLED", "false").lower() == "true"
+    DELEGATION_L1_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # Serialized size cap per process
+    DELEGATION_L1_CACHE_TTL_SECONDS: int = 30  # Bounds staleness if an invalidation is missed
+    DELEGATION_CACHE_FORMAT_FALLBACK_ENABLED: bool = os.getenv("DELEGATION_CACHE_FORMAT_FALLBACK_ENABLED", "true").lower() == "true"
+    DELEGATION_CACHE_REWRITE_ON_READ: bool = os.getenv("DELEGATION_CACHE_REWRITE_ON_READ", "false").lower() == "true"  # Migrate fallback-format entries
+    DELEGATION_CACHE_BINARY_CHAINS_ENABLED: bool = os.getenv("DELEGATION_CACHE_BINARY_CHAINS_ENABLED", "false").lower() == "true"
+    DELEGATION_CACHE_EARLY_REFRESH_BETA: float = 10.0  # XFetch beta: larger refreshes hot chains earlier
+    DELEGATION_CACHE_RECOMPUTE_FLOOR_SECONDS: float = 1.0  # Lower bound of the recompute-time estimate
+    DELEGATION_CACHE_WARMING_ENABLED: bool = os.getenv("DELEGATION_CACHE_WARMING_ENABLED", "false").lower() == "true"
+    DELEGATION_CACHE_WARMING_BATCH_SIZE: int = 200  # Users resolved per warming batch
+    DELEGATION_CACHE_WARMING_PAUSE_SECONDS: float = 0.05  # Yield to foreground traffic between batches
+    
     # Testing
     TESTING: bool = os.getenv("TESTING", "false").lower() == "true"
     
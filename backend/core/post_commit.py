@@ -0,0 +1,55 @@
+"""Side effects deferred until a database transaction commits.
+
+Writes that also touch shared state outside the database (for example the
+in-memory delegation graph and its change stream) must not publish it
+before the transaction is durable: another worker could read it back
+against the old rows, and a rollback would leave it behind. Services
+register such effects with ``defer_until_commit`` and the code that owns
+the transaction runs them with ``run_post_commit_hooks`` right after
+``commit()``. A rollback of the outermost transaction discards the
+pending hooks.
+"""
+
+from typing import Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+PostCommitHook = Callable[[], Awaitable[None]]
+
+_HOOKS_KEY = "post_commit_hooks"
+
+
+def defer_until_commit(db: AsyncSession, hook: PostCommitHook) -> None:
+    """Run ``hook`` once the session's current transaction has committed."""
+    db.info.setdefault(_HOOKS_KEY, []).append(hook)
+
+
+async def run_post_commit_hooks(db: AsyncSession) -> None:
+    """Run the hooks registered before the last commit, in registration order.
+
+    A failing hook is logged and does not stop the others: the data is
+    already committed, and the deferred effects are best-effort like the
+    Redis writes they wrap.
+    """
+    hooks = db.info.pop(_HOOKS_KEY, [])
+    for hook in hooks:
+        try:
+            await hook()
+        except Exception as e:
+            logger.warning(
+                "Post-commit hook failed",
+                extra={"hook": getattr(hook, "__qualname__", repr(hook)), "error": str(e)},
+            )
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_hooks_on_rollback(session, previous_transaction) -> None:
+    """Drop pending hooks when the outermost transaction rolls back."""
+    if previous_transaction.parent is None:
+        session.info.pop(_HOOKS_KEY, None)
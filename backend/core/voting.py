@@ -3,14 +3,29 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
+from backend.models.poll import Poll
 from backend.models.user import User
 from backend.models.vote import Vote
+from backend.services.poll_tally import is_poll_open
+
+
+async def ensure_poll_accepts_votes(db: AsyncSession, poll_id) -> None:
+    """Reject vote writes once a poll is closed or past its end date.
+
+    Closed polls serve their results from an immutable snapshot, so a late
+    vote would silently be left out of a result behind a strong ETag.
+    """
+    result = await db.execute(select(Poll).where(Poll.id == poll_id))
+    poll = result.scalar_one_or_none()
+    if poll is not None and not is_poll_open(poll):
+        raise ValueError("Poll is closed for voting")
 
 
 async def create_vote(db: AsyncSession, vote_data: dict, user: User) -> Vote:
     """Create a new vote."""
     # Remove user_id from vote_data if it exists to avoid duplicate argument
     vote_data.pop("user_id", None)
+    await ensure_poll_accepts_votes(db, vote_data.get("poll_id"))
     vote = Vote(**vote_data, user_id=user.id)
     db.add(vote)
     
@@ -43,6 +58,7 @@ async def update_vote(
     vote = await get_vote(db, vote_id)
     if vote.user_id != user.id:
         raise ValueError("Not authorized to update this vote")
+    await ensure_poll_accepts_votes(db, vote.poll_id)
 
     for key, value in vote_data.items():
         setattr(vote, key, value)
@@ -63,6 +79,7 @@ async def delete_vote(db: AsyncSession, vote_id: UUID, user: User) -> Vote:
     vote = await get_vote(db, vote_id)
     if vote.user_id != user.id:
         raise ValueError("Not authorized to delete this vote")
+    await ensure_poll_accepts_votes(db, vote.poll_id)
 
     await db.delete(vote)
     await db.commit()
@@ -66,6 +66,8 @@ from backend.core.middleware import RequestContextMiddleware
 from backend.core.redis import close_redis_client, get_redis_client
 from backend.database import async_session_maker, get_db, init_db
 from backend.models.user import User
+from backend.services.delegation.graph_index import get_delegation_graph_index
+from backend.services.delegation.local_cache import get_local_cache_tier
 
 # Configure JSON logging
 configure_json_logging(
@@ -104,6 +106,27 @@ async def lifespan(app: FastAPI):
         logger.error("rate_limiter_initialization_failed", error=str(e))
         logger.warning("Continuing without rate limiting")
 
+    # Load the in-memory delegation graph index
+    if settings.DELEGATION_GRAPH_INDEX_ENABLED:
+        try:
+            async with async_session_maker() as session:
+                await get_delegation_graph_index().load(session, await get_redis_client())
+            logger.info("delegation_graph_index_loaded")
+        except Exception as e:
+            logger.error("delegation_graph_index_load_failed", error=str(e))
+            logger.warning("Continuing without delegation graph index")
+
+    # Follow other workers' delegation cache invalidations
+    delegation_cache_listener = None
+    if settings.DELEGATION_L1_CACHE_ENABLED:
+        try:
+            delegation_cache_listener = asyncio.create_task(
+                get_local_cache_tier().listen(await get_redis_client())
+            )
+            logger.info("delegation_cache_listener_started")
+        except Exception as e:
+            logger.error("delegation_cache_listener_failed", error=str(e))
+
     # Start WebSocket heartbeat
     try:
         from backend.core.websocket import manager
@@ -125,6 +148,13 @@ async def lifespan(app: FastAPI):
     # Shutdown logic
     logger.info("shutting_down_application")
 
+    if delegation_cache_listener is not None:
+        delegation_cache_listener.cancel()
+        try:
+            await delegation_cache_listener
+        except asyncio.CancelledError:
+            pass
+
     try:
         # Stop WebSocket heartbeat
         from backend.core.websocket import manager
@@ -0,0 +1,51 @@
+"""add_delegation_resolutions
+
+Revision ID: add_delegation_resolutions
+Revises: add_poll_result_snapshots
+Create Date: 2025-08-22 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_delegation_resolutions'
+down_revision: Union[str, None] = 'add_poll_result_snapshots'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create delegation_resolutions table ((scope, user) -> final delegatee)
+    op.create_table('delegation_resolutions',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('user_id', sa.String(length=32), nullable=False),
+        sa.Column('scope_key', sa.String(length=64), nullable=False),
+        sa.Column('final_delegatee_id', sa.String(length=32), nullable=False),
+        sa.Column('chain_length', sa.Integer(), nullable=False),
+        sa.Column('path', sa.Text(), nullable=False),
+        sa.Column('path_hash', sa.String(length=64), nullable=False),
+        sa.Column('resolved_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False, default=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['final_delegatee_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('scope_key', 'user_id', name='uq_delegation_resolutions_scope_user')
+    )
+    op.create_index(
+        'ix_delegation_resolutions_scope_final',
+        'delegation_resolutions',
+        ['scope_key', 'final_delegatee_id'],
+    )
+
+
+def downgrade() -> None:
+    # Drop delegation_resolutions table
+    op.drop_index('ix_delegation_resolutions_scope_final', table_name='delegation_resolutions')
+    op.drop_table('delegation_resolutions')
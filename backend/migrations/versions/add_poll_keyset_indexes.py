@@ -0,0 +1,35 @@
+"""add_poll_keyset_indexes
+
+Revision ID: add_poll_keyset_indexes
+Revises: add_vote_tally_index
+Create Date: 2025-08-25 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_poll_keyset_indexes'
+down_revision: Union[str, None] = 'add_vote_tally_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination of poll listings on (created_at, id)
+    op.create_index('ix_polls_created_at_id', 'polls', ['created_at', 'id'])
+    op.create_index(
+        'ix_polls_decision_type_created_at_id',
+        'polls',
+        ['decision_type', 'created_at', 'id'],
+    )
+    # Label filters probe poll_labels by label as well as by poll
+    op.create_index('ix_poll_labels_label_id_poll_id', 'poll_labels', ['label_id', 'poll_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_poll_labels_label_id_poll_id', table_name='poll_labels')
+    op.drop_index('ix_polls_decision_type_created_at_id', table_name='polls')
+    op.drop_index('ix_polls_created_at_id', table_name='polls')
@@ -0,0 +1,41 @@
+"""add_poll_result_snapshots
+
+Revision ID: add_poll_result_snapshots
+Revises: c46f3e8da2b5
+Create Date: 2025-08-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_poll_result_snapshots'
+down_revision: Union[str, None] = 'c46f3e8da2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create poll_result_snapshots table (one immutable snapshot per closed poll)
+    op.create_table('poll_result_snapshots',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('poll_id', sa.String(length=32), nullable=False),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+        sa.Column('etag', sa.String(length=64), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False, default=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['poll_id'], ['polls.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('poll_id', name='uq_poll_result_snapshots_poll_id')
+    )
+
+
+def downgrade() -> None:
+    # Drop poll_result_snapshots table
+    op.drop_table('poll_result_snapshots')
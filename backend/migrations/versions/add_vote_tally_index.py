@@ -0,0 +1,30 @@
+"""add_vote_tally_index
+
+Revision ID: add_vote_tally_index
+Revises: add_delegation_resolutions
+Create Date: 2025-08-24 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_vote_tally_index'
+down_revision: Union[str, None] = 'add_delegation_resolutions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering index for the per-option direct vote aggregate of poll tallies
+    op.create_index(
+        'ix_votes_poll_tally',
+        'votes',
+        ['poll_id', 'is_deleted', 'option_id', 'weight'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_votes_poll_tally', table_name='votes')
@@ -4,6 +4,7 @@ from backend.models.activity_log import ActivityLog
 from backend.models.comment import Comment
 from backend.models.comment_reaction import CommentReaction, ReactionType
 from backend.models.delegation import Delegation, DelegationMode
+from backend.models.delegation_resolution import DelegationResolution
 from backend.models.field import Field
 from backend.models.idea import Idea
 from backend.models.institution import Institution, InstitutionKind
@@ -11,6 +12,7 @@ from backend.models.label import Label
 from backend.models.option import Option
 from backend.models.poll import Poll
 from backend.models.poll_label import poll_labels
+from backend.models.poll_result_snapshot import PollResultSnapshot
 from backend.models.user import User
 from backend.models.value import Value
 from backend.models.vote import Vote
@@ -22,6 +24,7 @@ __all__ = [
     "Vote",
     "Delegation",
     "DelegationMode",
+    "DelegationResolution",
     "Field",
     "Institution",
     "InstitutionKind",
@@ -31,6 +34,7 @@ __all__ = [
     "ReactionType",
     "Label",
     "poll_labels",
+    "PollResultSnapshot",
     "Value",
     "Idea",
 ]
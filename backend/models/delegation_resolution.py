@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+
+from backend.core.types import GUID
+from backend.models.base import SQLAlchemyBase
+
+
+class DelegationResolution(SQLAlchemyBase):
+    """Materialized end of a user's delegation chain within one scope.
+
+    Only users with at least one active delegation in the scope have a row;
+    everyone else casts their own vote there.
+    """
+
+    __tablename__ = "delegation_resolutions"
+    __table_args__ = (
+        UniqueConstraint("scope_key", "user_id", name="uq_delegation_resolutions_scope_user"),
+        Index("ix_delegation_resolutions_scope_final", "scope_key", "final_delegatee_id"),
+    )
+
+    user_id = Column(
+        GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )  # type: Any
+    scope_key = Column(String(64), nullable=False)  # type: Any  # "global" or "<target>:<id>"
+    final_delegatee_id = Column(
+        GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )  # type: Any
+    chain_length = Column(Integer, nullable=False)  # type: Any
+    path = Column(Text, nullable=False)  # type: Any  # JSON list of user IDs, user first
+    path_hash = Column(String(64), nullable=False)  # type: Any  # SHA-256 of the delegation IDs
+    resolved_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )  # type: Any
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlalchemy import Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.future import select
 from sqlalchemy.orm import Session, relationship
@@ -45,6 +45,11 @@ class Poll(SQLAlchemyBase):
     """Poll model."""
 
     __tablename__ = "polls"
+    __table_args__ = (
+        # Keyset pagination of poll listings, newest first
+        Index("ix_polls_created_at_id", "created_at", "id"),
+        Index("ix_polls_decision_type_created_at_id", "decision_type", "created_at", "id"),
+    )
 
     title = Column(String, nullable=False)  # type: Any
     description = Column(String, nullable=True)  # type: Any
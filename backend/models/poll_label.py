@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table
 from backend.core.types import GUID
 from backend.models.base import Base
 
@@ -8,4 +8,6 @@ poll_labels = Table(
     Base.metadata,
     Column("poll_id", GUID(), ForeignKey("polls.id", ondelete="CASCADE"), primary_key=True),
     Column("label_id", GUID(), ForeignKey("labels.id", ondelete="CASCADE"), primary_key=True),
+    # Label filters probe by label as well as by poll
+    Index("ix_poll_labels_label_id_poll_id", "label_id", "poll_id"),
 )
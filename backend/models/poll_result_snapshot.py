@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Column, DateTime, ForeignKey, LargeBinary, String, UniqueConstraint
+
+from backend.core.types import GUID
+from backend.models.base import SQLAlchemyBase
+
+
+class PollResultSnapshot(SQLAlchemyBase):
+    """Final results of a closed poll, serialized once and served as-is."""
+
+    __tablename__ = "poll_result_snapshots"
+    __table_args__ = (
+        UniqueConstraint("poll_id", name="uq_poll_result_snapshots_poll_id"),
+    )
+
+    poll_id = Column(
+        GUID(), ForeignKey("polls.id", ondelete="CASCADE"), nullable=False
+    )  # type: Any
+    payload = Column(LargeBinary, nullable=False)  # type: Any  # JSON-encoded List[PollResult]
+    etag = Column(String(64), nullable=False)  # type: Any  # SHA-256 of payload
+    computed_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )  # type: Any
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Session, relationship
 from sqlalchemy.sql import func
 
@@ -14,6 +14,10 @@ from backend.models.base import SQLAlchemyBase
 
 class Vote(SQLAlchemyBase):
     __tablename__ = "votes"
+    __table_args__ = (
+        # Covers the per-option direct vote aggregate of poll tallies
+        Index("ix_votes_poll_tally", "poll_id", "is_deleted", "option_id", "weight"),
+    )
 
     user_id = Column(
         GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
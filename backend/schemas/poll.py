@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional, Literal, Annotated, Union
+from typing import Dict, List, Optional, Literal, Annotated, Union
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator, PlainSerializer, field_validator
@@ -113,6 +113,23 @@ class PollResult(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PollResultsBatchRequest(BaseModel):
+    """Schema for a batch poll results request."""
+
+    poll_ids: List[UUID] = Field(..., min_length=1, description="IDs of the polls")
+
+
+class PollResultsBatch(BaseModel):
+    """Schema for the results of several polls."""
+
+    results: Dict[str, List[PollResult]] = Field(
+        default_factory=dict, description="Poll results keyed by poll ID"
+    )
+    not_found: List[UUIDString] = Field(
+        default_factory=list, description="Requested polls that do not exist"
+    )
+
+
 
 
 class Poll(PollBase):
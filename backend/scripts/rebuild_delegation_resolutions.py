@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Rebuild the materialized delegation resolution table.
+
+Delegation writes keep ``delegation_resolutions`` up to date incrementally,
+but delegations that start or end with the passage of time are not writes.
+This recomputes every (scope, user) resolution from the active delegations.
+Intended to run periodically and after enabling the table.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.database import async_session_maker
+from backend.services.delegation import DelegationResolutionStore
+
+
+async def rebuild_delegation_resolutions() -> int:
+    """Rebuild all delegation resolutions and return the number of rows written."""
+    print("🔄 Rebuilding delegation resolutions...")
+
+    async with async_session_maker() as session:
+        written = await DelegationResolutionStore(session).rebuild()
+        await session.commit()
+
+    print(f"✅ Wrote {written} delegation resolutions")
+    return written
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_delegation_resolutions())
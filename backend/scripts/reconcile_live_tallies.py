@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Reconcile live poll tallies with the database.
+
+Recomputes the tally of every open poll from votes and delegations and
+rewrites any Redis live tally that has drifted (e.g. after a missed delta,
+a rolled-back write or a delegation expiring). Intended to run periodically.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.core.redis import close_redis_client
+from backend.database import async_session_maker
+from backend.services.live_tally import LiveTallyService
+
+
+async def reconcile_live_tallies() -> int:
+    """Reconcile all open polls and return the number of corrected tallies."""
+    print("🔄 Reconciling live poll tallies...")
+
+    async with async_session_maker() as session:
+        summary = await LiveTallyService(session).reconcile_open_polls()
+
+    await close_redis_client()
+
+    print(f"✅ Checked {summary['checked']} open polls")
+    if summary["corrected"]:
+        print(f"⚠️  Corrected {summary['corrected']} drifted tallies")
+    return summary["corrected"]
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile_live_tallies())
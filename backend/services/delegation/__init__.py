@@ -8,6 +8,7 @@ from .facade import DelegationService
 from .dispatch import DelegationDispatch, DelegationTarget
 from .cache import DelegationCache
 from .repository import DelegationRepository
+from .resolution_table import DelegationResolutionStore
 from .chain_resolution import ChainResolutionCore
 from .telemetry import DelegationTelemetry
 
@@ -17,6 +18,7 @@ __all__ = [
     "DelegationTarget", 
     "DelegationDispatch",
     "DelegationRepository",
+    "DelegationResolutionStore",
     "DelegationCache",
     "ChainResolutionCore",
     "DelegationTelemetry",
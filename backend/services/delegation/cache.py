@@ -7,12 +7,35 @@ including key generation, cache operations, and invalidation.
 import hashlib
 import json
 import random
-from typing import Any, Dict, List, Optional, Set, Tuple
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
 import redis.asyncio as redis
 
+from backend.config import get_settings
 from backend.models.delegation import Delegation
+from backend.services.delegation.cache_metrics import (
+    CACHE_FAMILIES,
+    get_counter_stats,
+    get_serialization_stats,
+    hll_keys,
+    key_family,
+    observe_serialization,
+    record_cache_event,
+)
+from backend.services.delegation.chain_codec import (
+    ChainRecord,
+    decode_chain,
+    encode_chain,
+    is_encoded_chain,
+)
+from backend.services.delegation.local_cache import (
+    EPOCH_MESSAGE,
+    INVALIDATION_CHANNEL,
+    LocalCacheTier,
+    get_local_cache_tier,
+)
 from backend.services.delegation.telemetry import DelegationTelemetry
 
 # Try to import msgpack, fallback to JSON if not available
@@ -23,17 +46,45 @@ except ImportError:
     MSGPACK_AVAILABLE = False
     msgpack = None
 
+# Tag indexes: sorted sets of cache keys scored by their expiry timestamp
+TAG_PREFIX = "delegation:tag"
+CACHE_FORMATS = ("binary", "msgpack", "json")
+
+# Last epoch this worker saw per scope. Reads version their keys with it and
+# fetch the scope counters in the same MGET to check it, so looking the epoch
+# up costs no round-trip of its own unless it moved in the meantime.
+_EPOCH_HINTS: Dict[str, str] = {}
+_EPOCH_HINTS_MAX_SCOPES = 10_000
+
 
 class DelegationCache:
     """Cache management for delegation chains."""
 
-    def __init__(self, redis_client: redis.Redis, ttl_seconds: int = 600):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        ttl_seconds: int = 600,
+        local_tier: Optional[LocalCacheTier] = None,
+    ):
         self.redis = redis_client
         self.ttl_seconds = ttl_seconds
+        settings = get_settings()
+        # In-process tier in front of Redis (process-wide unless one is given)
+        if local_tier is None and settings.DELEGATION_L1_CACHE_ENABLED:
+            local_tier = get_local_cache_tier()
+        self.local = local_tier
+        # Format every entry is written in; the others are only read as fallbacks
+        self.canonical_format = "msgpack" if MSGPACK_AVAILABLE else "json"
+        self.format_fallback = settings.DELEGATION_CACHE_FORMAT_FALLBACK_ENABLED
+        self.rewrite_on_read = settings.DELEGATION_CACHE_REWRITE_ON_READ
+        # Chains are written as fixed-width binary records when enabled
+        self.binary_chains = settings.DELEGATION_CACHE_BINARY_CHAINS_ENABLED
         # Fast-path cache TTL (shorter for override path)
         self.fast_path_ttl = 90  # 90 seconds
         # Sample rate for telemetry (1%)
         self.telemetry_sample_rate = 0.01
+        # Keys deleted per round-trip when invalidating a tag
+        self.invalidation_batch_size = 500
 
     def _should_sample_telemetry(self) -> bool:
         """Determine if we should sample telemetry for this operation."""
@@ -59,7 +110,7 @@ class DelegationCache:
                 
                 if sample_telemetry and start_time:
                     telemetry_info = {
-                        "serialization_time_ms": int((time.time() - start_time) * 1000),
+                        "serialization_time_ms": round((time.time() - start_time) * 1000, 3),
                         "payload_size_bytes": len(serialized),
                         "format": format_used,
                     }
@@ -76,7 +127,7 @@ class DelegationCache:
             
             if sample_telemetry and start_time:
                 telemetry_info = {
-                    "serialization_time_ms": int((time.time() - start_time) * 1000),
+                    "serialization_time_ms": round((time.time() - start_time) * 1000, 3),
                     "payload_size_bytes": len(serialized),
                     "format": format_used,
                 }
@@ -85,8 +136,26 @@ class DelegationCache:
         except Exception as e:
             raise ValueError(f"Failed to serialize data: {e}")
 
+    def _encode_binary_chain(
+        self, chain: List[Delegation], sample_telemetry: bool = False
+    ) -> Tuple[Optional[bytes], str, Dict[str, Any]]:
+        """Encode a chain as binary records, or return None data if it cannot be."""
+        start_time = time.time()
+        try:
+            serialized = encode_chain(chain)
+        except ValueError:
+            return None, "binary", {}
+        telemetry_info = {}
+        if sample_telemetry:
+            telemetry_info = {
+                "serialization_time_ms": round((time.time() - start_time) * 1000, 3),
+                "payload_size_bytes": len(serialized),
+                "format": "binary",
+            }
+        return serialized, "binary", telemetry_info
+
     def _deserialize_data(self, data: bytes, sample_telemetry: bool = False) -> Tuple[Any, str, Dict[str, Any]]:
-        """Deserialize data, trying msgpack first, then JSON.
+        """Deserialize data: binary chains by their header, else msgpack first, then JSON.
         
         Returns:
             Tuple of (deserialized_data, format_used, telemetry_info)
@@ -98,6 +167,16 @@ class DelegationCache:
             import time
             start_time = time.time()
         
+        if is_encoded_chain(data):
+            deserialized = decode_chain(data)
+            if sample_telemetry and start_time:
+                telemetry_info = {
+                    "deserialization_time_ms": round((time.time() - start_time) * 1000, 3),
+                    "payload_size_bytes": len(data),
+                    "format": "binary",
+                }
+            return deserialized, "binary", telemetry_info
+        
         # Try msgpack first (if available)
         if MSGPACK_AVAILABLE:
             try:
@@ -106,7 +185,7 @@ class DelegationCache:
                 
                 if sample_telemetry and start_time:
                     telemetry_info = {
-                        "deserialization_time_ms": int((time.time() - start_time) * 1000),
+                        "deserialization_time_ms": round((time.time() - start_time) * 1000, 3),
                         "payload_size_bytes": len(data),
                         "format": format_used,
                     }
@@ -123,7 +202,7 @@ class DelegationCache:
             
             if sample_telemetry and start_time:
                 telemetry_info = {
-                    "deserialization_time_ms": int((time.time() - start_time) * 1000),
+                    "deserialization_time_ms": round((time.time() - start_time) * 1000, 3),
                     "payload_size_bytes": len(data),
                     "format": format_used,
                 }
@@ -136,9 +215,85 @@ class DelegationCache:
         """Add format suffix to cache key."""
         return f"{key}:fmt={format_used[:2]}"
 
-    def generate_cache_key(
-        self,
-        user_id: UUID,
+    @staticmethod
+    def _user_tag(user_id: UUID) -> str:
+        """Tag of every cache entry owned by a user."""
+        return f"{TAG_PREFIX}:user:{user_id}"
+
+    @staticmethod
+    def _delegatee_tag(delegatee_id: UUID) -> str:
+        """Tag of every cache entry whose resolution runs through a user.
+
+        A user's outgoing delegations decide every chain that reaches them, so
+        these are the entries to evict when that user's delegations change.
+        """
+        return f"{TAG_PREFIX}:delegatee:{delegatee_id}"
+
+    @staticmethod
+    def _key_owner(cache_key: str) -> str:
+        """User ID embedded in a chain or fast-path cache key."""
+        return cache_key.split(":")[2]
+
+    def _family_ttl(self, family: str) -> int:
+        """TTL entries of a key family are written with."""
+        return self.ttl_seconds if family == "chain" else self.fast_path_ttl
+
+    async def _store(
+        self, key: str, ttl_seconds: int, data: bytes, tags: List[str]
+    ) -> None:
+        """Write a cache entry and register it under its tags in one round-trip."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            self._queue_store(pipe, key, ttl_seconds, data, tags, time.time())
+            await pipe.execute()
+        record_cache_event("l2", key, "sets")
+
+    def _queue_store(
+        self, pipe, key: str, ttl_seconds: int, data: bytes, tags: List[str], now: float
+    ) -> None:
+        """Queue the commands writing an entry and registering it under its tags.
+
+        The key is also added to its family's key-count HyperLogLog, whose
+        window is the family TTL.
+        """
+        expires_at = now + ttl_seconds
+        family = key_family(key)
+        window_seconds = self._family_ttl(family)
+        key_count_hll = hll_keys(family, key.rsplit("fmt=", 1)[-1], window_seconds, now)[0]
+        pipe.setex(key, ttl_seconds, data)
+        for tag in tags:
+            pipe.zadd(tag, {key: expires_at})
+            # Drop members whose entries have expired, keeping tags bounded
+            pipe.zremrangebyscore(tag, "-inf", now)
+            pipe.expire(tag, max(self.ttl_seconds, ttl_seconds))
+        pipe.pfadd(key_count_hll, key)
+        pipe.expire(key_count_hll, 2 * window_seconds)
+
+    async def _invalidate_tags(self, tags: List[str]) -> None:
+        """Delete every cache entry registered under the tags, then the tags."""
+        for tag in tags:
+            while True:
+                members = await self.redis.zrange(
+                    tag, 0, self.invalidation_batch_size - 1, withscores=True
+                )
+                if not members:
+                    break
+                keys = [key for key, _ in members]
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.delete(*keys)
+                    pipe.zrem(tag, *keys)
+                    await pipe.execute()
+                # Members scored in the past had already expired on their own
+                now = time.time()
+                for key, expires_at in members:
+                    if expires_at > now:
+                        record_cache_event(
+                            "l2", key.decode() if isinstance(key, bytes) else key, "evictions"
+                        )
+        if tags:
+            await self.redis.delete(*tags)
+
+    @staticmethod
+    def _scope_hash(
         poll_id: Optional[UUID] = None,
         label_id: Optional[UUID] = None,
         field_id: Optional[UUID] = None,
@@ -146,7 +301,7 @@ class DelegationCache:
         value_id: Optional[UUID] = None,
         idea_id: Optional[UUID] = None,
     ) -> str:
-        """Generate cache key for delegation chain."""
+        """Short hash identifying a delegation scope in cache keys."""
         # Create scope hash for cache key
         scope_parts = []
         if poll_id:
@@ -164,8 +319,105 @@ class DelegationCache:
         else:
             scope_parts.append("global")
 
-        scope_hash = hashlib.md5(":".join(scope_parts).encode()).hexdigest()[:8]
-        return f"delegation:chain:{user_id}:{scope_hash}"
+        return hashlib.md5(":".join(scope_parts).encode()).hexdigest()[:8]
+
+    @staticmethod
+    def _epoch_key(scope_hash: str) -> str:
+        """Counter key of a scope's graph epoch (``all`` for the platform-wide one)."""
+        return f"delegation:epoch:{scope_hash}"
+
+    async def get_scope_epoch(
+        self,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+    ) -> str:
+        """Current graph epoch of a scope, combining the platform and scope counters."""
+        scope_hash = self._scope_hash(poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        if self.local is not None:
+            epoch = self.local.get_epoch(scope_hash)
+            if epoch is not None:
+                return epoch
+        try:
+            platform_epoch, scope_epoch = await self.redis.mget(
+                [self._epoch_key("all"), self._epoch_key(scope_hash)]
+            )
+        except Exception:
+            return "0.0"
+        epoch = f"{int(platform_epoch or 0)}.{int(scope_epoch or 0)}"
+        self._remember_epoch(scope_hash, epoch)
+        return epoch
+
+    async def get_poll_scope_epochs(self, poll_ids: List[UUID]) -> Dict[str, str]:
+        """Current graph epochs of many poll scopes with one MGET, keyed by string poll ID."""
+        scope_hashes = {str(poll_id): self._scope_hash(poll_id=poll_id) for poll_id in poll_ids}
+        epochs: Dict[str, str] = {}
+        if self.local is not None:
+            for poll_key, scope_hash in scope_hashes.items():
+                epoch = self.local.get_epoch(scope_hash)
+                if epoch is not None:
+                    epochs[poll_key] = epoch
+        missing = [poll_key for poll_key in scope_hashes if poll_key not in epochs]
+        if not missing:
+            return epochs
+        try:
+            values = await self.redis.mget(
+                [self._epoch_key("all")]
+                + [self._epoch_key(scope_hashes[poll_key]) for poll_key in missing]
+            )
+        except Exception:
+            return {**epochs, **{poll_key: "0.0" for poll_key in missing}}
+        platform_epoch = int(values[0] or 0)
+        for poll_key, scope_epoch in zip(missing, values[1:]):
+            epochs[poll_key] = f"{platform_epoch}.{int(scope_epoch or 0)}"
+            self._remember_epoch(scope_hashes[poll_key], epochs[poll_key])
+        return epochs
+
+    def _remember_epoch(self, scope_hash: str, epoch: str) -> None:
+        """Keep a scope's epoch in the local tier and as the next read's guess."""
+        if self.local is not None:
+            self.local.set_epoch(scope_hash, epoch)
+        if len(_EPOCH_HINTS) >= _EPOCH_HINTS_MAX_SCOPES:
+            _EPOCH_HINTS.clear()
+        _EPOCH_HINTS[scope_hash] = epoch
+
+    async def bump_scope_epochs(self, scopes: List[Dict[str, Optional[UUID]]]) -> None:
+        """Move scopes to a new graph epoch, orphaning all their cache entries at once.
+
+        Args:
+            scopes: Scope keyword arguments (``{}`` for the global scope)
+        """
+        scope_hashes = {self._scope_hash(**scope) for scope in scopes}
+        if not scope_hashes:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for scope_hash in scope_hashes:
+                    pipe.incr(self._epoch_key(scope_hash))
+                await pipe.execute()
+            await self._broadcast_invalidation(EPOCH_MESSAGE)
+        except Exception:
+            # Log error but don't fail the operation
+            pass
+
+    def generate_cache_key(
+        self,
+        user_id: UUID,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+        epoch: Optional[str] = None,
+    ) -> str:
+        """Generate cache key for delegation chain, versioned by the scope's epoch."""
+        scope_hash = self._scope_hash(poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        key = f"delegation:chain:{user_id}:{scope_hash}"
+        return self._versioned_key(key, epoch) if epoch is not None else key
 
     def generate_fast_path_key(
         self,
@@ -176,72 +428,171 @@ class DelegationCache:
         institution_id: Optional[UUID] = None,
         value_id: Optional[UUID] = None,
         idea_id: Optional[UUID] = None,
+        epoch: Optional[str] = None,
     ) -> str:
-        """Generate fast-path cache key for override resolution."""
-        scope_parts = []
-        if poll_id:
-            scope_parts.append(f"poll:{poll_id}")
-        elif label_id:
-            scope_parts.append(f"label:{label_id}")
-        elif field_id:
-            scope_parts.append(f"field:{field_id}")
-        elif institution_id:
-            scope_parts.append(f"institution:{institution_id}")
-        elif value_id:
-            scope_parts.append(f"value:{value_id}")
-        elif idea_id:
-            scope_parts.append(f"idea:{idea_id}")
+        """Generate fast-path cache key for override resolution, versioned by the scope's epoch."""
+        scope_hash = self._scope_hash(poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        key = f"delegation:fastpath:{user_id}:{scope_hash}"
+        return self._versioned_key(key, epoch) if epoch is not None else key
+
+    @staticmethod
+    def _versioned_key(key: str, epoch: str) -> str:
+        """Key of an entry in the given graph epoch of its scope."""
+        return f"{key}:e{epoch}"
+
+    async def _fast_path_key(
+        self,
+        user_id: UUID,
+        poll_id: Optional[UUID],
+        label_id: Optional[UUID],
+        field_id: Optional[UUID],
+        institution_id: Optional[UUID],
+        value_id: Optional[UUID],
+        idea_id: Optional[UUID],
+        epoch: Optional[str],
+    ) -> str:
+        """Fast-path key in the given epoch, looking the current one up if not given."""
+        if epoch is None:
+            epoch = await self.get_scope_epoch(
+                poll_id, label_id, field_id, institution_id, value_id, idea_id
+            )
+        return self.generate_fast_path_key(
+            user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id, epoch
+        )
+
+    async def _read_entry(self, key: str, operation: str) -> Optional[Any]:
+        """Read an entry from the local tier, then from Redis in one round-trip."""
+        if self.local is not None:
+            value = self.local.get(key)
+            if value is not None:
+                return value
+
+        candidates = self._candidate_keys(key)
+        for candidate, cached_data in zip(candidates, await self.redis.mget(candidates)):
+            if cached_data:
+                record_cache_event("l2", key, "hits")
+                return await self._decode_hit(key, candidate, cached_data, operation)
+
+        record_cache_event("l2", key, "misses")
+        return None
+
+    def _candidate_keys(self, key: str) -> List[str]:
+        """Redis keys an entry may be stored under, canonical format first."""
+        candidates = [self._add_format_suffix(key, self.canonical_format)]
+        if self.binary_chains and key.startswith("delegation:chain:"):
+            candidates.insert(0, self._add_format_suffix(key, "binary"))
+        if self.format_fallback:
+            # Then the other format
+            other_format = "json" if self.canonical_format == "msgpack" else "msgpack"
+            candidates.append(self._add_format_suffix(key, other_format))
+        return candidates
+
+    async def _decode_hit(self, key: str, stored_key: str, cached_data: bytes, operation: str) -> Any:
+        """Decode an entry read from Redis, migrating and remembering it locally."""
+        sample_telemetry = self._should_sample_telemetry()
+        value, format_used, telemetry_info = self._deserialize_data(cached_data, sample_telemetry)
+
+        if sample_telemetry:
+            self._log_cache_telemetry(operation, telemetry_info)
+
+        if format_used not in ("binary", self.canonical_format) and self.rewrite_on_read:
+            await self._rewrite_canonical(key, stored_key, value)
+        self._remember_locally(key, value, len(cached_data))
+        return value
+
+    async def _rewrite_canonical(self, key: str, stored_key: str, value: Any) -> None:
+        """Move an entry found in a fallback format to the canonical key, keeping its TTL."""
+        ttl_seconds = await self.redis.ttl(stored_key)
+        if ttl_seconds <= 0:
+            ttl_seconds = self._family_ttl(key_family(key))
+        serialized_data, format_used, _ = self._serialize_data(value)
+        await self._store(
+            self._add_format_suffix(key, format_used),
+            ttl_seconds,
+            serialized_data,
+            self._entry_tags(key, value),
+        )
+        await self.redis.delete(stored_key)
+
+    def _dependency_user_ids(self, key: str, value: Any) -> List[str]:
+        """Owner of an entry followed by the users its resolution runs through."""
+        user_ids = [self._key_owner(key)]
+        if isinstance(value, dict):
+            # A direct result holds only while its delegatee has no onward delegation
+            user_ids.extend(
+                user_id
+                for user_id in (value.get("delegatee_id"), value.get("final_delegatee_id"))
+                if user_id
+            )
         else:
-            scope_parts.append("global")
+            user_ids.extend(
+                entry.delegatee_id if isinstance(entry, ChainRecord) else entry["delegatee_id"]
+                for entry in value
+            )
+        return list(dict.fromkeys(str(user_id) for user_id in user_ids))
 
-        scope_hash = hashlib.md5(":".join(scope_parts).encode()).hexdigest()[:8]
-        return f"delegation:fastpath:{user_id}:{scope_hash}"
+    def _entry_tags(self, key: str, value: Any) -> List[str]:
+        """Tags an entry is registered under: its owner and its dependencies."""
+        owner, *dependencies = self._dependency_user_ids(key, value)
+        return [
+            self._user_tag(owner),
+            *(self._delegatee_tag(user_id) for user_id in dependencies),
+        ]
+
+    def _remember_locally(self, key: str, value: Any, size: int) -> None:
+        """Keep an entry in the local tier, indexed by the users it depends on."""
+        if self.local is not None:
+            self.local.set(key, value, size, self._dependency_user_ids(key, value))
+
+    async def _broadcast_invalidation(self, message: str) -> None:
+        """Apply an invalidation to the local tier and announce it to other workers."""
+        if self.local is None:
+            return
+        self.local.apply_message(message)
+        await self.redis.publish(INVALIDATION_CHANNEL, message)
 
     async def get_cached_chain(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
         """Get cached delegation chain."""
         try:
-            # Try msgpack format first
-            msgpack_key = self._add_format_suffix(cache_key, "msgpack")
-            cached_data = await self.redis.get(msgpack_key)
-            
-            if cached_data:
-                sample_telemetry = self._should_sample_telemetry()
-                chain_data, format_used, telemetry_info = self._deserialize_data(cached_data, sample_telemetry)
-                
-                if sample_telemetry:
-                    self._log_cache_telemetry("get_cached_chain", telemetry_info)
-                
-                return chain_data
-            
-            # Try JSON format (backward compatibility)
-            json_key = self._add_format_suffix(cache_key, "json")
-            cached_data = await self.redis.get(json_key)
-            
-            if cached_data:
-                sample_telemetry = self._should_sample_telemetry()
-                chain_data, format_used, telemetry_info = self._deserialize_data(cached_data, sample_telemetry)
-                
-                if sample_telemetry:
-                    self._log_cache_telemetry("get_cached_chain", telemetry_info)
-                
-                return chain_data
-            
-            # Try legacy format (no suffix)
-            cached_data = await self.redis.get(cache_key)
-            if cached_data:
-                sample_telemetry = self._should_sample_telemetry()
-                chain_data, format_used, telemetry_info = self._deserialize_data(cached_data, sample_telemetry)
-                
-                if sample_telemetry:
-                    self._log_cache_telemetry("get_cached_chain", telemetry_info)
-                
-                return chain_data
-                
+            return await self._read_entry(cache_key, "get_cached_chain")
         except Exception:
             # Log error but don't fail the operation
             pass
         return None
 
+    async def get_cached_chain_with_ttl(
+        self, cache_key: str
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[float]]:
+        """Get a cached chain with the seconds left before its Redis entry expires.
+
+        The remaining TTL is read in the same round-trip; it is None for local
+        tier hits and for entries found under a fallback key.
+        """
+        try:
+            if self.local is not None:
+                value = self.local.get(cache_key)
+                if value is not None:
+                    return value, None
+
+            candidates = self._candidate_keys(cache_key)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.mget(candidates)
+                pipe.pttl(candidates[0])
+                stored, remaining_ms = await pipe.execute()
+
+            for candidate, cached_data in zip(candidates, stored):
+                if cached_data:
+                    record_cache_event("l2", cache_key, "hits")
+                    value = await self._decode_hit(cache_key, candidate, cached_data, "get_cached_chain")
+                    if candidate != candidates[0] or remaining_ms <= 0:
+                        return value, None
+                    return value, remaining_ms / 1000
+            record_cache_event("l2", cache_key, "misses")
+        except Exception:
+            # Log error but don't fail the operation
+            pass
+        return None, None
+
     async def get_fast_path_result(
         self,
         user_id: UUID,
@@ -251,55 +602,166 @@ class DelegationCache:
         institution_id: Optional[UUID] = None,
         value_id: Optional[UUID] = None,
         idea_id: Optional[UUID] = None,
+        epoch: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """Get fast-path override result."""
         try:
+            if epoch is None:
+                _, result = await self.lookup_fast_path_result(
+                    user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+                )
+                return result
             fast_path_key = self.generate_fast_path_key(
-                user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+                user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id, epoch
             )
-            
-            # Try msgpack format first
-            msgpack_key = self._add_format_suffix(fast_path_key, "msgpack")
-            cached_data = await self.redis.get(msgpack_key)
-            
-            if cached_data:
-                sample_telemetry = self._should_sample_telemetry()
-                result, format_used, telemetry_info = self._deserialize_data(cached_data, sample_telemetry)
-                
-                if sample_telemetry:
-                    self._log_cache_telemetry("get_fast_path_result", telemetry_info)
-                
-                return result
-            
-            # Try JSON format (backward compatibility)
-            json_key = self._add_format_suffix(fast_path_key, "json")
-            cached_data = await self.redis.get(json_key)
-            
-            if cached_data:
-                sample_telemetry = self._should_sample_telemetry()
-                result, format_used, telemetry_info = self._deserialize_data(cached_data, sample_telemetry)
-                
-                if sample_telemetry:
-                    self._log_cache_telemetry("get_fast_path_result", telemetry_info)
-                
-                return result
-            
-            # Try legacy format (no suffix)
-            cached_data = await self.redis.get(fast_path_key)
-            if cached_data:
-                sample_telemetry = self._should_sample_telemetry()
-                result, format_used, telemetry_info = self._deserialize_data(cached_data, sample_telemetry)
-                
-                if sample_telemetry:
-                    self._log_cache_telemetry("get_fast_path_result", telemetry_info)
-                
-                return result
-                
+            return await self._read_entry(fast_path_key, "get_fast_path_result")
         except Exception:
             # Log error but don't fail the operation
             pass
         return None
 
+    async def lookup_fast_path_result(
+        self,
+        user_id: UUID,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Get a fast-path result along with the scope's current epoch.
+
+        Returns:
+            Tuple of (scope epoch, fast-path result or None)
+        """
+        scope_hash = self._scope_hash(poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        key = self.generate_fast_path_key(
+            user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+        )
+        epochs, results, _ = await self._lookup_in_current_epochs(
+            [(scope_hash, key)], "get_fast_path_result"
+        )
+        return epochs[scope_hash], results[key]
+
+    async def lookup_scope_chains(
+        self,
+        user_ids: List[UUID],
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+    ) -> Tuple[str, Dict[str, Optional[List[Dict[str, Any]]]]]:
+        """Get the cached chains of many users under one scope, with its current epoch.
+
+        Returns:
+            Tuple of (scope epoch, chain data or None per string user ID)
+        """
+        scope_hash = self._scope_hash(poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        keys = {
+            str(user_id): self.generate_cache_key(
+                user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+            )
+            for user_id in user_ids
+        }
+        epochs, results, _ = await self._lookup_in_current_epochs(
+            [(scope_hash, key) for key in keys.values()], "batch_get_cached_chains"
+        )
+        return epochs[scope_hash], {user_key: results[key] for user_key, key in keys.items()}
+
+    async def lookup_poll_chains(
+        self, user_id: UUID, poll_ids: List[UUID]
+    ) -> Tuple[Dict[str, str], Dict[str, Optional[List[Dict[str, Any]]]]]:
+        """Get one user's cached chains in many poll scopes, with their current epochs.
+
+        Returns:
+            Tuple of (epoch per string poll ID, chain data or None per string poll ID)
+        """
+        entries = {
+            str(poll_id): (
+                self._scope_hash(poll_id=poll_id),
+                self.generate_cache_key(user_id, poll_id),
+            )
+            for poll_id in poll_ids
+        }
+        epochs, results, _ = await self._lookup_in_current_epochs(
+            list(entries.values()), "batch_get_cached_chains"
+        )
+        return (
+            {poll_key: epochs[scope_hash] for poll_key, (scope_hash, _) in entries.items()},
+            {poll_key: results[key] for poll_key, (_, key) in entries.items()},
+        )
+
+    async def _lookup_in_current_epochs(
+        self, entries: List[Tuple[str, str]], operation: str
+    ) -> Tuple[Dict[str, str], Dict[str, Optional[Any]], Dict[str, str]]:
+        """Read entries under their scopes' current epochs, fetching the epochs alongside.
+
+        Epochs held by the local tier are used as they are. The others are
+        guessed from the last epoch seen and checked against the scope
+        counters fetched in the same MGET as the entries; only entries read
+        under a stale guess are fetched again.
+
+        Args:
+            entries: (scope hash, unversioned key) pairs
+
+        Returns:
+            Tuple of (epoch per scope hash, value or None per unversioned key,
+            outcome per unversioned key: "l1", "l2" or "miss")
+        """
+        epochs: Dict[str, str] = {}
+        scope_hashes = list(dict.fromkeys(scope_hash for scope_hash, _ in entries))
+        if self.local is not None:
+            for scope_hash in scope_hashes:
+                epoch = self.local.get_epoch(scope_hash)
+                if epoch is not None:
+                    epochs[scope_hash] = epoch
+        guesses = {
+            scope_hash: _EPOCH_HINTS.get(scope_hash, "0.0")
+            for scope_hash in scope_hashes
+            if scope_hash not in epochs
+        }
+        counter_keys = (
+            [self._epoch_key("all")] + [self._epoch_key(scope_hash) for scope_hash in guesses]
+            if guesses
+            else []
+        )
+
+        versioned = {
+            key: self._versioned_key(key, epochs.get(scope_hash) or guesses[scope_hash])
+            for scope_hash, key in entries
+        }
+        results, outcomes, counters = await self._lookup(
+            list(versioned.values()), operation, counter_keys
+        )
+        if counters is None:
+            # Redis is unreachable: every entry missed, keep the guesses
+            epochs.update(guesses)
+        elif guesses:
+            platform_epoch = int(counters[0] or 0)
+            for scope_hash, scope_epoch in zip(guesses, counters[1:]):
+                epochs[scope_hash] = f"{platform_epoch}.{int(scope_epoch or 0)}"
+                self._remember_epoch(scope_hash, epochs[scope_hash])
+
+        stale = {
+            key: self._versioned_key(key, epochs[scope_hash])
+            for scope_hash, key in entries
+            if epochs[scope_hash] != guesses.get(scope_hash, epochs[scope_hash])
+        }
+        if stale:
+            versioned.update(stale)
+            retried, retried_outcomes, _ = await self._lookup(list(stale.values()), operation)
+            results.update(retried)
+            outcomes.update(retried_outcomes)
+
+        return (
+            epochs,
+            {key: results[versioned_key] for key, versioned_key in versioned.items()},
+            {key: outcomes[versioned_key] for key, versioned_key in versioned.items()},
+        )
+
     async def cache_fast_path_result(
         self,
         user_id: UUID,
@@ -310,11 +772,12 @@ class DelegationCache:
         institution_id: Optional[UUID] = None,
         value_id: Optional[UUID] = None,
         idea_id: Optional[UUID] = None,
+        epoch: Optional[str] = None,
     ) -> None:
         """Cache fast-path override result."""
         try:
-            fast_path_key = self.generate_fast_path_key(
-                user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+            fast_path_key = await self._fast_path_key(
+                user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id, epoch
             )
             
             # Use msgpack serialization with telemetry sampling
@@ -323,7 +786,9 @@ class DelegationCache:
             
             # Store with format suffix
             formatted_key = self._add_format_suffix(fast_path_key, format_used)
-            await self.redis.setex(formatted_key, self.fast_path_ttl, serialized_data)
+            tags = self._entry_tags(fast_path_key, result)
+            await self._store(formatted_key, self.fast_path_ttl, serialized_data, tags)
+            self._remember_locally(fast_path_key, result, len(serialized_data))
             
             if sample_telemetry:
                 self._log_cache_telemetry("cache_fast_path_result", telemetry_info)
@@ -335,96 +800,171 @@ class DelegationCache:
     async def batch_get_cached_chains(
         self, cache_keys: List[str]
     ) -> Dict[str, Optional[List[Dict[str, Any]]]]:
-        """Batch get multiple cached chains using mget."""
+        """Batch get multiple cached chains in one round-trip."""
+        results, _ = await self.batch_lookup_cached_chains(cache_keys)
+        return results
+
+    async def batch_lookup_cached_chains(
+        self, cache_keys: List[str]
+    ) -> Tuple[Dict[str, Optional[List[Dict[str, Any]]]], Dict[str, str]]:
+        """Batch get cached chains, reporting where each key was found.
+
+        Keys are looked up in the local tier, then every stored format of the
+        remaining keys is fetched with a single MGET.
+
+        Returns:
+            Tuple of (chain data or None per key, outcome per key: "l1", "l2" or "miss")
+        """
         if not cache_keys:
-            return {}
+            return {}, {}
 
-        try:
-            # Use mget for batch retrieval
-            cached_data_list = await self.redis.mget(cache_keys)
-            results = {}
+        start_time = time.time()
+        results, outcomes, _ = await self._lookup(cache_keys, "batch_get_cached_chains")
+        DelegationTelemetry.log_batch_cache_lookup(outcomes, time.time() - start_time)
+        return results, outcomes
+
+    async def _lookup(
+        self, cache_keys: List[str], operation: str, extra_keys: Sequence[str] = ()
+    ) -> Tuple[Dict[str, Optional[Any]], Dict[str, str], Optional[List[Any]]]:
+        """Look entries up in the local tier, then every stored format in one MGET.
+
+        ``extra_keys`` are plain Redis keys fetched in the same MGET.
 
-            for i, cached_data in enumerate(cached_data_list):
-                cache_key = cache_keys[i]
+        Returns:
+            Tuple of (value or None per key, outcome per key, values of
+            ``extra_keys`` or None if Redis could not be read)
+        """
+        results: Dict[str, Optional[Any]] = {}
+        outcomes: Dict[str, str] = {}
+        remaining = []
+        for cache_key in dict.fromkeys(cache_keys):
+            value = self.local.get(cache_key) if self.local is not None else None
+            if value is not None:
+                results[cache_key], outcomes[cache_key] = value, "l1"
+            else:
+                remaining.append(cache_key)
+
+        candidates = [self._candidate_keys(cache_key) for cache_key in remaining]
+        cached_data_list = []
+        extra_values: Optional[List[Any]] = []
+        if remaining or extra_keys:
+            try:
+                values = await self.redis.mget(
+                    list(extra_keys)
+                    + [candidate for key_candidates in candidates for candidate in key_candidates]
+                )
+                extra_values = values[:len(extra_keys)]
+                cached_data_list = values[len(extra_keys):]
+            except Exception:
+                # Log error but don't fail the operation: report misses
+                extra_values = None
+
+        position = 0
+        for cache_key, key_candidates in zip(remaining, candidates):
+            stored = cached_data_list[position:position + len(key_candidates)]
+            position += len(key_candidates)
+            results[cache_key], outcomes[cache_key] = None, "miss"
+            for candidate, cached_data in zip(key_candidates, stored):
                 if cached_data:
                     try:
-                        chain_data = json.loads(cached_data)
-                        results[cache_key] = chain_data
-                    except json.JSONDecodeError:
-                        results[cache_key] = None
-                else:
-                    results[cache_key] = None
-
-            return results
-        except Exception:
-            # Fallback to individual gets if mget fails
-            results = {}
-            for cache_key in cache_keys:
-                results[cache_key] = await self.get_cached_chain(cache_key)
-            return results
+                        results[cache_key] = await self._decode_hit(
+                            cache_key, candidate, cached_data, operation
+                        )
+                        outcomes[cache_key] = "l2"
+                    except Exception:
+                        pass
+                    break
+            record_cache_event("l2", cache_key, "hits" if outcomes[cache_key] == "l2" else "misses")
+
+        return results, outcomes, extra_values
+
+    def _encode_chain_entry(
+        self, chain: List[Delegation], sample_telemetry: bool = False
+    ) -> Tuple[bytes, str, Dict[str, Any], List[Dict[str, Any]]]:
+        """Encode a chain for the cache.
+
+        Returns:
+            Tuple of (serialized_data, format_used, telemetry_info, chain_data)
+        """
+        # Serialize chain to JSON-serializable format
+        chain_data = []
+        for delegation in chain:
+            chain_data.append(
+                {
+                    "id": str(delegation.id),
+                    "delegator_id": str(delegation.delegator_id),
+                    "delegatee_id": str(delegation.delegatee_id),
+                    "mode": delegation.mode,
+                    "poll_id": (
+                        str(delegation.poll_id) if delegation.poll_id else None
+                    ),
+                    "label_id": (
+                        str(delegation.label_id) if delegation.label_id else None
+                    ),
+                    "field_id": (
+                        str(delegation.field_id) if delegation.field_id else None
+                    ),
+                    "institution_id": (
+                        str(delegation.institution_id)
+                        if delegation.institution_id
+                        else None
+                    ),
+                    "value_id": (
+                        str(delegation.value_id) if delegation.value_id else None
+                    ),
+                    "idea_id": (
+                        str(delegation.idea_id) if delegation.idea_id else None
+                    ),
+                    "start_date": (
+                        delegation.start_date.isoformat()
+                        if delegation.start_date
+                        else None
+                    ),
+                    "end_date": (
+                        delegation.end_date.isoformat()
+                        if delegation.end_date
+                        else None
+                    ),
+                    "legacy_term_ends_at": (
+                        delegation.legacy_term_ends_at.isoformat()
+                        if delegation.legacy_term_ends_at
+                        else None
+                    ),
+                    "created_at": (
+                        delegation.created_at.isoformat()
+                        if delegation.created_at
+                        else None
+                    ),
+                }
+            )
+
+        # Use binary records when enabled and representable, else msgpack/JSON
+        serialized_data = None
+        if self.binary_chains:
+            serialized_data, format_used, telemetry_info = self._encode_binary_chain(
+                chain, sample_telemetry
+            )
+        if serialized_data is None:
+            serialized_data, format_used, telemetry_info = self._serialize_data(chain_data, sample_telemetry)
+        return serialized_data, format_used, telemetry_info, chain_data
 
     async def cache_chain(self, cache_key: str, chain: List[Delegation]) -> None:
         """Cache delegation chain with TTL."""
         try:
-            # Serialize chain to JSON-serializable format
-            chain_data = []
-            for delegation in chain:
-                chain_data.append(
-                    {
-                        "id": str(delegation.id),
-                        "delegator_id": str(delegation.delegator_id),
-                        "delegatee_id": str(delegation.delegatee_id),
-                        "mode": delegation.mode,
-                        "poll_id": (
-                            str(delegation.poll_id) if delegation.poll_id else None
-                        ),
-                        "label_id": (
-                            str(delegation.label_id) if delegation.label_id else None
-                        ),
-                        "field_id": (
-                            str(delegation.field_id) if delegation.field_id else None
-                        ),
-                        "institution_id": (
-                            str(delegation.institution_id)
-                            if delegation.institution_id
-                            else None
-                        ),
-                        "value_id": (
-                            str(delegation.value_id) if delegation.value_id else None
-                        ),
-                        "idea_id": (
-                            str(delegation.idea_id) if delegation.idea_id else None
-                        ),
-                        "start_date": (
-                            delegation.start_date.isoformat()
-                            if delegation.start_date
-                            else None
-                        ),
-                        "end_date": (
-                            delegation.end_date.isoformat()
-                            if delegation.end_date
-                            else None
-                        ),
-                        "legacy_term_ends_at": (
-                            delegation.legacy_term_ends_at.isoformat()
-                            if delegation.legacy_term_ends_at
-                            else None
-                        ),
-                        "created_at": (
-                            delegation.created_at.isoformat()
-                            if delegation.created_at
-                            else None
-                        ),
-                    }
-                )
-
-            # Use msgpack serialization with telemetry sampling
             sample_telemetry = self._should_sample_telemetry()
-            serialized_data, format_used, telemetry_info = self._serialize_data(chain_data, sample_telemetry)
+            serialized_data, format_used, telemetry_info, chain_data = self._encode_chain_entry(
+                chain, sample_telemetry
+            )
             
             # Store with format suffix
             formatted_key = self._add_format_suffix(cache_key, format_used)
-            await self.redis.setex(formatted_key, self.ttl_seconds, serialized_data)
+            tags = self._entry_tags(cache_key, chain_data)
+            await self._store(formatted_key, self.ttl_seconds, serialized_data, tags)
+            self._remember_locally(
+                cache_key,
+                decode_chain(serialized_data) if format_used == "binary" else chain_data,
+                len(serialized_data),
+            )
             
             if sample_telemetry:
                 self._log_cache_telemetry("cache_chain", telemetry_info)
@@ -433,49 +973,74 @@ class DelegationCache:
             # Log error but don't fail the operation
             pass
 
+    async def cache_entries_batch(
+        self,
+        chains: Dict[str, List[Delegation]],
+        fast_path_results: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        """Cache many chains and fast-path results in one pipelined round-trip.
+
+        Keys are full (epoch-versioned) chain and fast-path cache keys. The
+        entries are not kept in this process's local tier, as whichever
+        worker next reads them may be another one.
+        """
+        try:
+            now = time.time()
+            written = []
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for cache_key, chain in chains.items():
+                    serialized_data, format_used, _, chain_data = self._encode_chain_entry(chain)
+                    formatted_key = self._add_format_suffix(cache_key, format_used)
+                    self._queue_store(
+                        pipe, formatted_key, self.ttl_seconds, serialized_data,
+                        self._entry_tags(cache_key, chain_data), now,
+                    )
+                    written.append(formatted_key)
+                for fast_path_key, result in (fast_path_results or {}).items():
+                    serialized_data, format_used, _ = self._serialize_data(result)
+                    formatted_key = self._add_format_suffix(fast_path_key, format_used)
+                    self._queue_store(
+                        pipe, formatted_key, self.fast_path_ttl, serialized_data,
+                        self._entry_tags(fast_path_key, result), now,
+                    )
+                    written.append(formatted_key)
+                await pipe.execute()
+            for formatted_key in written:
+                record_cache_event("l2", formatted_key, "sets")
+        except Exception:
+            # Log error but don't fail the operation
+            pass
+
     async def invalidate_user_cache(self, user_id: UUID) -> None:
-        """Invalidate all chain cache entries for a user."""
+        """Invalidate all chain and fast-path cache entries for a user."""
         try:
-            # Invalidate both chain cache and fast-path cache with format suffixes
-            patterns = [
-                f"delegation:chain:{user_id}:*fmt=*",
-                f"delegation:fastpath:{user_id}:*fmt=*",
-                # Also invalidate legacy format (no suffix) for backward compatibility
-                f"delegation:chain:{user_id}:*",
-                f"delegation:fastpath:{user_id}:*",
-            ]
-
-            for pattern in patterns:
-                keys = await self.redis.keys(pattern)
-                if keys:
-                    await self.redis.delete(*keys)
+            await self._invalidate_tags([self._user_tag(user_id)])
+            await self._broadcast_invalidation(f"user:{user_id}")
         except Exception:
             # Log error but don't fail the operation
             pass
 
     async def invalidate_all_chain_cache(self) -> None:
-        """Invalidate all chain cache entries (use sparingly)."""
+        """Invalidate all chain and fast-path cache entries (use sparingly).
+
+        Bumps the platform-wide epoch, so every key in use changes in one INCR;
+        the orphaned entries age out by TTL.
+        """
         try:
-            patterns = [
-                f"delegation:chain:*fmt=*", 
-                f"delegation:fastpath:*fmt=*",
-                # Also invalidate legacy format (no suffix) for backward compatibility
-                f"delegation:chain:*", 
-                f"delegation:fastpath:*"
-            ]
-
-            for pattern in patterns:
-                keys = await self.redis.keys(pattern)
-                if keys:
-                    await self.redis.delete(*keys)
+            await self.redis.incr(self._epoch_key("all"))
+            await self._broadcast_invalidation(EPOCH_MESSAGE)
         except Exception:
             # Log error but don't fail the operation
             pass
 
     async def invalidate_delegatee_cache(self, delegatee_id: UUID) -> None:
-        """Invalidate chain cache entries that might be affected by delegatee changes."""
-        # This is a broader invalidation - could be optimized with more specific patterns
-        await self.invalidate_all_chain_cache()
+        """Invalidate the chain and fast-path entries whose resolution runs through a user."""
+        try:
+            await self._invalidate_tags([self._delegatee_tag(delegatee_id)])
+            await self._broadcast_invalidation(f"user:{delegatee_id}")
+        except Exception:
+            # Log error but don't fail the operation
+            pass
 
     async def invalidate_fast_path_cache(
         self,
@@ -486,11 +1051,12 @@ class DelegationCache:
         institution_id: Optional[UUID] = None,
         value_id: Optional[UUID] = None,
         idea_id: Optional[UUID] = None,
+        epoch: Optional[str] = None,
     ) -> None:
         """Invalidate fast-path cache for a specific user and scope."""
         try:
-            fast_path_key = self.generate_fast_path_key(
-                user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+            fast_path_key = await self._fast_path_key(
+                user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id, epoch
             )
             
             # Invalidate both msgpack and JSON formats
@@ -498,43 +1064,36 @@ class DelegationCache:
             json_key = self._add_format_suffix(fast_path_key, "json")
             
             await self.redis.delete(msgpack_key, json_key, fast_path_key)
+            await self._broadcast_invalidation(f"user:{user_id}")
         except Exception:
             # Log error but don't fail the operation
             pass
 
     async def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics without scanning the keyspace.
+
+        Key counts are HyperLogLog estimates of the distinct keys written per
+        family and format within the last one to two family TTLs; tier
+        counters and serialization histograms cover this process.
+        """
         try:
-            # Count different formats
-            msgpack_chain_pattern = "delegation:chain:*fmt=ms"
-            json_chain_pattern = "delegation:chain:*fmt=js"
-            legacy_chain_pattern = "delegation:chain:*"
-            
-            msgpack_fast_pattern = "delegation:fastpath:*fmt=ms"
-            json_fast_pattern = "delegation:fastpath:*fmt=js"
-            legacy_fast_pattern = "delegation:fastpath:*"
+            now = time.time()
+            pairs = [(family, format_used) for family in CACHE_FAMILIES for format_used in CACHE_FORMATS]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for family, format_used in pairs:
+                    pipe.pfcount(*hll_keys(family, format_used, self._family_ttl(family), now))
+                estimates = await pipe.execute()
 
-            msgpack_chain_keys = await self.redis.keys(msgpack_chain_pattern)
-            json_chain_keys = await self.redis.keys(json_chain_pattern)
-            legacy_chain_keys = await self.redis.keys(legacy_chain_pattern)
-            
-            msgpack_fast_keys = await self.redis.keys(msgpack_fast_pattern)
-            json_fast_keys = await self.redis.keys(json_fast_pattern)
-            legacy_fast_keys = await self.redis.keys(legacy_fast_pattern)
-
-            chain_stats = {
-                "msgpack": len(msgpack_chain_keys),
-                "json": len(json_chain_keys),
-                "legacy": len(legacy_chain_keys),
-                "total": len(msgpack_chain_keys) + len(json_chain_keys) + len(legacy_chain_keys),
-            }
-            
-            fast_path_stats = {
-                "msgpack": len(msgpack_fast_keys),
-                "json": len(json_fast_keys),
-                "legacy": len(legacy_fast_keys),
-                "total": len(msgpack_fast_keys) + len(json_fast_keys) + len(legacy_fast_keys),
-            }
+            # Unsuffixed legacy keys are no longer written and have long expired
+            counts = {family: {"legacy": 0} for family in CACHE_FAMILIES}
+            for (family, format_used), estimate in zip(pairs, estimates):
+                counts[family][format_used] = estimate
+            for family in CACHE_FAMILIES:
+                counts[family]["total"] = sum(
+                    counts[family][format_used] for format_used in CACHE_FORMATS
+                )
+            chain_stats = counts["chain"]
+            fast_path_stats = counts["fastpath"]
             
             # Log format statistics using telemetry
             DelegationTelemetry.log_cache_format_stats(
@@ -547,6 +1106,8 @@ class DelegationCache:
             return {
                 "chain_keys": chain_stats,
                 "fast_path_keys": fast_path_stats,
+                "tiers": self.get_tier_stats(),
+                "serialization": get_serialization_stats(),
                 "msgpack_available": MSGPACK_AVAILABLE,
                 "telemetry_sample_rate": self.telemetry_sample_rate,
             }
@@ -554,15 +1115,37 @@ class DelegationCache:
             return {
                 "chain_keys": {"total": 0},
                 "fast_path_keys": {"total": 0},
+                "tiers": self.get_tier_stats(),
+                "serialization": get_serialization_stats(),
                 "msgpack_available": MSGPACK_AVAILABLE,
                 "telemetry_sample_rate": self.telemetry_sample_rate,
             }
 
+    def get_tier_stats(self) -> Dict[str, Any]:
+        """Hit, miss, set and eviction counters per family of the local (L1) and Redis (L2) tiers.
+
+        Counters cover this process; evictions are entries dropped before
+        their TTL ran out, by LRU pressure or invalidation.
+        """
+        counters = get_counter_stats()
+        l1_stats = {"enabled": self.local is not None, "families": counters["l1"]}
+        if self.local is not None:
+            l1_stats.update(self.local.stats())
+        return {
+            "l1": l1_stats,
+            "l2": {"families": counters["l2"]},
+        }
+
     def _log_cache_telemetry(self, operation: str, telemetry_info: Dict[str, Any]) -> None:
         """Log cache telemetry information."""
         try:
             # Use the new telemetry methods for serialization timing
             if "serialization_time_ms" in telemetry_info:
+                observe_serialization(
+                    operation,
+                    telemetry_info.get("format", "unknown"),
+                    telemetry_info["serialization_time_ms"],
+                )
                 DelegationTelemetry.log_serialization_timing(
                     operation=operation,
                     format_type=telemetry_info.get("format", "unknown"),
@@ -571,6 +1154,11 @@ class DelegationCache:
                     sample_rate=self.telemetry_sample_rate,
                 )
             elif "deserialization_time_ms" in telemetry_info:
+                observe_serialization(
+                    f"{operation}_deserialize",
+                    telemetry_info.get("format", "unknown"),
+                    telemetry_info["deserialization_time_ms"],
+                )
                 DelegationTelemetry.log_serialization_timing(
                     operation=f"{operation}_deserialize",
                     format_type=telemetry_info.get("format", "unknown"),
@@ -0,0 +1,96 @@
+"""Incrementally maintained delegation cache statistics.
+
+Hits, misses, sets and evictions are counted in process memory per cache
+tier ("l1" local, "l2" Redis) and key family ("chain", "fastpath") as they
+happen, and sampled (de)serialization timings are bucketed into
+histograms. Nothing here scans Redis: key counts are estimated from
+HyperLogLogs that writes feed in the same pipeline as the entry itself.
+"""
+
+import bisect
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+CACHE_TIERS = ("l1", "l2")
+CACHE_FAMILIES = ("chain", "fastpath")
+CACHE_EVENTS = ("hits", "misses", "sets", "evictions")
+
+# Upper bounds of the serialization time histogram buckets, in milliseconds
+SERIALIZATION_BUCKETS_MS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0)
+
+# Key-count estimates: one HyperLogLog per family, format and time window
+HLL_PREFIX = "delegation:hll"
+
+# Events per (tier, family, event) in this process
+CACHE_COUNTERS: Counter = Counter()
+
+# (count, total ms, per-bucket counts) per (operation, format) in this process
+_serialization_histograms: Dict[Tuple[str, str], List[Any]] = {}
+
+
+def key_family(cache_key: str) -> str:
+    """Family of a delegation cache key (``delegation:<family>:...``)."""
+    parts = cache_key.split(":", 2)
+    return parts[1] if len(parts) > 2 and parts[0] == "delegation" else "other"
+
+
+def record_cache_event(tier: str, cache_key: str, event: str, count: int = 1) -> None:
+    """Count a hit, miss, set or eviction of a cache key in a tier."""
+    CACHE_COUNTERS[(tier, key_family(cache_key), event)] += count
+
+
+def observe_serialization(operation: str, format_type: str, elapsed_ms: float) -> None:
+    """Add a (de)serialization timing to its operation and format histogram."""
+    histogram = _serialization_histograms.get((operation, format_type))
+    if histogram is None:
+        histogram = [0, 0.0, [0] * (len(SERIALIZATION_BUCKETS_MS) + 1)]
+        _serialization_histograms[(operation, format_type)] = histogram
+    histogram[0] += 1
+    histogram[1] += elapsed_ms
+    histogram[2][bisect.bisect_left(SERIALIZATION_BUCKETS_MS, elapsed_ms)] += 1
+
+
+def hll_keys(family: str, format_used: str, window_seconds: int, now: Optional[float] = None) -> List[str]:
+    """HyperLogLogs of keys written in the current and the previous window.
+
+    The first one is the key writes are added to; counting both covers every
+    entry written within the last ``window_seconds`` at least.
+    """
+    window = int((time.time() if now is None else now) // window_seconds)
+    return [f"{HLL_PREFIX}:{family}:{format_used[:2]}:{window - offset}" for offset in (0, 1)]
+
+
+def get_counter_stats() -> Dict[str, Any]:
+    """Counters per tier and family, with hit ratios."""
+    families = list(dict.fromkeys([*CACHE_FAMILIES, *(family for _, family, _ in CACHE_COUNTERS)]))
+    stats: Dict[str, Any] = {}
+    for tier in CACHE_TIERS:
+        stats[tier] = {}
+        for family in families:
+            counters = {event: CACHE_COUNTERS[(tier, family, event)] for event in CACHE_EVENTS}
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_ratio"] = counters["hits"] / lookups if lookups else None
+            stats[tier][family] = counters
+    return stats
+
+
+def get_serialization_stats() -> Dict[str, Any]:
+    """Serialization time histograms keyed by ``<operation>:<format>``."""
+    bounds = [str(bound) for bound in SERIALIZATION_BUCKETS_MS] + ["+inf"]
+    return {
+        f"{operation}:{format_type}": {
+            "count": count,
+            "avg_ms": total_ms / count if count else 0.0,
+            "buckets_ms": dict(zip(bounds, buckets)),
+        }
+        for (operation, format_type), (count, total_ms, buckets) in sorted(
+            _serialization_histograms.items()
+        )
+    }
+
+
+def reset_cache_metrics() -> None:
+    """Clear every counter and histogram of this process."""
+    CACHE_COUNTERS.clear()
+    _serialization_histograms.clear()
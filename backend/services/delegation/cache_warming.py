@@ -0,0 +1,131 @@
+"""Proactive chain cache warming for newly opened polls.
+
+Polls open when they are created: they take votes from then on and no
+later status change activates them, so creation is the only trigger. A
+new poll's first vote-status and results requests would all miss the
+chain cache together. Warming resolves the chains of the poll's likely
+audience ahead of them: users with a global delegation, a delegation on one
+of the poll's labels, or one on the poll itself. Users whose chains are
+already cached under the scope's current epoch (the global scope, warmed
+for every earlier poll) are dropped before batching; the rest are resolved
+with the bulk resolver, which writes them back in one pipeline per batch. While the delegation graph index is
+loaded, misses resolve in memory and the bulk resolver serves chains from
+the index without the cache, so there is nothing to warm.
+
+Warming runs in the background and yields to foreground traffic: batches
+are small, paced by a pause, and one warming runs per process at a time.
+"""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from backend.config import get_settings
+from backend.core.logging_config import get_logger
+from backend.database import async_session_maker
+
+from .facade import DelegationService
+from .graph_index import get_delegation_graph_index
+
+logger = get_logger(__name__)
+
+# One warming at a time per process
+_warming_lock = asyncio.Lock()
+
+
+class ChainCacheWarmer:
+    """Precompute chain and fast-path cache entries for a poll's audience."""
+
+    def __init__(
+        self,
+        delegation_service,
+        batch_size: Optional[int] = None,
+        pause_seconds: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.delegation_service = delegation_service
+        self.repository = delegation_service.repository
+        self.batch_size = batch_size or settings.DELEGATION_CACHE_WARMING_BATCH_SIZE
+        self.pause_seconds = (
+            settings.DELEGATION_CACHE_WARMING_PAUSE_SECONDS if pause_seconds is None else pause_seconds
+        )
+
+    async def warm_poll(self, poll_id: UUID, label_ids: Iterable[UUID] = ()) -> Dict[str, int]:
+        """Warm the poll, label and global scopes for the poll's audience.
+
+        Returns:
+            Dict[str, int]: Users resolved per scope ("poll", "global",
+            "label:<id>"), empty when the graph index serves chain lookups
+        """
+        if get_delegation_graph_index().is_loaded:
+            logger.info(
+                "Skipped delegation chain cache warming: graph index is loaded",
+                extra={"poll_id": str(poll_id)},
+            )
+            return {}
+
+        label_ids = [str(label_id) for label_id in label_ids]
+        audience = {"global": await self.repository.get_scope_delegator_ids()}
+        for label_id in label_ids:
+            audience[f"label:{label_id}"] = await self.repository.get_scope_delegator_ids(
+                label_id=label_id
+            )
+        poll_delegators = await self.repository.get_scope_delegator_ids(poll_id=poll_id)
+        # Vote status reads poll-scoped chains; they are warmed only for users
+        # delegating on this poll or its labels, not for every global delegator
+        audience["poll"] = list(dict.fromkeys(
+            [
+                *poll_delegators,
+                *(user_id for label_id in label_ids for user_id in audience[f"label:{label_id}"]),
+            ]
+        ))
+
+        async with _warming_lock:
+            warmed = {
+                "poll": await self._warm_scope(audience["poll"], poll_id=str(poll_id)),
+                "global": await self._warm_scope(audience["global"]),
+            }
+            for label_id in label_ids:
+                warmed[f"label:{label_id}"] = await self._warm_scope(
+                    audience[f"label:{label_id}"], label_id=label_id
+                )
+
+        logger.info(
+            "Warmed delegation chain cache for poll",
+            extra={"poll_id": str(poll_id), "users_per_scope": warmed},
+        )
+        return warmed
+
+    async def _warm_scope(self, user_ids: List[str], **scope) -> int:
+        """Resolve and cache the uncached chains of one scope in paced batches.
+
+        Returns:
+            int: Number of users whose chains were resolved
+        """
+        missing: List[str] = []
+        for start in range(0, len(user_ids), self.batch_size):
+            _, cached = await self.delegation_service.cache.lookup_scope_chains(
+                user_ids[start:start + self.batch_size], **scope
+            )
+            missing.extend(user_key for user_key, chain in cached.items() if chain is None)
+
+        for start in range(0, len(missing), self.batch_size):
+            if start:
+                await asyncio.sleep(self.pause_seconds)
+            await self.delegation_service.resolve_delegation_chains_bulk(
+                missing[start:start + self.batch_size], cache_results=True, **scope
+            )
+        return len(missing)
+
+
+async def warm_poll_chain_cache(poll_id: UUID, label_ids: Iterable[UUID] = ()) -> None:
+    """Warm the chain cache for a poll in its own session (background task entry point)."""
+    try:
+        async with async_session_maker() as session:
+            await ChainCacheWarmer(DelegationService(session)).warm_poll(poll_id, label_ids)
+    except Exception as e:
+        # Warming is an optimization: the requests it anticipates resolve on their own
+        logger.warning(
+            "Delegation chain cache warming failed",
+            extra={"poll_id": str(poll_id), "error": str(e)},
+        )
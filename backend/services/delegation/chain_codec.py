@@ -0,0 +1,177 @@
+"""Compact binary encoding of cached delegation chains.
+
+A chain is a fixed header followed by one fixed-width record per
+delegation: 16-byte UUIDs, a scope kind byte with the scope's UUID, a mode
+byte and four signed epoch-microsecond timestamps. Decoding copies nothing:
+``ChainRecord`` views a record in the cached buffer and unpacks it once, on
+the first attribute read, exposing the attributes chain consumers read from
+``Delegation``. IDs are strings, as the GUID columns load them.
+"""
+
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, List, Optional
+from uuid import UUID
+
+from backend.models.delegation import DelegationMode
+
+# 0xc1 never starts a msgpack value and is not valid UTF-8, so binary
+# entries cannot be mistaken for the other cache formats
+MAGIC = b"\xc1DC"
+VERSION = 2
+
+_HEADER = struct.Struct("<3sBH")
+_RECORD = struct.Struct("<16s16s16sB16sBqqqq")
+_NO_TIMESTAMP = -(2 ** 63)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_SCOPE_FIELDS = ("poll_id", "label_id", "field_id", "institution_id", "value_id", "idea_id")
+_MODES = tuple(DelegationMode)
+_NO_UUID = bytes(16)
+
+
+def is_encoded_chain(data: bytes) -> bool:
+    return data[:len(MAGIC)] == MAGIC
+
+
+def encode_chain(chain: Iterable[Any]) -> bytes:
+    """Encode delegations (or anything with their attributes) as a binary chain.
+
+    Raises:
+        ValueError: If a delegation cannot be represented (several scope
+            targets or an unknown mode); callers fall back to another format.
+    """
+    records = []
+    for delegation in chain:
+        targets = [
+            (kind, getattr(delegation, name))
+            for kind, name in enumerate(_SCOPE_FIELDS, start=1)
+            if getattr(delegation, name, None) is not None
+        ]
+        if len(targets) > 1:
+            raise ValueError("Delegation has more than one scope target")
+        scope_kind, scope_id = targets[0] if targets else (0, None)
+        try:
+            mode = _MODES.index(DelegationMode(delegation.mode))
+        except ValueError:
+            raise ValueError(f"Unknown delegation mode: {delegation.mode}")
+
+        records.append(
+            _RECORD.pack(
+                _uuid_bytes(delegation.id),
+                _uuid_bytes(delegation.delegator_id),
+                _uuid_bytes(delegation.delegatee_id),
+                scope_kind,
+                _uuid_bytes(scope_id) if scope_id is not None else _NO_UUID,
+                mode,
+                _timestamp(delegation.start_date),
+                _timestamp(getattr(delegation, "end_date", None)),
+                _timestamp(getattr(delegation, "legacy_term_ends_at", None)),
+                _timestamp(getattr(delegation, "created_at", None)),
+            )
+        )
+    return _HEADER.pack(MAGIC, VERSION, len(records)) + b"".join(records)
+
+
+def decode_chain(data: bytes) -> List["ChainRecord"]:
+    """View the records of a binary chain without copying the buffer."""
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Unsupported chain encoding version: {version}")
+    if len(data) != _HEADER.size + count * _RECORD.size:
+        raise ValueError("Truncated chain encoding")
+    buffer = memoryview(data)
+    return [ChainRecord(buffer, _HEADER.size + i * _RECORD.size) for i in range(count)]
+
+
+class ChainRecord:
+    """Read-only view of one encoded delegation, unpacked on first attribute access."""
+
+    __slots__ = ("_buffer", "_offset", "_values")
+
+    # Cached chains only ever hold active delegations
+    revoked_at = None
+    is_deleted = False
+
+    def __init__(self, buffer: memoryview, offset: int):
+        self._buffer = buffer
+        self._offset = offset
+        self._values = None
+
+    def _field(self, index: int):
+        if self._values is None:
+            self._values = _RECORD.unpack_from(self._buffer, self._offset)
+        return self._values[index]
+
+    @property
+    def id(self) -> str:
+        return str(UUID(bytes=self._field(0)))
+
+    @property
+    def delegator_id(self) -> str:
+        return str(UUID(bytes=self._field(1)))
+
+    @property
+    def delegatee_id(self) -> str:
+        return str(UUID(bytes=self._field(2)))
+
+    @property
+    def mode(self) -> DelegationMode:
+        return _MODES[self._field(5)]
+
+    @property
+    def start_date(self) -> Optional[datetime]:
+        return _datetime(self._field(6))
+
+    @property
+    def end_date(self) -> Optional[datetime]:
+        return _datetime(self._field(7))
+
+    @property
+    def legacy_term_ends_at(self) -> Optional[datetime]:
+        return _datetime(self._field(8))
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        return _datetime(self._field(9))
+
+    @property
+    def target_type(self) -> str:
+        scope_kind = self._field(3)
+        return _SCOPE_FIELDS[scope_kind - 1][:-len("_id")] if scope_kind else "global"
+
+    @property
+    def is_legacy_fixed_term(self) -> bool:
+        return self.mode == DelegationMode.LEGACY_FIXED_TERM
+
+    def _scope_id(self, kind: int) -> Optional[str]:
+        if self._field(3) != kind:
+            return None
+        return str(UUID(bytes=self._field(4)))
+
+    poll_id = property(lambda self: self._scope_id(1))
+    label_id = property(lambda self: self._scope_id(2))
+    field_id = property(lambda self: self._scope_id(3))
+    institution_id = property(lambda self: self._scope_id(4))
+    value_id = property(lambda self: self._scope_id(5))
+    idea_id = property(lambda self: self._scope_id(6))
+
+    def __repr__(self) -> str:
+        return f"ChainRecord(id={self.id}, {self.delegator_id} -> {self.delegatee_id})"
+
+
+def _uuid_bytes(value) -> bytes:
+    return (value if isinstance(value, UUID) else UUID(str(value))).bytes
+
+
+def _timestamp(value: Optional[datetime]) -> int:
+    if value is None:
+        return _NO_TIMESTAMP
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _datetime(value: int) -> Optional[datetime]:
+    return None if value == _NO_TIMESTAMP else _EPOCH + value * _MICROSECOND
@@ -10,6 +10,8 @@ from uuid import UUID
 
 from backend.models.delegation import Delegation, DelegationMode
 
+from .chain_codec import ChainRecord
+
 
 class ChainResolutionCore:
     """Pure chain resolution logic with no side effects."""
@@ -42,15 +44,37 @@ class ChainResolutionCore:
         Returns:
             List[Delegation]: Chain of delegations ending at the final delegatee
         """
-        chain = []
-        current_user_id = user_id
-        depth = 0
-
         # Create lookup map for fast delegation access
         delegation_map = ChainResolutionCore._build_delegation_map(
             available_delegations
         )
 
+        return ChainResolutionCore.resolve_chain_from_map(
+            user_id, delegation_map, poll_id, label_id, field_id,
+            institution_id, value_id, idea_id, max_depth
+        )
+
+    @staticmethod
+    def resolve_chain_from_map(
+        user_id: UUID,
+        delegation_map: Dict[UUID, List[Delegation]],
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+        max_depth: int = 10,
+    ) -> List[Delegation]:
+        """Resolve delegation chain from a prebuilt delegator -> delegations map (pure function).
+
+        Each hop is a map lookup, so resolution costs O(chain length) once the
+        map exists (see ``_build_delegation_map`` or the delegation graph index).
+        """
+        chain = []
+        current_user_id = user_id
+        depth = 0
+
         while depth < max_depth:
             # Find active delegation for current user
             delegation = ChainResolutionCore._find_active_delegation(
@@ -375,7 +399,13 @@ class ChainResolutionCore:
 
     @staticmethod
     def deserialize_chain(chain_data: List[Dict[str, Any]]) -> List[Delegation]:
-        """Deserialize cached chain data to Delegation objects."""
+        """Deserialize cached chain data to Delegation objects.
+
+        Binary-encoded chains are already decoded into ``ChainRecord`` views,
+        which carry the same attributes and are returned as they are.
+        """
+        if chain_data and isinstance(chain_data[0], ChainRecord):
+            return list(chain_data)
         chain = []
         for delegation_data in chain_data:
             delegation = Delegation()
@@ -73,6 +73,39 @@ class DelegationDispatch:
             user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id, max_depth
         )
     
+    async def resolve_delegation_chains_bulk(
+        self,
+        user_ids: List[UUID],
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+        max_depth: int = 10,
+        cache_results: bool = False,
+    ) -> Dict[str, List[Delegation]]:
+        """Resolve delegation chains for many users with one query per hop."""
+        return await self.async_dispatch.resolve_delegation_chains_bulk(
+            user_ids, poll_id, label_id, field_id, institution_id, value_id, idea_id, max_depth,
+            cache_results=cache_results,
+        )
+    
+    async def resolve_poll_delegation_chains(
+        self,
+        user_id: UUID,
+        poll_ids: List[UUID],
+        max_depth: int = 10,
+    ) -> Dict[str, List[Delegation]]:
+        """Resolve one user's delegation chain in many poll scopes with one query per hop."""
+        return await self.async_dispatch.resolve_poll_delegation_chains(
+            user_id, poll_ids, max_depth
+        )
+    
+    async def get_delegation_stats(self, poll_id: Optional[UUID] = None) -> Dict[str, Any]:
+        """Calculate exact whole-graph delegation statistics for a scope."""
+        return await self.async_dispatch.get_delegation_stats(poll_id)
+    
     # Delegate to sync dispatch for creation
     async def create_delegation(
         self,
@@ -5,17 +5,22 @@ background tasks or async processing.
 """
 
 import time
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.config import get_settings
 from backend.core.exceptions.delegation import DelegationNotFoundError
 from backend.models.delegation import Delegation
 
 from .chain_resolution import ChainResolutionCore
+from .graph_index import defer_graph_changes, get_delegation_graph_index
+from .resolution_table import refresh_delegation_resolutions
 from .repository import DelegationRepository
+from .stampede import get_chain_stampede_guard
+from .stats_engine import DelegationStatsEngine
 from .cache import DelegationCache
 from .telemetry import DelegationTelemetry
 
@@ -28,6 +33,8 @@ class DelegationAsyncDispatch:
         self.cache = cache
         self.repository = DelegationRepository(db)
         self.stats_cache_ttl = timedelta(minutes=5)
+        self.bulk_chunk_size = 500
+        self.stampede_guard = get_chain_stampede_guard()
         
         # Import here to avoid circular dependency
         from backend.core.background_tasks import StatsCalculationTask
@@ -50,9 +57,10 @@ class DelegationAsyncDispatch:
             user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
         )
         
-        # Early-exit fast path: Check for direct delegation case
+        # Early-exit fast path: Check for direct delegation case. Cache keys are
+        # versioned by the scope's graph epoch, read in the same round-trip
         fast_path_start = time.time()
-        fast_path_result = await self.cache.get_fast_path_result(
+        epoch, fast_path_result = await self.cache.lookup_fast_path_result(
             user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
         )
         fast_path_time = time.time() - fast_path_start
@@ -80,17 +88,26 @@ class DelegationAsyncDispatch:
             user_id, fast_path_time, poll_id, label_id, field_id, institution_id, value_id, idea_id
         )
         
-        # Check if this is a direct delegation case we can cache
-        direct_check_start = time.time()
-        direct_case = await self.repository.check_direct_delegation_case(
-            user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+        graph_index = get_delegation_graph_index()
+        use_recursive_query = (
+            get_settings().DELEGATION_CHAIN_CTE_ENABLED and not graph_index.is_loaded
         )
+
+        # Check if this is a direct delegation case we can cache (the recursive
+        # query answers it in the same round-trip, so skip the extra lookups)
+        direct_check_start = time.time()
+        direct_case = None
+        if not use_recursive_query:
+            direct_case = await self.repository.check_direct_delegation_case(
+                user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+            )
         direct_check_time = time.time() - direct_check_start
         
         if direct_case:
             # This is a direct case - cache it and return
             await self.cache.cache_fast_path_result(
-                user_id, direct_case, poll_id, label_id, field_id, institution_id, value_id, idea_id
+                user_id, direct_case, poll_id, label_id, field_id, institution_id, value_id, idea_id,
+                epoch,
             )
             
             # Create delegation object and return
@@ -112,12 +129,12 @@ class DelegationAsyncDispatch:
         # Try cache first
         cache_start = time.time()
         cache_key = self.cache.generate_cache_key(
-            user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+            user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id, epoch
         )
-        cached_chain_data = await self.cache.get_cached_chain(cache_key)
+        cached_chain_data, remaining_ttl = await self.cache.get_cached_chain_with_ttl(cache_key)
         cache_time = time.time() - cache_start
         
-        if cached_chain_data:
+        if cached_chain_data is not None and not self.stampede_guard.should_refresh_early(remaining_ttl):
             # Cache hit
             deserialize_start = time.time()
             chain = ChainResolutionCore.deserialize_chain(cached_chain_data)
@@ -130,23 +147,19 @@ class DelegationAsyncDispatch:
             )
             return chain
 
-        # Cache miss - resolve chain from database
+        # Cache miss (or early refresh) - resolve once per key across concurrent requests
+        async def resolve_and_cache():
+            chain = await self._resolve_uncached_chain(
+                user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id,
+                max_depth, graph_index, use_recursive_query,
+            )
+            await self.cache.cache_chain(cache_key, chain)
+            return chain
+
         db_start = time.time()
-        all_delegations = await self.repository.get_all_active_delegations()
-        
-        # Use pure chain resolution core
-        chain = ChainResolutionCore.resolve_chain_from_delegations(
-            user_id, all_delegations, poll_id, label_id, field_id,
-            institution_id, value_id, idea_id, max_depth
-        )
-        
+        chain = await self.stampede_guard.run(self.cache, cache_key, resolve_and_cache)
         db_time = time.time() - db_start
 
-        # Cache the resolved chain
-        cache_start = time.time()
-        await self.cache.cache_chain(cache_key, chain)
-        cache_time = time.time() - cache_start
-        
         total_time = time.time() - start_time
         
         DelegationTelemetry.log_cache_miss(
@@ -156,6 +169,238 @@ class DelegationAsyncDispatch:
         
         return chain
     
+    async def _resolve_uncached_chain(
+        self,
+        user_id: UUID,
+        poll_id: Optional[UUID],
+        label_id: Optional[UUID],
+        field_id: Optional[UUID],
+        institution_id: Optional[UUID],
+        value_id: Optional[UUID],
+        idea_id: Optional[UUID],
+        max_depth: int,
+        graph_index,
+        use_recursive_query: bool,
+    ) -> List[Delegation]:
+        """Resolve a chain from the graph index, or the database if not loaded."""
+        if graph_index.is_loaded:
+            await graph_index.sync(self.db, self.cache.redis)
+            return graph_index.resolve_chain(
+                user_id, poll_id, label_id, field_id,
+                institution_id, value_id, idea_id, max_depth
+            )
+        if use_recursive_query:
+            return await self.repository.get_delegation_chain_recursive(
+                user_id, poll_id, label_id, field_id,
+                institution_id, value_id, idea_id, max_depth
+            )
+
+        all_delegations = await self.repository.get_all_active_delegations()
+
+        # Use pure chain resolution core
+        return ChainResolutionCore.resolve_chain_from_delegations(
+            user_id, all_delegations, poll_id, label_id, field_id,
+            institution_id, value_id, idea_id, max_depth
+        )
+
+    async def resolve_delegation_chains_bulk(
+        self,
+        user_ids: List[UUID],
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+        max_depth: int = 10,
+        as_of: Optional[datetime] = None,
+        cache_results: bool = False,
+    ) -> Dict[str, List[Delegation]]:
+        """Resolve the delegation chains of many users under one scope.
+
+        All chains are advanced together, hop by hop: each hop loads the
+        delegations of every chain head with one batch query, so resolving N
+        chains costs O(depth) round-trips instead of O(N x depth). Chains
+        already in the chain cache are read first with one batch lookup.
+        ``as_of`` overrides the database clock for which delegations count as
+        active (e.g. to see a delegation starting in the current transaction)
+        and bypasses the cache. With ``cache_results`` the chains resolved
+        here are written back in one pipeline, along with fast-path entries
+        for single-hop chains. While the graph index is loaded, chains are
+        served from it and neither read from nor written to the cache.
+
+        Returns:
+            Dict[str, List[Delegation]]: Chain per user, keyed by string user ID
+        """
+        scope = [
+            str(value) if value is not None else None
+            for value in (poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        ]
+        user_keys = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+
+        graph_index = get_delegation_graph_index()
+        if graph_index.is_loaded:
+            await graph_index.sync(self.db, self.cache.redis)
+            return {
+                user_key: graph_index.resolve_chain(user_key, *scope, max_depth=max_depth)
+                for user_key in user_keys
+            }
+
+        chains: Dict[str, List[Delegation]] = {}
+        if as_of is None:
+            # Serve the chains already cached with one batch read
+            epoch, cached = await self.cache.lookup_scope_chains(
+                user_keys, poll_id, label_id, field_id, institution_id, value_id, idea_id
+            )
+            cache_keys = {
+                user_key: self.cache.generate_cache_key(
+                    user_key, poll_id, label_id, field_id, institution_id, value_id, idea_id, epoch
+                )
+                for user_key in user_keys
+            }
+            for user_key, chain_data in cached.items():
+                if chain_data is not None:
+                    chains[user_key] = ChainResolutionCore.deserialize_chain(
+                        chain_data
+                    )[:max_depth]
+
+        delegation_map: Dict[str, List[Delegation]] = {}
+        unresolved = [user_key for user_key in user_keys if user_key not in chains]
+        frontier = unresolved
+        for _ in range(max_depth):
+            if not frontier:
+                break
+            for start in range(0, len(frontier), self.bulk_chunk_size):
+                delegation_map.update(
+                    await self.repository.get_active_delegations_batch(
+                        frontier[start:start + self.bulk_chunk_size], *scope, as_of=as_of
+                    )
+                )
+
+            # Next hop: delegatees of this hop that have not been loaded yet
+            next_frontier = []
+            for user_key in frontier:
+                delegation = ChainResolutionCore._find_active_delegation(
+                    user_key, delegation_map, *scope
+                )
+                if delegation is None or ChainResolutionCore._is_delegation_expired(delegation):
+                    continue
+                delegatee_key = str(delegation.delegatee_id)
+                if delegatee_key not in delegation_map and delegatee_key not in next_frontier:
+                    next_frontier.append(delegatee_key)
+            frontier = next_frontier
+
+        for user_key in unresolved:
+            chains[user_key] = ChainResolutionCore.resolve_chain_from_map(
+                user_key, delegation_map, *scope, max_depth=max_depth
+            )
+
+        if cache_results and as_of is None and unresolved:
+            # Single-hop chains are what the fast path answers, so warm it too
+            await self.cache.cache_entries_batch(
+                {cache_keys[user_key]: chains[user_key] for user_key in unresolved},
+                {
+                    self.cache.generate_fast_path_key(
+                        user_key, poll_id, label_id, field_id, institution_id, value_id, idea_id,
+                        epoch,
+                    ): {
+                        "is_direct": True,
+                        "delegation_id": str(chains[user_key][0].id),
+                        "delegatee_id": str(chains[user_key][0].delegatee_id),
+                        "mode": chains[user_key][0].mode,
+                        "chain_length": 1,
+                        "final_delegatee_id": str(chains[user_key][0].delegatee_id),
+                    }
+                    for user_key in unresolved
+                    if len(chains[user_key]) == 1
+                },
+            )
+        return {user_key: chains[user_key] for user_key in user_keys}
+    
+    async def resolve_poll_delegation_chains(
+        self,
+        user_id: UUID,
+        poll_ids: List[UUID],
+        max_depth: int = 10,
+    ) -> Dict[str, List[Delegation]]:
+        """Resolve one user's delegation chain in many poll scopes.
+
+        The per-poll counterpart of ``resolve_delegation_chains_bulk``: the
+        scope epochs and cached chains of every poll are read with one batch
+        lookup, and the remaining chains are advanced together with one
+        query per hop across all their polls. Resolved chains are written
+        back to the cache in one pipeline.
+
+        Returns:
+            Dict[str, List[Delegation]]: Chain per poll, keyed by string poll ID
+        """
+        user_key = str(user_id)
+        poll_keys = list(dict.fromkeys(str(poll_id) for poll_id in poll_ids))
+
+        graph_index = get_delegation_graph_index()
+        if graph_index.is_loaded:
+            await graph_index.sync(self.db, self.cache.redis)
+            return {
+                poll_key: graph_index.resolve_chain(
+                    user_key, poll_key, None, None, None, None, None, max_depth=max_depth
+                )
+                for poll_key in poll_keys
+            }
+
+        epochs, cached = await self.cache.lookup_poll_chains(user_key, poll_keys)
+        cache_keys = {
+            poll_key: self.cache.generate_cache_key(user_key, poll_key, epoch=epochs[poll_key])
+            for poll_key in poll_keys
+        }
+        chains: Dict[str, List[Delegation]] = {}
+        for poll_key, chain_data in cached.items():
+            if chain_data is not None:
+                chains[poll_key] = ChainResolutionCore.deserialize_chain(
+                    chain_data
+                )[:max_depth]
+
+        # One map serves every poll: each loaded delegation keeps its poll_id
+        delegation_map: Dict[str, List[Delegation]] = {}
+        unresolved = [poll_key for poll_key in poll_keys if poll_key not in chains]
+        heads = {poll_key: user_key for poll_key in unresolved}
+        for _ in range(max_depth):
+            frontier = list(dict.fromkeys(
+                head for head in heads.values() if head not in delegation_map
+            ))
+            if frontier:
+                delegation_map.update(
+                    await self.repository.get_active_poll_delegations_batch(
+                        frontier, list(heads)
+                    )
+                )
+
+            next_heads = {}
+            for poll_key, head in heads.items():
+                delegation = ChainResolutionCore._find_active_delegation(
+                    head, delegation_map, poll_key
+                )
+                if delegation is None or ChainResolutionCore._is_delegation_expired(delegation):
+                    continue
+                if str(delegation.delegatee_id) != user_key:
+                    next_heads[poll_key] = str(delegation.delegatee_id)
+            if not next_heads:
+                break
+            heads = next_heads
+
+        for poll_key in unresolved:
+            chains[poll_key] = ChainResolutionCore.resolve_chain_from_map(
+                user_key, delegation_map, poll_key, max_depth=max_depth
+            )
+        if unresolved:
+            await self.cache.cache_entries_batch(
+                {cache_keys[poll_key]: chains[poll_key] for poll_key in unresolved}
+            )
+        return {poll_key: chains[poll_key] for poll_key in poll_keys}
+    
+    async def get_delegation_stats(self, poll_id: Optional[UUID] = None) -> Dict[str, Any]:
+        """Calculate exact whole-graph delegation statistics for a scope."""
+        return await DelegationStatsEngine(self.db).calculate(poll_id)
+    
     async def revoke_delegation_with_stats(self, delegation_id: UUID) -> None:
         """Revoke a delegation with background stats recalculation."""
         delegation = await self.repository.get_delegation_by_id(delegation_id)
@@ -167,13 +412,15 @@ class DelegationAsyncDispatch:
 
         # Revoke delegation
         await self.repository.revoke_delegation(delegation_id)
+        defer_graph_changes(self.db, self.cache.redis, removed_ids=[delegation_id])
+        await refresh_delegation_resolutions(self.db, self.cache, [delegation])
 
         # Trigger stats recalculation in background
         await self.stats_task.calculate_stats(delegation.poll_id)
 
-        # Invalidate chain cache for delegator and delegatee
+        # Invalidate the delegator's cache and every cached chain running through it
         await self.cache.invalidate_user_cache(delegation.delegator_id)
-        await self.cache.invalidate_delegatee_cache(delegation.delegatee_id)
+        await self.cache.invalidate_delegatee_cache(delegation.delegator_id)
 
         # Log delegation revocation
         DelegationTelemetry.log_delegation_revocation(
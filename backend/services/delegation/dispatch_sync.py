@@ -10,6 +10,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.config import settings
 from backend.core.exceptions.delegation import (
     CircularDelegationError,
     DelegationAlreadyExistsError,
@@ -17,12 +18,19 @@ from backend.core.exceptions.delegation import (
     InvalidDelegationPeriodError,
     SelfDelegationError,
 )
+from backend.core.logging_config import get_logger
+from backend.core.post_commit import defer_until_commit
 from backend.models.delegation import Delegation, DelegationMode
+from backend.services.poll_version import bump_poll_versions
 
 from .repository import DelegationRepository
 from .cache import DelegationCache
+from .graph_index import defer_graph_changes, get_delegation_graph_index
+from .resolution_table import refresh_delegation_resolutions
 from .telemetry import DelegationTelemetry
 
+logger = get_logger(__name__)
+
 
 class DelegationSyncDispatch:
     """Synchronous dispatch layer for delegation operations."""
@@ -66,9 +74,13 @@ class DelegationSyncDispatch:
             )
 
         # Check for circular delegation
-        if await self._would_create_circular_delegation(delegator_id, delegatee_id, poll_id):
+        if await self._would_create_circular_delegation(
+            delegator_id, delegatee_id, poll_id, label_id, field_id,
+            institution_id, value_id, idea_id
+        ):
             raise CircularDelegationError(
-                message="Creating this delegation would create a circular chain",
+                user_id=str(delegator_id),
+                delegatee_id=str(delegatee_id),
                 details={
                     "delegator_id": str(delegator_id),
                     "delegatee_id": str(delegatee_id),
@@ -108,23 +120,32 @@ class DelegationSyncDispatch:
             chain_origin_id=delegator_id,
         )
 
+        # Record where the delegator's weight goes in open polls before the write
+        route_snapshot = await self._capture_live_tally_routes(delegation)
+
         # Persist delegation
         delegation = await self.repository.create_delegation(delegation)
 
+        # Re-route the delegator's weight in live poll tallies once committed
+        self._defer_live_tally_routes(route_snapshot)
+
+        # Update the in-memory delegation graph once the write commits
+        defer_graph_changes(self.db, self.cache.redis, upserted=[delegation])
+
+        # Re-point materialized resolutions of the delegator's upstream subtree
+        await refresh_delegation_resolutions(self.db, self.cache, [delegation])
+
         # Invalidate stats cache
         await self.repository.invalidate_stats_cache(poll_id)
 
-        # Invalidate chain cache for delegator and delegatee
-        await self.cache.invalidate_user_cache(delegator_id)
-        await self.cache.invalidate_delegatee_cache(delegatee_id)
-        
-        # Invalidate fast-path cache for delegator and delegatee
-        await self.cache.invalidate_fast_path_cache(
-            delegator_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
-        )
-        await self.cache.invalidate_fast_path_cache(
-            delegatee_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
-        )
+        # Invalidate the delegator's cache, every cached chain running through it
+        # and the fast-path caches of both ends
+        scope = (poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        await self._invalidate_chain_caches(delegator_id, delegatee_id, scope)
+
+        # Poll-scoped delegations change vote statuses on the poll detail;
+        # its version moves only after the commit
+        self._defer_invalidation_and_version_bump(delegator_id, delegatee_id, scope)
 
         # Log delegation creation
         DelegationTelemetry.log_delegation_creation(
@@ -142,23 +163,24 @@ class DelegationSyncDispatch:
         if delegation.revoked_at:
             return  # Already revoked, idempotent success
 
+        route_snapshot = await self._capture_live_tally_routes(delegation)
+
         # Revoke delegation
         await self.repository.revoke_delegation(delegation_id)
 
-        # Invalidate chain cache for delegator and delegatee
-        await self.cache.invalidate_user_cache(delegation.delegator_id)
-        await self.cache.invalidate_delegatee_cache(delegation.delegatee_id)
-        
-        # Invalidate fast-path cache for delegator and delegatee
-        await self.cache.invalidate_fast_path_cache(
-            delegation.delegator_id, 
+        self._defer_live_tally_routes(route_snapshot)
+        defer_graph_changes(self.db, self.cache.redis, removed_ids=[delegation_id])
+        await refresh_delegation_resolutions(self.db, self.cache, [delegation])
+
+        scope = (
             delegation.poll_id, delegation.label_id, delegation.field_id,
-            delegation.institution_id, delegation.value_id, delegation.idea_id
+            delegation.institution_id, delegation.value_id, delegation.idea_id,
         )
-        await self.cache.invalidate_fast_path_cache(
-            delegation.delegatee_id,
-            delegation.poll_id, delegation.label_id, delegation.field_id,
-            delegation.institution_id, delegation.value_id, delegation.idea_id
+        await self._invalidate_chain_caches(
+            delegation.delegator_id, delegation.delegatee_id, scope
+        )
+        self._defer_invalidation_and_version_bump(
+            delegation.delegator_id, delegation.delegatee_id, scope
         )
 
         # Log delegation revocation
@@ -166,6 +188,39 @@ class DelegationSyncDispatch:
             delegation_id, delegation.mode, delegation.target_type
         )
     
+    async def _invalidate_chain_caches(self, delegator_id, delegatee_id, scope) -> None:
+        """Invalidate the chains a delegation write can change."""
+        await self.cache.invalidate_user_cache(delegator_id)
+        await self.cache.invalidate_delegatee_cache(delegator_id)
+        await self.cache.invalidate_fast_path_cache(delegator_id, *scope)
+        await self.cache.invalidate_fast_path_cache(delegatee_id, *scope)
+
+    def _defer_invalidation_and_version_bump(self, delegator_id, delegatee_id, scope) -> None:
+        """Invalidate again and move the poll's version once the write commits.
+
+        A read between the first invalidation and the commit can cache the
+        old chain, and a version moved before the commit could be served
+        with the old poll state; the version moves last.
+        """
+        async def _invalidate() -> None:
+            await self._invalidate_chain_caches(delegator_id, delegatee_id, scope)
+            await bump_poll_versions([scope[0]])
+
+        defer_until_commit(self.db, _invalidate)
+
+    async def _capture_live_tally_routes(self, delegation: Delegation):
+        """Snapshot the delegator's routes in open polls' live tallies, if enabled."""
+        # Imported here: the tally services depend on this package
+        from backend.services.live_tally import capture_delegation_routes
+
+        return await capture_delegation_routes(self.db, delegation)
+
+    def _defer_live_tally_routes(self, route_snapshot) -> None:
+        """Apply the live tally deltas of a captured write once it commits."""
+        from backend.services.live_tally import defer_route_changes
+
+        defer_route_changes(self.db, route_snapshot)
+
     async def _validate_mode_constraints(
         self,
         mode: DelegationMode,
@@ -188,17 +243,35 @@ class DelegationSyncDispatch:
                     )
     
     async def _would_create_circular_delegation(
-        self, delegator_id: UUID, delegatee_id: UUID, poll_id: Optional[UUID]
+        self,
+        delegator_id: UUID,
+        delegatee_id: UUID,
+        poll_id: Optional[UUID],
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
     ) -> bool:
-        """Check if creating a delegation would create a circular chain."""
-        # This is a simplified check - in practice, you'd want to do a full chain traversal
-        # For now, just check if the delegatee has any delegation back to the delegator
-        delegatee_delegations = await self.repository.get_active_delegations_for_user(
-            delegatee_id, poll_id
+        """Check if the delegator is reachable from the delegatee in the target scope.
+
+        With the graph index loaded this is a membership test against its
+        per-scope reachability sets, which count every indexed delegation
+        and are updated on create, revoke and expiry. Without the index, one
+        recursive chain query up to ``DELEGATION_CYCLE_CHECK_MAX_DEPTH`` hops
+        answers it.
+        """
+        scope = (poll_id, label_id, field_id, institution_id, value_id, idea_id)
+
+        graph_index = get_delegation_graph_index()
+        if graph_index.is_loaded:
+            # Replay other workers' writes now rather than at the sync interval
+            await graph_index.sync(self.db, self.cache.redis, force=True)
+            return graph_index.is_reachable(delegatee_id, delegator_id, *scope)
+
+        chain = await self.repository.get_delegation_chain_recursive(
+            delegatee_id, *scope, max_depth=settings.DELEGATION_CYCLE_CHECK_MAX_DEPTH
+        )
+        return any(
+            str(delegation.delegatee_id) == str(delegator_id) for delegation in chain
         )
-        
-        for delegation in delegatee_delegations:
-            if delegation.delegatee_id == delegator_id:
-                return True
-        
-        return False
@@ -8,11 +8,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import redis.asyncio as redis
 
 from backend.config import get_settings
+from backend.core.post_commit import defer_until_commit, run_post_commit_hooks
+from backend.services.poll_version import bump_poll_versions
 
 from .dispatch import DelegationDispatch, DelegationTarget
 from .cache import DelegationCache
 from .repository import DelegationRepository
 from .chain_resolution import ChainResolutionCore
+from .graph_index import defer_graph_changes
+from .resolution_table import DelegationResolutionStore, refresh_delegation_resolutions
 from .telemetry import DelegationTelemetry
 
 
@@ -40,6 +44,26 @@ class DelegationService:
         """Resolve delegation chain."""
         return await self.dispatch.resolve_delegation_chain(*args, **kwargs)
     
+    async def resolve_delegation_chains_bulk(self, *args, **kwargs):
+        """Resolve delegation chains for many users in one call."""
+        return await self.dispatch.resolve_delegation_chains_bulk(*args, **kwargs)
+    
+    async def resolve_poll_delegation_chains(self, *args, **kwargs):
+        """Resolve one user's delegation chain in many poll scopes in one call."""
+        return await self.dispatch.resolve_poll_delegation_chains(*args, **kwargs)
+    
+    async def get_poll_delegation_resolutions(self, *args, **kwargs):
+        """Get the materialized resolutions of one user in many poll scopes."""
+        return await DelegationResolutionStore(self.db, self.cache).get_poll_resolutions(*args, **kwargs)
+    
+    async def get_delegation_resolution(self, *args, **kwargs):
+        """Get the materialized final delegatee of a user's chain."""
+        return await DelegationResolutionStore(self.db, self.cache).get_resolution(*args, **kwargs)
+    
+    async def get_delegation_stats(self, *args, **kwargs):
+        """Get delegation statistics."""
+        return await self.dispatch.get_delegation_stats(*args, **kwargs)
+    
     async def create_delegation(self, *args, **kwargs):
         """Create a new delegation."""
         return await self.dispatch.create_delegation(*args, **kwargs)
@@ -62,7 +86,11 @@ class DelegationService:
         return await self.repository.get_poll_delegations(poll_id)
     
     async def expire_legacy_delegations(self):
-        """Expire legacy fixed-term delegations."""
+        """Expire legacy fixed-term delegations.
+
+        This is the expiry job's entry point and owns its transaction: it
+        commits, then runs the deferred cache, graph and tally updates.
+        """
         expired_delegations = await self.repository.get_expired_legacy_delegations()
         
         expired_count = 0
@@ -72,7 +100,55 @@ class DelegationService:
             await self.db.flush()
             expired_count += 1
         
-        return {
+        # Expired delegations leave the in-memory delegation graph once committed
+        defer_graph_changes(self.db, self.cache.redis, upserted=expired_delegations)
+        self._defer_live_tally_reconcile(expired_delegations)
+        await refresh_delegation_resolutions(self.db, self.cache, expired_delegations)
+
+        # Once committed, move the affected scopes to a new epoch rather than
+        # deleting chains, then the affected polls to a new version
+        scopes = [
+            scope
+            for delegation in expired_delegations
+            for scope in DelegationResolutionStore.scopes_for_delegation(delegation)
+        ]
+        poll_ids = [delegation.poll_id for delegation in expired_delegations]
+
+        async def _invalidate() -> None:
+            await self.cache.bump_scope_epochs(scopes)
+            await bump_poll_versions(poll_ids)
+
+        defer_until_commit(self.db, _invalidate)
+
+        result = {
             "expired_count": expired_count,
             "expired_delegations": [str(d.id) for d in expired_delegations]
         }
+        await self.db.commit()
+        await run_post_commit_hooks(self.db)
+        return result
+
+    def _defer_live_tally_reconcile(self, expired_delegations) -> None:
+        """Recount the open polls the expired delegations reached, once committed.
+
+        The tally engine stops counting a legacy delegation at its term end,
+        before this job runs, so there is no before/after route to diff; the
+        affected live tallies are reconciled against the database instead.
+        """
+        if not expired_delegations or not get_settings().LIVE_TALLY_ENABLED:
+            return
+        # Imported here: the tally services depend on this package
+        from backend.services.live_tally import LiveTallyService, tally_scope
+
+        scopes = [
+            scope
+            for scope in (tally_scope(delegation) for delegation in expired_delegations)
+            if scope is not None
+        ]
+        if not scopes:
+            return
+
+        async def _reconcile() -> None:
+            await LiveTallyService(self.db).reconcile_scopes(scopes)
+
+        defer_until_commit(self.db, _reconcile)
@@ -0,0 +1,400 @@
+"""Process-wide in-memory delegation graph index.
+
+The index holds every unexpired, unrevoked delegation keyed by scope and
+delegator, so a chain resolution is one dictionary lookup per hop instead of
+a full-table scan followed by an O(N) map build.
+
+Alongside the chains it keeps a per-scope ``ReachabilityIndex``, which
+answers the cycle check on delegation creation with a set membership test.
+
+It is loaded once at startup and updated incrementally: once a write has
+committed, this process updates it directly and also appends the write to a
+Redis stream that other workers replay (re-reading only the changed rows) so that
+all processes converge. If the stream cannot be followed (Redis down, or the
+stream was trimmed past our position) the index falls back to a periodic
+full reload.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.core.logging_config import get_logger
+from backend.core.post_commit import defer_until_commit
+from backend.models.delegation import Delegation
+
+from .chain_resolution import ChainResolutionCore
+from .reachability import ReachabilityIndex
+from .repository import DelegationRepository
+
+logger = get_logger(__name__)
+
+ScopeKey = Tuple[str, Optional[str]]
+
+CHANGES_STREAM_KEY = "delegation:graph:changes"
+CHANGES_STREAM_MAXLEN = 10000
+
+_SCOPE_FIELDS = ("poll_id", "label_id", "field_id", "institution_id", "value_id", "idea_id")
+_COPIED_FIELDS = (
+    "id",
+    "delegator_id",
+    "delegatee_id",
+    "mode",
+    *_SCOPE_FIELDS,
+    "start_date",
+    "end_date",
+    "legacy_term_ends_at",
+    "revoked_at",
+    "is_deleted",
+    "created_at",
+)
+
+
+class DelegationGraphIndex:
+    """In-memory delegation graph keyed by scope and delegator."""
+
+    def __init__(self, sync_interval_seconds: float = 1.0, reload_interval_seconds: float = 600.0):
+        self.sync_interval_seconds = sync_interval_seconds
+        self.reload_interval_seconds = reload_interval_seconds
+        self._scopes: Dict[ScopeKey, Dict[str, List[Delegation]]] = {}
+        self._by_id: Dict[str, Delegation] = {}
+        self._reachability = ReachabilityIndex()
+        self._stream_position: Optional[str] = None
+        self._loaded_at: Optional[float] = None
+        self._synced_at: float = 0.0
+        # Created on first sync so it binds to the running loop
+        self._sync_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    async def load(self, db: AsyncSession, redis_client=None) -> None:
+        """(Re)build the index from the database."""
+        if redis_client is not None:
+            self._stream_position = await self._stream_tail(redis_client)
+
+        delegations = await DelegationRepository(db).get_unexpired_delegations()
+        self._scopes = {}
+        self._by_id = {}
+        for delegation in delegations:
+            if self._is_indexable(delegation):
+                self._insert(self._copy(delegation))
+        self._reachability = ReachabilityIndex.from_edges(
+            (scope_key, entry.delegator_id, entry.delegatee_id)
+            for entry in self._by_id.values()
+            for scope_key in self.scope_keys_for_delegation(entry)
+        )
+
+        self._loaded_at = self._synced_at = time.monotonic()
+        logger.info(
+            "Delegation graph index loaded",
+            extra={"delegations": len(self._by_id), "scopes": len(self._scopes)},
+        )
+
+    def clear(self) -> None:
+        """Drop all entries and mark the index as not loaded."""
+        self._scopes = {}
+        self._by_id = {}
+        self._reachability = ReachabilityIndex()
+        self._stream_position = None
+        self._loaded_at = None
+
+    def upsert(self, delegation: Delegation) -> None:
+        """Insert or replace a delegation; inactive delegations are removed instead."""
+        self.discard(delegation.id)
+        if not self._is_indexable(delegation):
+            return
+
+        entry = self._copy(delegation)
+        self._insert(entry)
+        for scope_key in self.scope_keys_for_delegation(entry):
+            self._reachability.add_edge(scope_key, entry.delegator_id, entry.delegatee_id)
+
+    def _insert(self, entry: Delegation) -> None:
+        """Add a copied delegation to the chain maps."""
+        self._by_id[entry.id] = entry
+        for scope_key in self.scope_keys_for_delegation(entry):
+            # Priority order (hybrid seed first, then oldest) is applied at resolution time
+            self._scopes.setdefault(scope_key, {}).setdefault(entry.delegator_id, []).append(entry)
+
+    def discard(self, delegation_id) -> None:
+        """Remove a delegation from the index (no-op if absent)."""
+        entry = self._by_id.pop(str(delegation_id), None)
+        if entry is None:
+            return
+        for scope_key in self.scope_keys_for_delegation(entry):
+            self._reachability.remove_edge(scope_key, entry.delegator_id, entry.delegatee_id)
+            by_delegator = self._scopes.get(scope_key, {})
+            remaining = [d for d in by_delegator.get(entry.delegator_id, []) if d.id != entry.id]
+            if remaining:
+                by_delegator[entry.delegator_id] = remaining
+            else:
+                by_delegator.pop(entry.delegator_id, None)
+                if not by_delegator:
+                    self._scopes.pop(scope_key, None)
+
+    def delegations_for(self, user_id, scope_key: ScopeKey) -> List[Delegation]:
+        """Delegations of a delegator under one scope."""
+        return list(self._scopes.get(scope_key, {}).get(str(user_id), []))
+
+    def resolve_chain(
+        self,
+        user_id: UUID,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+        max_depth: int = 10,
+    ) -> List[Delegation]:
+        """Resolve a delegation chain in O(chain length) from the index."""
+        scope = [
+            str(value) if value is not None else None
+            for value in (poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        ]
+        delegation_map = self._scopes.get(self.scope_key_for_target(*scope), {})
+        return ChainResolutionCore.resolve_chain_from_map(
+            str(user_id), delegation_map, *scope, max_depth=max_depth
+        )
+
+    def is_reachable(
+        self,
+        from_user_id: UUID,
+        to_user_id: UUID,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+    ) -> bool:
+        """Whether any path of delegations leads from ``from_user_id`` to ``to_user_id``."""
+        scope_key = self.scope_key_for_target(
+            poll_id, label_id, field_id, institution_id, value_id, idea_id
+        )
+        return self._reachability.is_reachable(scope_key, from_user_id, to_user_id)
+
+    async def sync(self, db: AsyncSession, redis_client=None, force: bool = False) -> None:
+        """Catch up with delegation writes made by other processes.
+
+        Replays the change stream (throttled to ``sync_interval_seconds``),
+        re-reading only the changed delegations. Falls back to a full reload
+        when the stream cannot be followed or the reload interval elapsed.
+
+        Syncs in one process run one at a time, so concurrent requests never
+        reload together: a caller that waited for another's reload only
+        replays the stream.
+        """
+        now = time.monotonic()
+        if not force and now - self._synced_at < self.sync_interval_seconds:
+            return
+        self._synced_at = now
+
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+        async with self._sync_lock:
+            await self._sync(db, redis_client, now)
+
+    async def _sync(self, db: AsyncSession, redis_client, requested_at: float) -> None:
+        # A reload that finished while we waited is recent enough; the
+        # stream replay below still picks up writes it may have missed
+        if self._loaded_at is None or (
+            self._loaded_at < requested_at
+            and requested_at - self._loaded_at >= self.reload_interval_seconds
+        ):
+            await self.load(db, redis_client)
+            return
+        if redis_client is None:
+            return
+
+        try:
+            changed_ids = await self._read_changes(redis_client)
+        except Exception as e:
+            logger.warning("Failed to read delegation graph changes", extra={"error": str(e)})
+            return
+        if changed_ids is None:
+            await self.load(db, redis_client)
+            return
+        if not changed_ids:
+            return
+
+        delegations = await DelegationRepository(db).get_delegations_by_ids(changed_ids)
+        found = {str(delegation.id): delegation for delegation in delegations}
+        for delegation_id in changed_ids:
+            if delegation_id in found:
+                self.upsert(found[delegation_id])
+            else:
+                self.discard(delegation_id)
+
+    async def publish_change(self, redis_client, delegation_id) -> None:
+        """Announce a delegation write to other processes via the change stream."""
+        if redis_client is None:
+            return
+        try:
+            await redis_client.xadd(
+                CHANGES_STREAM_KEY,
+                {"delegation_id": str(delegation_id)},
+                maxlen=CHANGES_STREAM_MAXLEN,
+                approximate=True,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to publish delegation graph change",
+                extra={"delegation_id": str(delegation_id), "error": str(e)},
+            )
+
+    async def _read_changes(self, redis_client) -> Optional[List[str]]:
+        """Changed delegation IDs since our stream position, or None if we fell behind."""
+        position = self._stream_position or "0-0"
+        if position != "0-0":
+            head = await redis_client.xrange(CHANGES_STREAM_KEY, count=1)
+            if head and self._compare_ids(_decode(head[0][0]), position) > 0:
+                return None  # Entries after our position were trimmed
+
+        changed: List[str] = []
+        while True:
+            response = await redis_client.xread({CHANGES_STREAM_KEY: position}, count=1000)
+            if not response:
+                break
+            entries = response[0][1]
+            for entry_id, fields in entries:
+                position = _decode(entry_id)
+                delegation_id = fields.get(b"delegation_id", fields.get("delegation_id"))
+                if delegation_id is not None:
+                    changed.append(_decode(delegation_id))
+            if len(entries) < 1000:
+                break
+
+        self._stream_position = position
+        return list(dict.fromkeys(changed))
+
+    async def _stream_tail(self, redis_client) -> Optional[str]:
+        try:
+            tail = await redis_client.xrevrange(CHANGES_STREAM_KEY, count=1)
+        except Exception as e:
+            logger.warning("Failed to read delegation graph stream", extra={"error": str(e)})
+            return None
+        return _decode(tail[0][0]) if tail else "0-0"
+
+    @staticmethod
+    def scope_key_for_target(
+        poll_id: Optional[str] = None,
+        label_id: Optional[str] = None,
+        field_id: Optional[str] = None,
+        institution_id: Optional[str] = None,
+        value_id: Optional[str] = None,
+        idea_id: Optional[str] = None,
+    ) -> ScopeKey:
+        """Scope key for a resolution target (same precedence as ``_matches_target_scope``)."""
+        for name, value in zip(
+            _SCOPE_FIELDS, (poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        ):
+            if value is not None:
+                return (name, str(value))
+        return ("global", None)
+
+    @staticmethod
+    def scope_keys_for_delegation(delegation: Delegation) -> List[ScopeKey]:
+        """Every scope key under which a delegation can be matched."""
+        keys = [
+            (name, str(getattr(delegation, name)))
+            for name in _SCOPE_FIELDS
+            if getattr(delegation, name) is not None
+        ]
+        return keys or [("global", None)]
+
+    @staticmethod
+    def _is_indexable(delegation: Delegation) -> bool:
+        if delegation.is_deleted or delegation.revoked_at is not None:
+            return False
+        end_date = delegation.end_date
+        if end_date is not None:
+            if end_date.tzinfo is not None:
+                end_date = end_date.astimezone(timezone.utc).replace(tzinfo=None)
+            return end_date > datetime.utcnow()
+        return True
+
+    @staticmethod
+    def _copy(delegation: Delegation) -> Delegation:
+        """Detached copy with string IDs, safe to share across sessions."""
+        entry = Delegation()
+        for name in _COPIED_FIELDS:
+            value = getattr(delegation, name, None)
+            if name.endswith("id") and value is not None:
+                value = str(value)
+            setattr(entry, name, value)
+        entry.is_deleted = bool(entry.is_deleted)
+        return entry
+
+    @staticmethod
+    def _compare_ids(left: str, right: str) -> int:
+        left_parts = tuple(int(part) for part in left.split("-"))
+        right_parts = tuple(int(part) for part in right.split("-"))
+        return (left_parts > right_parts) - (left_parts < right_parts)
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+_graph_index = DelegationGraphIndex(
+    sync_interval_seconds=get_settings().DELEGATION_GRAPH_INDEX_SYNC_SECONDS,
+    reload_interval_seconds=get_settings().DELEGATION_GRAPH_INDEX_RELOAD_SECONDS,
+)
+
+
+def get_delegation_graph_index() -> DelegationGraphIndex:
+    """Get the process-wide delegation graph index."""
+    return _graph_index
+
+
+async def apply_graph_changes(
+    redis_client,
+    upserted: Iterable[Delegation] = (),
+    removed_ids: Iterable = (),
+) -> None:
+    """Apply delegation writes to this process's index and announce them to others."""
+    if not get_settings().DELEGATION_GRAPH_INDEX_ENABLED:
+        return
+    index = get_delegation_graph_index()
+    for delegation in upserted:
+        if index.is_loaded:
+            index.upsert(delegation)
+        await index.publish_change(redis_client, delegation.id)
+    for delegation_id in removed_ids:
+        index.discard(delegation_id)
+        await index.publish_change(redis_client, delegation_id)
+
+
+def defer_graph_changes(
+    db: AsyncSession,
+    redis_client,
+    upserted: Iterable[Delegation] = (),
+    removed_ids: Iterable = (),
+) -> None:
+    """Apply and announce delegation writes once the session's transaction commits.
+
+    Publishing earlier would let other workers replay the change against the
+    old rows and advance past it, and would leave a phantom edge here on
+    rollback. The delegations are copied now, as they are on upsert, so the
+    hook does not touch session state after the commit.
+    """
+    if not get_settings().DELEGATION_GRAPH_INDEX_ENABLED:
+        return
+    upserted = [DelegationGraphIndex._copy(delegation) for delegation in upserted]
+    removed_ids = [str(delegation_id) for delegation_id in removed_ids]
+
+    async def _apply() -> None:
+        await apply_graph_changes(redis_client, upserted=upserted, removed_ids=removed_ids)
+
+    defer_until_commit(db, _apply)
@@ -0,0 +1,164 @@
+"""Process-local first tier of the delegation cache.
+
+Hot chains, fast-path results and scope epochs are kept in a bounded LRU in
+front of Redis, so repeated lookups on the same worker skip the network.
+Entries expire after a short TTL and the tier is capped by the serialized
+size of what it holds.
+
+Invalidations are broadcast over Redis pub/sub: every worker drops the
+entries that depend on an invalidated user, and forgets its cached epochs
+when a scope epoch is bumped. The short TTL bounds staleness if a message
+is missed while a worker is disconnected.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+from backend.config import get_settings
+from backend.core.logging_config import get_logger
+from backend.services.delegation.cache_metrics import record_cache_event
+
+logger = get_logger(__name__)
+
+INVALIDATION_CHANNEL = "delegation:cache:invalidations"
+EPOCH_MESSAGE = "epoch"
+
+
+class _LocalEntry(NamedTuple):
+    expires_at: float
+    size: int
+    value: Any
+    user_ids: Tuple[str, ...]
+
+
+class LocalCacheTier:
+    """Bounded in-process LRU of delegation cache entries with per-entry TTL."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, ttl_seconds: float = 30.0):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _LocalEntry]" = OrderedDict()
+        self._by_user: Dict[str, Set[str]] = {}
+        self._epochs: Dict[str, Tuple[float, str]] = {}
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live entry, counting the lookup as an L1 hit or miss."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            record_cache_event("l1", key, "misses")
+            return None
+        self._entries.move_to_end(key)
+        record_cache_event("l1", key, "hits")
+        return entry.value
+
+    def set(self, key: str, value: Any, size: int, user_ids: Iterable[str]) -> None:
+        """Store an entry that depends on ``user_ids``, evicting least recently used ones."""
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return
+
+        user_ids = tuple(dict.fromkeys(str(user_id) for user_id in user_ids))
+        self._entries[key] = _LocalEntry(time.monotonic() + self.ttl_seconds, size, value, user_ids)
+        self._bytes += size
+        for user_id in user_ids:
+            self._by_user.setdefault(user_id, set()).add(key)
+        record_cache_event("l1", key, "sets")
+
+        while self._bytes > self.max_bytes:
+            evicted_key = next(iter(self._entries))
+            self._remove(evicted_key)
+            record_cache_event("l1", evicted_key, "evictions")
+
+    def discard(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+            record_cache_event("l1", key, "evictions")
+
+    def discard_user(self, user_id) -> None:
+        """Drop every entry owned by or resolving through a user."""
+        for key in list(self._by_user.get(str(user_id), ())):
+            self._remove(key)
+            record_cache_event("l1", key, "evictions")
+
+    def get_epoch(self, scope_hash: str) -> Optional[str]:
+        cached = self._epochs.get(scope_hash)
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        return cached[1]
+
+    def set_epoch(self, scope_hash: str, epoch: str) -> None:
+        self._epochs[scope_hash] = (time.monotonic() + self.ttl_seconds, epoch)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_user.clear()
+        self._epochs.clear()
+        self._bytes = 0
+
+    def apply_message(self, message) -> None:
+        """Apply an invalidation broadcast: ``user:<id>`` or ``epoch``."""
+        if isinstance(message, bytes):
+            message = message.decode()
+        if message == EPOCH_MESSAGE:
+            self._epochs.clear()
+        elif message.startswith("user:"):
+            self.discard_user(message[len("user:"):])
+
+    async def listen(self, redis_client) -> None:
+        """Apply other workers' invalidations until cancelled."""
+        while True:
+            try:
+                pubsub = redis_client.pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                try:
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.apply_message(message["data"])
+                finally:
+                    await pubsub.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Invalidations may have been missed while disconnected
+                logger.warning(f"Delegation cache invalidation listener failed: {e}")
+                self.clear()
+                await asyncio.sleep(1.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "epochs": len(self._epochs),
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        for user_id in entry.user_ids:
+            keys = self._by_user.get(user_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_user[user_id]
+
+
+_local_cache_tier = LocalCacheTier(
+    max_bytes=get_settings().DELEGATION_L1_CACHE_MAX_BYTES,
+    ttl_seconds=get_settings().DELEGATION_L1_CACHE_TTL_SECONDS,
+)
+
+
+def get_local_cache_tier() -> LocalCacheTier:
+    """Get the process-wide local delegation cache tier."""
+    return _local_cache_tier
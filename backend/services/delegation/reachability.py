@@ -0,0 +1,118 @@
+"""Per-scope transitive reachability of the delegation graph.
+
+For every scope the index keeps, per user, the set of users their
+delegations lead to, directly or through any number of hops. "Would this
+delegation close a cycle" is then a set membership test instead of a chain
+walk. Every indexed delegation counts as an edge, whatever its mode or
+start date, so the answer does not depend on where chain resolution would
+stop.
+
+The sets are maintained incrementally: adding an edge extends the sets of
+the users upstream of its delegator, and removing one recomputes only
+theirs. The owning ``DelegationGraphIndex`` applies every create, revoke
+and expiry it sees.
+"""
+
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+ScopeKey = Tuple[str, Optional[str]]
+
+
+class ReachabilityIndex:
+    """Per-scope sets of the users each user's delegations lead to."""
+
+    def __init__(self):
+        # Delegations per (delegator, delegatee) pair; a pair is one edge
+        self._edges: Dict[ScopeKey, Dict[str, Dict[str, int]]] = {}
+        self._incoming: Dict[ScopeKey, Dict[str, Set[str]]] = {}
+        self._reachable: Dict[ScopeKey, Dict[str, Set[str]]] = {}
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[ScopeKey, str, str]]) -> "ReachabilityIndex":
+        """Build the index from (scope key, delegator, delegatee) triples at once."""
+        index = cls()
+        for scope_key, delegator_id, delegatee_id in edges:
+            index._link(scope_key, str(delegator_id), str(delegatee_id))
+        for scope_key, edges_by_delegator in index._edges.items():
+            index._reachable[scope_key] = {
+                user_id: index._downstream(scope_key, user_id) for user_id in edges_by_delegator
+            }
+        return index
+
+    def is_reachable(self, scope_key: ScopeKey, from_user_id, to_user_id) -> bool:
+        """Whether ``to_user_id`` can be reached from ``from_user_id`` in a scope."""
+        return str(to_user_id) in self._reachable.get(scope_key, {}).get(str(from_user_id), ())
+
+    def add_edge(self, scope_key: ScopeKey, delegator_id, delegatee_id) -> None:
+        """Record a delegation, extending the sets of every user upstream of it."""
+        delegator_id, delegatee_id = str(delegator_id), str(delegatee_id)
+        if not self._link(scope_key, delegator_id, delegatee_id):
+            return
+        reachable = self._reachable.setdefault(scope_key, {})
+        gained = {delegatee_id} | reachable.get(delegatee_id, set())
+        for user_id in self._upstream(scope_key, delegator_id):
+            reachable.setdefault(user_id, set()).update(gained)
+
+    def remove_edge(self, scope_key: ScopeKey, delegator_id, delegatee_id) -> None:
+        """Forget a delegation, recomputing the sets of every user upstream of it."""
+        delegator_id, delegatee_id = str(delegator_id), str(delegatee_id)
+        edges = self._edges.get(scope_key, {}).get(delegator_id, {})
+        count = edges.get(delegatee_id, 0)
+        if count > 1:
+            edges[delegatee_id] = count - 1
+            return
+        if not count:
+            return
+
+        affected = self._upstream(scope_key, delegator_id)
+        del edges[delegatee_id]
+        if not edges:
+            del self._edges[scope_key][delegator_id]
+        incoming = self._incoming[scope_key]
+        incoming[delegatee_id].discard(delegator_id)
+        if not incoming[delegatee_id]:
+            del incoming[delegatee_id]
+
+        reachable = self._reachable[scope_key]
+        for user_id in affected:
+            downstream = self._downstream(scope_key, user_id)
+            if downstream:
+                reachable[user_id] = downstream
+            else:
+                reachable.pop(user_id, None)
+        if not self._edges[scope_key]:
+            for scoped in (self._edges, self._incoming, self._reachable):
+                scoped.pop(scope_key, None)
+
+    def _link(self, scope_key: ScopeKey, delegator_id: str, delegatee_id: str) -> bool:
+        """Count a delegation on its edge; True if the edge is new."""
+        edges = self._edges.setdefault(scope_key, {}).setdefault(delegator_id, {})
+        edges[delegatee_id] = edges.get(delegatee_id, 0) + 1
+        if edges[delegatee_id] > 1:
+            return False
+        self._incoming.setdefault(scope_key, {}).setdefault(delegatee_id, set()).add(delegator_id)
+        return True
+
+    def _upstream(self, scope_key: ScopeKey, user_id: str) -> Set[str]:
+        """The user and everyone whose delegations lead to them."""
+        incoming = self._incoming.get(scope_key, {})
+        seen = {user_id}
+        frontier = [user_id]
+        while frontier:
+            for delegator_id in incoming.get(frontier.pop(), ()):
+                if delegator_id not in seen:
+                    seen.add(delegator_id)
+                    frontier.append(delegator_id)
+        return seen
+
+    def _downstream(self, scope_key: ScopeKey, user_id: str) -> Set[str]:
+        """Everyone the user's delegations lead to."""
+        edges = self._edges.get(scope_key, {})
+        seen: Set[str] = set()
+        frontier = [user_id]
+        while frontier:
+            for delegatee_id in edges.get(frontier.pop(), ()):
+                if delegatee_id not in seen:
+                    seen.add(delegatee_id)
+                    frontier.append(delegatee_id)
+        return seen
@@ -4,7 +4,8 @@ This module provides a thin façade over read and write repositories
 to maintain backward compatibility while reducing complexity.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -44,10 +45,84 @@ class DelegationRepository:
             user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
         )
     
+    async def check_direct_delegation_case(
+        self,
+        user_id: UUID,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Check if a user's chain is a single delegation (fast-path candidate)."""
+        return await self.read_repo.check_direct_delegation_case(
+            user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id
+        )
+    
+    async def get_active_delegations_batch(
+        self,
+        user_ids: List[UUID],
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+        as_of: Optional[datetime] = None,
+    ) -> Dict[str, List[Delegation]]:
+        """Get active delegations for multiple users in a single query."""
+        return await self.read_repo.get_active_delegations_batch(
+            user_ids, poll_id, label_id, field_id, institution_id, value_id, idea_id, as_of
+        )
+    
+    async def get_active_poll_delegations_batch(
+        self,
+        user_ids: List[UUID],
+        poll_ids: List[UUID],
+        as_of: Optional[datetime] = None,
+    ) -> Dict[str, List[Delegation]]:
+        """Get the active poll-scoped delegations of many users across many polls in one query."""
+        return await self.read_repo.get_active_poll_delegations_batch(user_ids, poll_ids, as_of)
+    
+    async def get_delegation_chain_recursive(
+        self,
+        user_id: UUID,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+        max_depth: int = 10,
+    ) -> List[Delegation]:
+        """Resolve a delegation chain with a single recursive query."""
+        return await self.read_repo.get_delegation_chain_recursive(
+            user_id, poll_id, label_id, field_id, institution_id, value_id, idea_id, max_depth
+        )
+    
     async def get_all_active_delegations(self) -> List[Delegation]:
         """Get all active delegations (for chain resolution)."""
         return await self.read_repo.get_all_active_delegations()
     
+    async def get_delegation_edges(self, poll_id: Optional[UUID] = None) -> List[Any]:
+        """Get the active delegation edges of one scope (for statistics)."""
+        return await self.read_repo.get_delegation_edges(poll_id)
+    
+    async def get_scope_delegator_ids(
+        self, poll_id: Optional[UUID] = None, label_id: Optional[UUID] = None
+    ) -> List[str]:
+        """Get the users with an active delegation in one scope (for cache warming)."""
+        return await self.read_repo.get_scope_delegator_ids(poll_id, label_id)
+    
+    async def get_unexpired_delegations(self) -> List[Delegation]:
+        """Get all unrevoked, unended delegations (for the graph index)."""
+        return await self.read_repo.get_unexpired_delegations()
+    
+    async def get_delegations_by_ids(self, delegation_ids: List[UUID]) -> List[Delegation]:
+        """Get delegations by ID in a single query."""
+        return await self.read_repo.get_delegations_by_ids(delegation_ids)
+    
     async def get_delegation_history(self, user_id: UUID) -> List[Delegation]:
         """Get delegation history for a user."""
         return await self.read_repo.get_delegation_history(user_id)
@@ -8,10 +8,12 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import and_, desc, func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from backend.models.delegation import Delegation, DelegationMode
+from backend.models.user import User
 
 
 class DelegationReadRepository:
@@ -20,6 +22,64 @@ class DelegationReadRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def _active_scope_conditions(
+        entity,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+        as_of: Optional[datetime] = None,
+    ) -> List[Any]:
+        """Target scope and active date conditions for ``entity`` (Delegation or an alias).
+
+        Activity is judged at ``as_of`` if given, else at the database's ``now()``.
+        """
+        # Add target-specific conditions
+        if poll_id is not None:
+            conditions = [entity.poll_id == poll_id]
+        elif label_id is not None:
+            conditions = [entity.label_id == label_id]
+        elif field_id is not None:
+            conditions = [entity.field_id == field_id]
+        elif institution_id is not None:
+            conditions = [entity.institution_id == institution_id]
+        elif value_id is not None:
+            conditions = [entity.value_id == value_id]
+        elif idea_id is not None:
+            conditions = [entity.idea_id == idea_id]
+        else:
+            # Global delegation (no specific target)
+            conditions = [
+                entity.poll_id.is_(None),
+                entity.label_id.is_(None),
+                entity.field_id.is_(None),
+                entity.institution_id.is_(None),
+                entity.value_id.is_(None),
+                entity.idea_id.is_(None),
+            ]
+
+        # Add active date conditions
+        conditions.extend(DelegationReadRepository._active_date_conditions(entity, as_of))
+        return conditions
+
+    @staticmethod
+    def _active_date_conditions(entity, as_of: Optional[datetime] = None) -> List[Any]:
+        """Active date conditions for ``entity``, judged at ``as_of`` or the database's ``now()``."""
+        now = as_of if as_of is not None else func.now()
+        return [
+            or_(
+                entity.end_date.is_(None),
+                entity.end_date > now,
+            ),
+            or_(
+                entity.start_date.is_(None),
+                entity.start_date <= now,
+            ),
+        ]
+
     async def get_delegation_by_id(self, delegation_id: UUID) -> Optional[Delegation]:
         """Get delegation by ID."""
         return await self.db.get(Delegation, delegation_id)
@@ -41,44 +101,10 @@ class DelegationReadRepository:
             Delegation.revoked_at.is_(None),
         ]
 
-        # Add target-specific conditions
-        if poll_id is not None:
-            conditions.append(Delegation.poll_id == poll_id)
-        elif label_id is not None:
-            conditions.append(Delegation.label_id == label_id)
-        elif field_id is not None:
-            conditions.append(Delegation.field_id == field_id)
-        elif institution_id is not None:
-            conditions.append(Delegation.institution_id == institution_id)
-        elif value_id is not None:
-            conditions.append(Delegation.value_id == value_id)
-        elif idea_id is not None:
-            conditions.append(Delegation.idea_id == idea_id)
-        else:
-            # Global delegation (no specific target)
-            conditions.extend(
-                [
-                    Delegation.poll_id.is_(None),
-                    Delegation.label_id.is_(None),
-                    Delegation.field_id.is_(None),
-                    Delegation.institution_id.is_(None),
-                    Delegation.value_id.is_(None),
-                    Delegation.idea_id.is_(None),
-                ]
-            )
-
-        # Add active date conditions
         conditions.extend(
-            [
-                or_(
-                    Delegation.end_date.is_(None),
-                    Delegation.end_date > func.now(),
-                ),
-                or_(
-                    Delegation.start_date.is_(None),
-                    Delegation.start_date <= func.now(),
-                ),
-            ]
+            self._active_scope_conditions(
+                Delegation, poll_id, label_id, field_id, institution_id, value_id, idea_id
+            )
         )
 
         # Optimized query with lean column selection
@@ -101,7 +127,7 @@ class DelegationReadRepository:
             )
             .where(and_(*conditions))
             .order_by(
-                Delegation.mode == DelegationMode.HYBRID_SEED.desc(),
+                (Delegation.mode == DelegationMode.HYBRID_SEED.value).desc(),
                 Delegation.created_at.asc(),
             )
         )
@@ -140,8 +166,13 @@ class DelegationReadRepository:
         institution_id: Optional[UUID] = None,
         value_id: Optional[UUID] = None,
         idea_id: Optional[UUID] = None,
-    ) -> Dict[UUID, List[Delegation]]:
-        """Get active delegations for multiple users in a single query (N+1 prevention)."""
+        as_of: Optional[datetime] = None,
+    ) -> Dict[str, List[Delegation]]:
+        """Get active delegations for multiple users in a single query (N+1 prevention).
+
+        Results are keyed by the string form of each delegator ID. Activity is
+        judged at ``as_of`` if given, else at the database's ``now()``.
+        """
         if not user_ids:
             return {}
 
@@ -151,46 +182,42 @@ class DelegationReadRepository:
             Delegation.revoked_at.is_(None),
         ]
 
-        # Add target-specific conditions
-        if poll_id is not None:
-            conditions.append(Delegation.poll_id == poll_id)
-        elif label_id is not None:
-            conditions.append(Delegation.label_id == label_id)
-        elif field_id is not None:
-            conditions.append(Delegation.field_id == field_id)
-        elif institution_id is not None:
-            conditions.append(Delegation.institution_id == institution_id)
-        elif value_id is not None:
-            conditions.append(Delegation.value_id == value_id)
-        elif idea_id is not None:
-            conditions.append(Delegation.idea_id == idea_id)
-        else:
-            # Global delegation (no specific target)
-            conditions.extend(
-                [
-                    Delegation.poll_id.is_(None),
-                    Delegation.label_id.is_(None),
-                    Delegation.field_id.is_(None),
-                    Delegation.institution_id.is_(None),
-                    Delegation.value_id.is_(None),
-                    Delegation.idea_id.is_(None),
-                ]
-            )
-
-        # Add active date conditions
         conditions.extend(
-            [
-                or_(
-                    Delegation.end_date.is_(None),
-                    Delegation.end_date > func.now(),
-                ),
-                or_(
-                    Delegation.start_date.is_(None),
-                    Delegation.start_date <= func.now(),
-                ),
-            ]
+            self._active_scope_conditions(
+                Delegation, poll_id, label_id, field_id, institution_id, value_id, idea_id,
+                as_of=as_of,
+            )
         )
+        return await self._get_lean_delegations_by_user(user_ids, conditions)
+
+    async def get_active_poll_delegations_batch(
+        self,
+        user_ids: List[UUID],
+        poll_ids: List[UUID],
+        as_of: Optional[datetime] = None,
+    ) -> Dict[str, List[Delegation]]:
+        """Get the active poll-scoped delegations of many users across many polls in one query.
+
+        Results are keyed by the string form of each delegator ID, like
+        ``get_active_delegations_batch``; each delegation keeps its ``poll_id``
+        so chains can be resolved per poll from the same map.
+        """
+        if not user_ids or not poll_ids:
+            return {}
+
+        conditions = [
+            Delegation.delegator_id.in_(user_ids),
+            Delegation.poll_id.in_(poll_ids),
+            Delegation.is_deleted == False,
+            Delegation.revoked_at.is_(None),
+            *self._active_date_conditions(Delegation, as_of),
+        ]
+        return await self._get_lean_delegations_by_user(user_ids, conditions)
 
+    async def _get_lean_delegations_by_user(
+        self, user_ids: List[UUID], conditions: List[Any]
+    ) -> Dict[str, List[Delegation]]:
+        """Load delegations matching ``conditions`` with lean columns, grouped by delegator."""
         # Batch query with lean column selection
         query = (
             select(
@@ -212,7 +239,7 @@ class DelegationReadRepository:
             .where(and_(*conditions))
             .order_by(
                 Delegation.delegator_id,
-                Delegation.mode == DelegationMode.HYBRID_SEED.desc(),
+                (Delegation.mode == DelegationMode.HYBRID_SEED.value).desc(),
                 Delegation.created_at.asc(),
             )
         )
@@ -221,8 +248,8 @@ class DelegationReadRepository:
         rows = result.fetchall()
 
         # Group results by delegator_id
-        delegations_by_user: Dict[UUID, List[Delegation]] = {
-            user_id: [] for user_id in user_ids
+        delegations_by_user: Dict[str, List[Delegation]] = {
+            str(user_id): [] for user_id in user_ids
         }
 
         for row in rows:
@@ -242,10 +269,92 @@ class DelegationReadRepository:
             delegation.legacy_term_ends_at = row.legacy_term_ends_at
             delegation.created_at = row.created_at
 
-            delegations_by_user[row.delegator_id].append(delegation)
+            delegations_by_user[str(row.delegator_id)].append(delegation)
 
         return delegations_by_user
 
+    async def get_delegation_chain_recursive(
+        self,
+        user_id: UUID,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+        max_depth: int = 10,
+    ) -> List[Delegation]:
+        """Resolve a delegation chain in a single ``WITH RECURSIVE`` query.
+
+        Each hop picks the delegatee's first active delegation in the same
+        order as ``get_active_delegations_for_user`` (hybrid seed first, then
+        oldest). The walk stops after an expired legacy delegation and at
+        ``max_depth``, which also bounds cycles.
+        """
+        scope = (poll_id, label_id, field_id, institution_id, value_id, idea_id)
+
+        def first_active_delegation_id(delegator_id):
+            candidate = aliased(Delegation)
+            return (
+                select(candidate.id)
+                .where(
+                    and_(
+                        candidate.delegator_id == delegator_id,
+                        candidate.is_deleted == False,
+                        candidate.revoked_at.is_(None),
+                        *self._active_scope_conditions(candidate, *scope),
+                    )
+                )
+                .order_by(
+                    (candidate.mode == DelegationMode.HYBRID_SEED.value).desc(),
+                    candidate.created_at.asc(),
+                )
+                .limit(1)
+                .scalar_subquery()
+            )
+
+        chain = (
+            select(
+                Delegation.id,
+                Delegation.delegatee_id,
+                Delegation.mode,
+                Delegation.legacy_term_ends_at,
+                literal(1).label("depth"),
+            )
+            .where(Delegation.id == first_active_delegation_id(user_id))
+            .cte("delegation_chain", recursive=True)
+        )
+        step = aliased(Delegation)
+        chain = chain.union_all(
+            select(
+                step.id,
+                step.delegatee_id,
+                step.mode,
+                step.legacy_term_ends_at,
+                chain.c.depth + 1,
+            )
+            .select_from(chain)
+            .join(step, step.id == first_active_delegation_id(chain.c.delegatee_id))
+            .where(
+                and_(
+                    chain.c.depth < max_depth,
+                    # An expired legacy delegation terminates the chain
+                    or_(
+                        chain.c.mode != DelegationMode.LEGACY_FIXED_TERM.value,
+                        chain.c.legacy_term_ends_at.is_(None),
+                        chain.c.legacy_term_ends_at >= func.now(),
+                    ),
+                )
+            )
+        )
+
+        result = await self.db.execute(
+            select(Delegation)
+            .join(chain, Delegation.id == chain.c.id)
+            .order_by(chain.c.depth)
+        )
+        return list(result.scalars().all())
+
     async def get_all_active_delegations(self) -> List[Delegation]:
         """Get all active delegations (for chain resolution)."""
         conditions = [
@@ -303,6 +412,88 @@ class DelegationReadRepository:
 
         return delegations
 
+    async def get_delegation_edges(self, poll_id: Optional[UUID] = None) -> List[Any]:
+        """Get the active delegation edges of one scope for whole-graph statistics.
+
+        Rows carry ``delegator_id``, ``delegatee_id`` and whether each user
+        still exists, ordered by delegator and then resolution priority (the
+        first row per delegator is the delegation its chain follows).
+        """
+        delegator = aliased(User)
+        delegatee = aliased(User)
+        query = (
+            select(
+                Delegation.delegator_id,
+                Delegation.delegatee_id,
+                delegator.id.isnot(None).label("delegator_exists"),
+                delegatee.id.isnot(None).label("delegatee_exists"),
+            )
+            .outerjoin(delegator, delegator.id == Delegation.delegator_id)
+            .outerjoin(delegatee, delegatee.id == Delegation.delegatee_id)
+            .where(
+                and_(
+                    Delegation.is_deleted == False,
+                    Delegation.revoked_at.is_(None),
+                    *self._active_scope_conditions(Delegation, poll_id),
+                )
+            )
+            .order_by(
+                Delegation.delegator_id,
+                (Delegation.mode == DelegationMode.HYBRID_SEED.value).desc(),
+                Delegation.created_at.asc(),
+            )
+        )
+        result = await self.db.execute(query)
+        return result.fetchall()
+
+    async def get_scope_delegator_ids(
+        self,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+    ) -> List[str]:
+        """Get the users with an active delegation in one scope (global if none given)."""
+        query = (
+            select(Delegation.delegator_id)
+            .where(
+                and_(
+                    Delegation.is_deleted == False,
+                    Delegation.revoked_at.is_(None),
+                    *self._active_scope_conditions(Delegation, poll_id, label_id),
+                )
+            )
+            .distinct()
+        )
+        result = await self.db.execute(query)
+        return [str(delegator_id) for delegator_id in result.scalars()]
+
+    async def get_unexpired_delegations(self) -> List[Delegation]:
+        """Get all unrevoked delegations that have not ended, including future ones.
+
+        Unlike ``get_all_active_delegations`` this keeps delegations whose
+        start date is still ahead, so long-lived indexes stay correct as they
+        become active.
+        """
+        query = select(Delegation).where(
+            and_(
+                Delegation.is_deleted == False,
+                Delegation.revoked_at.is_(None),
+                or_(
+                    Delegation.end_date.is_(None),
+                    Delegation.end_date > func.now(),
+                ),
+            )
+        )
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def get_delegations_by_ids(self, delegation_ids: List[UUID]) -> List[Delegation]:
+        """Get delegations by ID in a single query."""
+        if not delegation_ids:
+            return []
+        query = select(Delegation).where(Delegation.id.in_(delegation_ids))
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
     async def get_delegation_history(self, user_id: UUID) -> List[Delegation]:
         """Get delegation history for a user."""
         query = (
@@ -0,0 +1,259 @@
+"""Materialized delegation resolutions.
+
+The ``delegation_resolutions`` table maps (scope, user) to the final
+delegatee of the user's chain, with its length, path and path hash, so
+"who casts my vote" is one indexed lookup at any graph size.
+
+Rows are maintained in the same transaction as delegation writes: a write
+re-resolves only the written delegator and the users whose chains reach it
+(its upstream subtree in that scope). Delegations that start or end with the
+passage of time are not writes, so ``rebuild`` should run periodically as a
+safety net.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.models.delegation import Delegation
+from backend.models.delegation_resolution import DelegationResolution
+
+from .cache import DelegationCache
+from .graph_index import DelegationGraphIndex
+from .repository import DelegationRepository
+from .repository_read import DelegationReadRepository
+
+# Hops resolved into a materialized path; longer chains are stored truncated
+RESOLUTION_MAX_DEPTH = 10
+
+
+class DelegationResolutionStore:
+    """Read and maintain the materialized delegation resolution table."""
+
+    def __init__(self, db: AsyncSession, cache: Optional[DelegationCache] = None):
+        self.db = db
+        self.cache = cache
+        self.repository = DelegationRepository(db)
+        self.chunk_size = 500
+
+    async def get_resolution(
+        self,
+        user_id: UUID,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+    ) -> Optional[DelegationResolution]:
+        """Get a user's resolution in a scope, or None if the user votes themselves."""
+        scope_key = self.scope_key(poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        result = await self.db.execute(
+            select(DelegationResolution).where(
+                and_(
+                    DelegationResolution.scope_key == scope_key,
+                    DelegationResolution.user_id == user_id,
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_poll_resolutions(
+        self, user_id: UUID, poll_ids: List[UUID]
+    ) -> Dict[str, DelegationResolution]:
+        """Get a user's resolutions in many poll scopes with one query, keyed by string poll ID.
+
+        Polls in which the user votes themselves have no entry.
+        """
+        scope_keys = {self.scope_key(poll_id=poll_id): str(poll_id) for poll_id in poll_ids}
+        if not scope_keys:
+            return {}
+        result = await self.db.execute(
+            select(DelegationResolution).where(
+                and_(
+                    DelegationResolution.scope_key.in_(list(scope_keys)),
+                    DelegationResolution.user_id == user_id,
+                )
+            )
+        )
+        return {
+            scope_keys[resolution.scope_key]: resolution
+            for resolution in result.scalars().all()
+        }
+
+    async def count_represented(
+        self,
+        delegatee_id: UUID,
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+    ) -> int:
+        """Number of users whose chains end at ``delegatee_id`` in a scope."""
+        scope_key = self.scope_key(poll_id, label_id, field_id, institution_id, value_id, idea_id)
+        result = await self.db.execute(
+            select(func.count(DelegationResolution.id)).where(
+                and_(
+                    DelegationResolution.scope_key == scope_key,
+                    DelegationResolution.final_delegatee_id == delegatee_id,
+                )
+            )
+        )
+        return result.scalar() or 0
+
+    async def refresh_after_write(self, delegation: Delegation) -> None:
+        """Re-point the resolutions affected by a created or revoked delegation."""
+        # Judge activity by this process's clock: a delegation created in the
+        # current transaction starts after the database's transaction-start now()
+        as_of = datetime.utcnow()
+        for scope in self.scopes_for_delegation(delegation):
+            user_ids = await self._upstream_users(delegation.delegator_id, scope, as_of)
+            chains = await self._resolve_chains(user_ids, scope, as_of)
+            await self._write(self.scope_key(**scope), chains)
+
+    async def rebuild(self) -> int:
+        """Recompute every resolution from the active delegations.
+
+        Returns:
+            int: Number of resolution rows written
+        """
+        as_of = datetime.utcnow()
+        scopes: Dict[str, Dict[str, str]] = {}
+        delegator_ids: Dict[str, set] = {}
+        for delegation in await self.repository.get_unexpired_delegations():
+            for scope in self.scopes_for_delegation(delegation):
+                scope_key = self.scope_key(**scope)
+                scopes[scope_key] = scope
+                delegator_ids.setdefault(scope_key, set()).add(str(delegation.delegator_id))
+
+        await self.db.execute(delete(DelegationResolution))
+        written = 0
+        for scope_key, scope in scopes.items():
+            chains = await self._resolve_chains(sorted(delegator_ids[scope_key]), scope, as_of)
+            written += await self._write(scope_key, chains)
+        return written
+
+    async def _upstream_users(
+        self, user_id: UUID, scope: Dict[str, str], as_of: Optional[datetime] = None
+    ) -> List[str]:
+        """The user plus everyone whose active delegations in the scope lead to them."""
+        seen = {str(user_id)}
+        frontier = [str(user_id)]
+        while frontier:
+            next_frontier = []
+            for start in range(0, len(frontier), self.chunk_size):
+                result = await self.db.execute(
+                    select(Delegation.delegator_id).where(
+                        and_(
+                            Delegation.delegatee_id.in_(frontier[start:start + self.chunk_size]),
+                            Delegation.is_deleted == False,
+                            Delegation.revoked_at.is_(None),
+                            *DelegationReadRepository._active_scope_conditions(
+                                Delegation, **scope, as_of=as_of
+                            ),
+                        )
+                    )
+                )
+                for delegator_id in result.scalars():
+                    delegator_id = str(delegator_id)
+                    if delegator_id not in seen:
+                        seen.add(delegator_id)
+                        next_frontier.append(delegator_id)
+            frontier = next_frontier
+        return list(seen)
+
+    async def _resolve_chains(
+        self, user_ids: List[str], scope: Dict[str, str], as_of: Optional[datetime] = None
+    ) -> Dict[str, List[Delegation]]:
+        # Imported here: the async dispatch layer pulls in the background tasks
+        from .dispatch_async import DelegationAsyncDispatch
+
+        return await DelegationAsyncDispatch(self.db, self.cache).resolve_delegation_chains_bulk(
+            user_ids, **scope, max_depth=RESOLUTION_MAX_DEPTH, as_of=as_of
+        )
+
+    async def _write(self, scope_key: str, chains: Dict[str, List[Delegation]]) -> int:
+        """Upsert the resolutions of resolved chains and drop those that ended."""
+        existing: Dict[str, DelegationResolution] = {}
+        user_ids = list(chains)
+        for start in range(0, len(user_ids), self.chunk_size):
+            result = await self.db.execute(
+                select(DelegationResolution).where(
+                    and_(
+                        DelegationResolution.scope_key == scope_key,
+                        DelegationResolution.user_id.in_(user_ids[start:start + self.chunk_size]),
+                    )
+                )
+            )
+            existing.update({str(row.user_id): row for row in result.scalars()})
+
+        written = 0
+        for user_id, chain in chains.items():
+            row = existing.get(user_id)
+            if not chain:
+                if row is not None:
+                    await self.db.delete(row)
+                continue
+
+            path = [user_id] + [str(delegation.delegatee_id) for delegation in chain]
+            path_hash = hashlib.sha256(
+                "|".join(str(delegation.id) for delegation in chain).encode()
+            ).hexdigest()
+            if row is None:
+                row = DelegationResolution(user_id=user_id, scope_key=scope_key)
+                self.db.add(row)
+            elif row.path_hash == path_hash:
+                continue
+            row.final_delegatee_id = path[-1]
+            row.chain_length = len(chain)
+            row.path = json.dumps(path)
+            row.path_hash = path_hash
+            row.resolved_at = datetime.utcnow()
+            written += 1
+
+        await self.db.flush()
+        return written
+
+    @staticmethod
+    def scope_key(
+        poll_id: Optional[UUID] = None,
+        label_id: Optional[UUID] = None,
+        field_id: Optional[UUID] = None,
+        institution_id: Optional[UUID] = None,
+        value_id: Optional[UUID] = None,
+        idea_id: Optional[UUID] = None,
+    ) -> str:
+        """Resolution table key for a scope: ``global`` or ``<target>:<id>``."""
+        name, value = DelegationGraphIndex.scope_key_for_target(
+            poll_id, label_id, field_id, institution_id, value_id, idea_id
+        )
+        return "global" if value is None else f"{name[:-len('_id')]}:{value}"
+
+    @staticmethod
+    def scopes_for_delegation(delegation: Delegation) -> List[Dict[str, str]]:
+        """Resolution scopes (as resolver keyword arguments) a delegation takes part in."""
+        return [
+            {} if value is None else {name: value}
+            for name, value in DelegationGraphIndex.scope_keys_for_delegation(delegation)
+        ]
+
+
+async def refresh_delegation_resolutions(
+    db: AsyncSession,
+    cache: Optional[DelegationCache],
+    delegations: Iterable[Delegation],
+) -> None:
+    """Re-point materialized resolutions after delegation writes, if enabled."""
+    if not get_settings().DELEGATION_RESOLUTION_TABLE_ENABLED:
+        return
+    store = DelegationResolutionStore(db, cache)
+    for delegation in delegations:
+        await store.refresh_after_write(delegation)
@@ -0,0 +1,145 @@
+"""Stampede protection for delegation chain cache misses.
+
+When a popular chain expires, every concurrent request would miss together
+and resolve it from the database. The guard lets one of them do the work:
+
+* within a process, concurrent misses on the same key share one resolution
+  (single flight);
+* across workers, the resolver holds a short Redis lease and the others
+  wait for its result to land in the cache, resolving themselves only if
+  it has not arrived when the lease runs out;
+* ahead of expiry, hits refresh the entry early with a probability that
+  rises as its TTL runs down (XFetch), so hot keys rarely expire at all.
+  The window scales with the measured resolution time, floored by
+  ``DELEGATION_CACHE_RECOMPUTE_FLOOR_SECONDS``, times
+  ``DELEGATION_CACHE_EARLY_REFRESH_BETA``.
+"""
+
+import asyncio
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from backend.config import get_settings
+from backend.models.delegation import Delegation
+
+from .cache import DelegationCache
+from .chain_resolution import ChainResolutionCore
+
+LEASE_PREFIX = "delegation:lease"
+
+
+class ChainStampedeGuard:
+    """Coalesce concurrent resolutions of the same chain cache key."""
+
+    def __init__(
+        self,
+        lease_seconds: float = 2.0,
+        poll_interval_seconds: float = 0.05,
+        early_refresh_beta: Optional[float] = None,
+        recompute_floor_seconds: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.lease_seconds = lease_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.early_refresh_beta = (
+            settings.DELEGATION_CACHE_EARLY_REFRESH_BETA
+            if early_refresh_beta is None
+            else early_refresh_beta
+        )
+        self.recompute_floor_seconds = (
+            settings.DELEGATION_CACHE_RECOMPUTE_FLOOR_SECONDS
+            if recompute_floor_seconds is None
+            else recompute_floor_seconds
+        )
+        # Moving average of how long a resolution takes in this process,
+        # seeded by the first one measured
+        self.recompute_seconds: Optional[float] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def should_refresh_early(self, remaining_seconds: Optional[float]) -> bool:
+        """XFetch: refresh with probability rising as the entry nears expiry."""
+        if remaining_seconds is None:
+            return False
+        recompute_seconds = max(self.recompute_seconds or 0.0, self.recompute_floor_seconds)
+        jitter = -math.log(1.0 - random.random())
+        return remaining_seconds <= recompute_seconds * self.early_refresh_beta * jitter
+
+    async def run(
+        self,
+        cache: DelegationCache,
+        cache_key: str,
+        resolve: Callable[[], Awaitable[List[Delegation]]],
+    ) -> List[Delegation]:
+        """Resolve a chain at most once per key at a time, process- and cluster-wide.
+
+        ``resolve`` must cache the chain it resolves, so that other workers
+        waiting on the lease find it.
+        """
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            chain_data = await asyncio.shield(inflight)
+            if chain_data is not None:
+                return ChainResolutionCore.deserialize_chain(chain_data)
+            # The shared resolution failed; resolve on our own
+            return await resolve()
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        chain_data: Optional[List[Dict[str, Any]]] = None
+        try:
+            chain = await self._resolve_with_lease(cache, cache_key, resolve)
+            chain_data = ChainResolutionCore.serialize_chain(chain)
+            return chain
+        finally:
+            del self._inflight[cache_key]
+            future.set_result(chain_data)
+
+    async def _resolve_with_lease(
+        self,
+        cache: DelegationCache,
+        cache_key: str,
+        resolve: Callable[[], Awaitable[List[Delegation]]],
+    ) -> List[Delegation]:
+        lease_key = f"{LEASE_PREFIX}:{cache_key}"
+        try:
+            acquired = await cache.redis.set(
+                lease_key, "1", nx=True, px=int(self.lease_seconds * 1000)
+            )
+        except Exception:
+            # Without Redis there is nothing to coordinate with
+            acquired = True
+
+        if not acquired:
+            # Another worker is resolving: wait for its result to be cached
+            deadline = time.monotonic() + self.lease_seconds
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.poll_interval_seconds)
+                cached_chain_data = await cache.get_cached_chain(cache_key)
+                if cached_chain_data is not None:
+                    return ChainResolutionCore.deserialize_chain(cached_chain_data)
+
+        start_time = time.monotonic()
+        try:
+            chain = await resolve()
+        finally:
+            if acquired:
+                try:
+                    await cache.redis.delete(lease_key)
+                except Exception:
+                    pass
+        elapsed = time.monotonic() - start_time
+        if self.recompute_seconds is None:
+            self.recompute_seconds = elapsed
+        else:
+            self.recompute_seconds = 0.8 * self.recompute_seconds + 0.2 * elapsed
+        return chain
+
+
+_chain_stampede_guard = ChainStampedeGuard()
+
+
+def get_chain_stampede_guard() -> ChainStampedeGuard:
+    """Get the process-wide chain stampede guard."""
+    return _chain_stampede_guard
@@ -0,0 +1,186 @@
+"""Whole-graph delegation statistics.
+
+Statistics are computed exactly over every active delegation of a scope:
+the edges are loaded with one query, mapped to integer node indices, and
+every chain is resolved at once. With NumPy available this uses vectorized
+pointer jumping (O(n log n) array operations); otherwise a linear memoized
+walk in pure Python.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .repository import DelegationRepository
+
+# Try to import numpy, fallback to pure Python if not available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+TOP_DELEGATEES_LIMIT = 10
+
+
+class DelegationStatsCore:
+    """Pure whole-graph statistics over delegation edges (no side effects)."""
+
+    @staticmethod
+    def compute(
+        edges: Sequence[Tuple[str, str]], use_numpy: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Compute delegation statistics from (delegator_id, delegatee_id) edges.
+
+        Edges must be grouped by delegator in resolution priority order: the
+        first edge of a delegator is the one its chain follows. Chain length
+        is the number of delegation hops from a delegator to the user who
+        ends its chain; delegators whose chains run into a cycle are excluded
+        from the length statistics and their cycles counted instead.
+        """
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+
+        index: Dict[str, int] = {}
+        delegatee_indices: List[int] = []
+        next_hop: Dict[int, int] = {}
+        for delegator_id, delegatee_id in edges:
+            delegator = index.setdefault(str(delegator_id), len(index))
+            delegatee = index.setdefault(str(delegatee_id), len(index))
+            delegatee_indices.append(delegatee)
+            next_hop.setdefault(delegator, delegatee)
+
+        node_count = len(index)
+        # Users without a delegation point at the sentinel node ``node_count``
+        next_index = [node_count] * node_count
+        for delegator, delegatee in next_hop.items():
+            next_index[delegator] = delegatee
+
+        if use_numpy:
+            lengths, cyclic, cycles = DelegationStatsCore._resolve_numpy(next_index)
+            delegators = np.fromiter(next_hop, dtype=np.int64, count=len(next_hop))
+            chain_lengths = lengths[delegators[~cyclic[delegators]]]
+            avg_chain_length = float(chain_lengths.mean()) if chain_lengths.size else 0.0
+            max_chain_length = int(chain_lengths.max()) if chain_lengths.size else 0
+
+            counts = np.bincount(
+                np.asarray(delegatee_indices, dtype=np.int64), minlength=node_count
+            )
+            top = np.argsort(-counts, kind="stable")[:TOP_DELEGATEES_LIMIT]
+            top_counts = [(int(node), int(counts[node])) for node in top if counts[node] > 0]
+        else:
+            lengths, cyclic, cycles = DelegationStatsCore._resolve_python(next_index)
+            chain_lengths = [
+                lengths[delegator] for delegator in next_hop if not cyclic[delegator]
+            ]
+            avg_chain_length = (
+                sum(chain_lengths) / len(chain_lengths) if chain_lengths else 0.0
+            )
+            max_chain_length = max(chain_lengths, default=0)
+            top_counts = Counter(delegatee_indices).most_common(TOP_DELEGATEES_LIMIT)
+
+        ids = list(index)
+        return {
+            "active_delegations": len(delegatee_indices),
+            "unique_delegators": len(next_hop),
+            "unique_delegatees": len(set(delegatee_indices)),
+            "avg_chain_length": avg_chain_length,
+            "max_chain_length": max_chain_length,
+            "cycles_detected": cycles,
+            "top_delegatees": [(ids[node], count) for node, count in top_counts],
+        }
+
+    @staticmethod
+    def _resolve_python(next_index: List[int]) -> Tuple[List[int], List[bool], int]:
+        """Chain lengths, cycle membership and cycle count by a memoized walk."""
+        node_count = len(next_index)
+        lengths = [0] * node_count
+        cyclic = [False] * node_count
+        done = [False] * node_count
+        cycles = 0
+
+        for start in range(node_count):
+            path: List[int] = []
+            position: Dict[int, int] = {}
+            node = start
+            while node != node_count and not done[node] and node not in position:
+                position[node] = len(path)
+                path.append(node)
+                node = next_index[node]
+
+            if node != node_count and node in position:
+                # Found a new cycle: its members and everything leading into it
+                cycles += 1
+                for member in path[position[node]:]:
+                    cyclic[member] = done[member] = True
+                path = path[:position[node]]
+                leads_to_cycle = True
+            else:
+                leads_to_cycle = node != node_count and cyclic[node]
+
+            length = -1 if node == node_count else lengths[node]
+            for member in reversed(path):
+                if leads_to_cycle:
+                    cyclic[member] = True
+                else:
+                    length += 1
+                    lengths[member] = length
+                done[member] = True
+
+        return lengths, cyclic, cycles
+
+    @staticmethod
+    def _resolve_numpy(next_index: List[int]) -> Tuple[Any, Any, int]:
+        """Chain lengths, cycle membership and cycle count by pointer jumping."""
+        node_count = len(next_index)
+        pointer = np.asarray(next_index + [node_count], dtype=np.int64)
+        lengths = (pointer != node_count).astype(np.int64)
+
+        # After k rounds every pointer has jumped 2**k hops (or hit the sentinel)
+        for _ in range(max(1, node_count.bit_length())):
+            lengths = lengths + lengths[pointer]
+            pointer = pointer[pointer]
+
+        cyclic = pointer[:node_count] != node_count
+
+        # Pointers of cyclic nodes have landed on cycles; count distinct cycles
+        cycles = 0
+        on_counted_cycle = set()
+        for landing in np.unique(pointer[:node_count][cyclic]).tolist():
+            if landing in on_counted_cycle:
+                continue
+            cycles += 1
+            node = landing
+            while node not in on_counted_cycle:
+                on_counted_cycle.add(node)
+                node = next_index[node]
+
+        return lengths[:node_count], cyclic, cycles
+
+
+class DelegationStatsEngine:
+    """Exact delegation statistics for a scope, loaded with a single query."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = DelegationRepository(db)
+
+    async def calculate(self, poll_id: Optional[UUID] = None) -> Dict[str, Any]:
+        """Calculate statistics for poll-scoped (or, without a poll, global) delegations.
+
+        Returns:
+            Dict[str, Any]: Complete statistics in the delegation stats format
+        """
+        rows = await self.repository.get_delegation_edges(poll_id)
+
+        stats = DelegationStatsCore.compute(
+            [(row.delegator_id, row.delegatee_id) for row in rows]
+        )
+        stats["orphaned_delegations"] = sum(
+            (not row.delegator_exists) + (not row.delegatee_exists) for row in rows
+        )
+        stats["poll_id"] = str(poll_id) if poll_id else None
+        return stats
@@ -265,6 +265,25 @@ class DelegationTelemetry:
             },
         )
 
+    @staticmethod
+    def log_batch_cache_lookup(outcomes: Dict[str, str], total_time: float) -> None:
+        """Log a batch chain cache lookup with the outcome of every key."""
+        l1_hits = sum(1 for outcome in outcomes.values() if outcome == "l1")
+        l2_hits = sum(1 for outcome in outcomes.values() if outcome == "l2")
+        misses = len(outcomes) - l1_hits - l2_hits
+        logger.info(
+            f"Batch chain cache lookup: {len(outcomes)} keys in {total_time:.3f}s (l1: {l1_hits}, l2: {l2_hits}, miss: {misses})",
+            extra={
+                "operation": "batch_cache_lookup",
+                "key_count": len(outcomes),
+                "l1_hits": l1_hits,
+                "l2_hits": l2_hits,
+                "misses": misses,
+                "total_time_ms": int(total_time * 1000),
+                "outcomes": outcomes,
+            },
+        )
+
     @staticmethod
     def log_delegation_creation(
         delegation_id: UUID,
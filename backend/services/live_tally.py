@@ -0,0 +1,463 @@
+"""Live poll tallies maintained incrementally in Redis.
+
+For open polls, per-option direct, delegated and total counts are kept in a
+Redis hash so that results can be served in O(options) without touching votes
+or delegations. Vote and delegation writes apply deltas to the hash, and a
+reconciliation job recomputes tallies from the database to correct any drift.
+
+The hash is only trusted once it carries the ``_seeded`` marker written by a
+full tally; deltas applied to an unseeded hash are harmless because the next
+read replaces it. Every Redis failure is logged and swallowed, so callers
+fall back to a database tally.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import settings
+from backend.core.logging_config import get_logger
+from backend.core.post_commit import defer_until_commit
+from backend.core.redis import get_redis_client
+from backend.models.delegation import Delegation
+from backend.models.poll import Poll, PollStatus
+from backend.models.poll_label import poll_labels
+from backend.models.vote import Vote
+from backend.schemas.poll import PollResult
+from backend.services.poll_tally import PollTallyCore, PollTallyEngine, is_poll_open
+
+logger = get_logger(__name__)
+
+TALLY_KEY_PREFIX = "poll:tally:"
+SEEDED_FIELD = "_seeded"
+TALLY_TTL_SECONDS = 24 * 60 * 60
+
+
+def tally_key(poll_id) -> str:
+    """Redis key of the live tally hash for a poll."""
+    return f"{TALLY_KEY_PREFIX}{poll_id}"
+
+
+@dataclass
+class TallyDelta:
+    """Pending per-option count changes for a single poll."""
+
+    direct: Dict[str, int] = field(default_factory=dict)
+    delegated: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, option_id, direct: int = 0, delegated: int = 0) -> None:
+        option_id = str(option_id)
+        if direct:
+            self.direct[option_id] = self.direct.get(option_id, 0) + direct
+        if delegated:
+            self.delegated[option_id] = self.delegated.get(option_id, 0) + delegated
+
+    def fields(self) -> Dict[str, int]:
+        """Hash field increments, including the derived totals."""
+        increments: Dict[str, int] = {}
+        for option_id in set(self.direct) | set(self.delegated):
+            direct = self.direct.get(option_id, 0)
+            delegated = self.delegated.get(option_id, 0)
+            for name, value in (
+                ("direct", direct),
+                ("delegated", delegated),
+                ("total", direct + delegated),
+            ):
+                if value:
+                    increments[f"{option_id}:{name}"] = value
+        return increments
+
+
+@dataclass
+class RouteSnapshot:
+    """Where a delegator's block of weight was routed before a delegation write.
+
+    ``routes`` maps poll_id -> (label_ids, option_id or None).
+    """
+
+    delegator_id: str
+    routes: Dict[str, Tuple[List[str], Optional[str]]] = field(default_factory=dict)
+
+
+class LiveTallyService:
+    """Reads, seeds and patches live poll tallies."""
+
+    def __init__(self, db: AsyncSession, redis_client=None):
+        self.db = db
+        self.redis_client = redis_client
+        self.engine = PollTallyEngine(db)
+
+    async def _redis(self):
+        if self.redis_client is None:
+            self.redis_client = await get_redis_client()
+        return self.redis_client
+
+    async def get_results(self, poll_id) -> Optional[List[PollResult]]:
+        """Read a poll's live tally, or None if it is not seeded (or Redis is unavailable)."""
+        try:
+            redis_client = await self._redis()
+            data = await redis_client.hgetall(tally_key(poll_id))
+        except Exception as e:
+            logger.warning(
+                "Failed to read live tally",
+                extra={"poll_id": str(poll_id), "error": str(e)},
+            )
+            return None
+        if not data or SEEDED_FIELD not in data:
+            return None
+        return self._decode(data)
+
+    async def seed(self, poll_id, results: Sequence[PollResult]) -> None:
+        """Replace a poll's live tally with freshly computed results."""
+        mapping = {SEEDED_FIELD: "1"}
+        for position, result in enumerate(results):
+            option_id = str(result.option_id)
+            mapping[f"{option_id}:pos"] = position
+            mapping[f"{option_id}:text"] = result.text
+            mapping[f"{option_id}:direct"] = result.direct_votes
+            mapping[f"{option_id}:delegated"] = result.delegated_votes
+            mapping[f"{option_id}:total"] = result.total_votes
+
+        try:
+            redis_client = await self._redis()
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.delete(tally_key(poll_id))
+                pipe.hset(tally_key(poll_id), mapping=mapping)
+                pipe.expire(tally_key(poll_id), TALLY_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "Failed to seed live tally",
+                extra={"poll_id": str(poll_id), "error": str(e)},
+            )
+
+    async def apply(self, poll_id, delta: TallyDelta) -> None:
+        """Apply count changes to a poll's live tally in one transaction."""
+        increments = delta.fields()
+        if not increments:
+            return
+        try:
+            redis_client = await self._redis()
+            async with redis_client.pipeline(transaction=True) as pipe:
+                for name, value in increments.items():
+                    pipe.hincrby(tally_key(poll_id), name, value)
+                pipe.expire(tally_key(poll_id), TALLY_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "Failed to apply live tally delta",
+                extra={"poll_id": str(poll_id), "error": str(e)},
+            )
+
+    async def record_vote_cast(self, vote: Vote) -> None:
+        """Credit a new direct vote and re-route the voter's upstream block to it."""
+        poll = await self._load_open_poll(vote.poll_id)
+        if poll is None:
+            return
+        label_ids = [label.id for label in poll.labels or []]
+        user_id = str(vote.user_id)
+
+        block = await self.engine.count_upstream_block(poll.id, label_ids, user_id)
+        previous = await self.engine.resolve_downstream(poll.id, label_ids, user_id)
+
+        delta = TallyDelta()
+        delta.add(vote.option_id, direct=vote.weight or 1, delegated=block - 1)
+        if previous is not None:
+            delta.add(previous, delegated=-block)
+        await self.apply(poll.id, delta)
+
+    async def record_vote_removed(self, vote: Vote) -> None:
+        """Remove a direct vote and send the voter's block down their delegation chain."""
+        poll = await self._load_open_poll(vote.poll_id)
+        if poll is None:
+            return
+        label_ids = [label.id for label in poll.labels or []]
+        user_id = str(vote.user_id)
+
+        block = await self.engine.count_upstream_block(poll.id, label_ids, user_id)
+        following = await self.engine.resolve_downstream(poll.id, label_ids, user_id)
+
+        delta = TallyDelta()
+        delta.add(vote.option_id, direct=-(vote.weight or 1), delegated=-(block - 1))
+        if following is not None:
+            delta.add(following, delegated=block)
+        await self.apply(poll.id, delta)
+
+    async def record_vote_changed(
+        self, vote: Vote, previous_option_id, previous_weight: Optional[int]
+    ) -> None:
+        """Move a vote (and the weight delegated to it) between options."""
+        option_changed = str(previous_option_id) != str(vote.option_id)
+        if not option_changed and (previous_weight or 1) == (vote.weight or 1):
+            return
+        poll = await self._load_open_poll(vote.poll_id)
+        if poll is None:
+            return
+
+        delta = TallyDelta()
+        delta.add(previous_option_id, direct=-(previous_weight or 1))
+        delta.add(vote.option_id, direct=vote.weight or 1)
+        if option_changed:
+            label_ids = [label.id for label in poll.labels or []]
+            block = await self.engine.count_upstream_block(
+                poll.id, label_ids, str(vote.user_id)
+            )
+            delta.add(previous_option_id, delegated=-(block - 1))
+            delta.add(vote.option_id, delegated=block - 1)
+        await self.apply(poll.id, delta)
+
+    async def capture_routes(
+        self,
+        delegator_id,
+        poll_id=None,
+        label_id=None,
+        other_scope: bool = False,
+    ) -> RouteSnapshot:
+        """Record where a delegator's weight goes in affected open polls, before a write.
+
+        Only poll, label and global delegations take part in poll tallies, so
+        delegations scoped to fields, institutions, values or ideas
+        (``other_scope``) affect nothing. Routes are resolved for
+        ``LIVE_TALLY_DELTA_BATCH_SIZE`` polls at a time, with one pair of
+        queries per chain hop for the whole batch.
+        """
+        snapshot = RouteSnapshot(delegator_id=str(delegator_id))
+        if other_scope:
+            return snapshot
+
+        polls = await self._load_affected_open_polls(poll_id, label_id)
+        voted = await self._polls_voted_in(snapshot.delegator_id, [poll.id for poll in polls])
+        # A direct vote overrides the delegator's delegations for that poll
+        scopes = {
+            poll.id: [label.id for label in poll.labels or []]
+            for poll in polls
+            if poll.id not in voted
+        }
+        delegator_id = snapshot.delegator_id
+        for batch in _batches(scopes, settings.LIVE_TALLY_DELTA_BATCH_SIZE):
+            routes = await self.engine.resolve_downstream_many(batch, delegator_id)
+            for batch_poll_id, label_ids in batch.items():
+                snapshot.routes[batch_poll_id] = (label_ids, routes[batch_poll_id])
+        return snapshot
+
+    async def apply_route_changes(self, snapshot: RouteSnapshot) -> None:
+        """Move the delegator's block from its old route to the route after the write.
+
+        The block behind the delegator does not depend on the delegator's own
+        delegations, so it is only counted, after the write, in the polls
+        whose route actually changed.
+        """
+        delegator_id = snapshot.delegator_id
+        scopes = {poll_id: route[0] for poll_id, route in snapshot.routes.items()}
+        for batch in _batches(scopes, settings.LIVE_TALLY_DELTA_BATCH_SIZE):
+            routes = await self.engine.resolve_downstream_many(batch, delegator_id)
+            changed = {
+                poll_id: label_ids
+                for poll_id, label_ids in batch.items()
+                if routes[poll_id] != snapshot.routes[poll_id][1]
+            }
+            if not changed:
+                continue
+
+            blocks = await self.engine.count_upstream_blocks(changed, delegator_id)
+            for poll_id in changed:
+                previous, current = snapshot.routes[poll_id][1], routes[poll_id]
+                delta = TallyDelta()
+                if previous is not None:
+                    delta.add(previous, delegated=-blocks[poll_id])
+                if current is not None:
+                    delta.add(current, delegated=blocks[poll_id])
+                await self.apply(poll_id, delta)
+
+    async def reconcile_poll(self, poll: Poll) -> bool:
+        """Recompute a poll's tally from the database and fix its live tally if it drifted.
+
+        Returns:
+            bool: True if the live tally was corrected
+        """
+        live = await self.get_results(poll.id)
+        if live is None:
+            return False  # Not seeded; the next read seeds it
+
+        results = PollTallyCore.tally(await self.engine.load_input(poll))
+        expected = {
+            str(r.option_id): (r.direct_votes, r.delegated_votes) for r in results
+        }
+        actual = {
+            str(r.option_id): (r.direct_votes, r.delegated_votes) for r in live
+        }
+        if expected == actual:
+            return False
+
+        logger.warning(
+            "Live tally drift corrected",
+            extra={"poll_id": poll.id, "expected": expected, "actual": actual},
+        )
+        await self.seed(poll.id, results)
+        return True
+
+    async def reconcile_open_polls(self) -> Dict[str, int]:
+        """Reconcile the live tallies of all open polls.
+
+        Returns:
+            Dict[str, int]: Number of polls checked and corrected
+        """
+        polls = await self._load_affected_open_polls(None, None)
+        corrected = 0
+        for poll in polls:
+            if await self.reconcile_poll(poll):
+                corrected += 1
+        logger.info(
+            "Reconciled live tallies",
+            extra={"checked": len(polls), "corrected": corrected},
+        )
+        return {"checked": len(polls), "corrected": corrected}
+
+    async def reconcile_scopes(
+        self, scopes: Sequence[Tuple[Optional[str], Optional[str]]]
+    ) -> int:
+        """Reconcile the live tallies of the open polls reached by delegation scopes.
+
+        Args:
+            scopes: ``(poll_id, label_id)`` pairs; ``(None, None)`` is the global scope
+
+        Returns:
+            int: Number of polls corrected
+        """
+        polls: Dict[str, Poll] = {}
+        for poll_id, label_id in dict.fromkeys(scopes):
+            for poll in await self._load_affected_open_polls(poll_id, label_id):
+                polls[poll.id] = poll
+            if poll_id is None and label_id is None:
+                break  # The global scope reaches every open poll
+
+        corrected = 0
+        for poll in polls.values():
+            if await self.reconcile_poll(poll):
+                corrected += 1
+        return corrected
+
+    async def _load_open_poll(self, poll_id) -> Optional[Poll]:
+        poll = await self.engine.load_poll(poll_id)
+        if poll is None or not is_poll_open(poll):
+            return None
+        return poll
+
+    async def _load_affected_open_polls(self, poll_id, label_id) -> List[Poll]:
+        """Open polls whose tally a delegation with this scope can change."""
+        query = select(Poll).where(
+            and_(
+                Poll.is_deleted == False,
+                Poll.status.notin_([PollStatus.CLOSED, PollStatus.ARCHIVED]),
+                or_(Poll.end_date.is_(None), Poll.end_date > func.now()),
+            )
+        )
+        if poll_id is not None:
+            query = query.where(Poll.id == poll_id)
+        elif label_id is not None:
+            query = query.where(
+                Poll.id.in_(
+                    select(poll_labels.c.poll_id).where(poll_labels.c.label_id == label_id)
+                )
+            )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def _polls_voted_in(self, user_id: str, poll_ids: Sequence[str]) -> set:
+        if not poll_ids:
+            return set()
+        result = await self.db.execute(
+            select(Vote.poll_id).where(
+                and_(
+                    Vote.user_id == user_id,
+                    Vote.is_deleted == False,
+                    Vote.poll_id.in_(poll_ids),
+                )
+            )
+        )
+        return set(result.scalars().all())
+
+    @staticmethod
+    def _decode(data: Dict[str, str]) -> List[PollResult]:
+        options: Dict[str, Dict[str, str]] = {}
+        for name, value in data.items():
+            if name == SEEDED_FIELD:
+                continue
+            option_id, _, attribute = name.rpartition(":")
+            options.setdefault(option_id, {})[attribute] = value
+
+        ordered = sorted(options.items(), key=lambda item: int(item[1].get("pos", 0)))
+        results = [
+            PollResult(
+                option_id=option_id,
+                text=values.get("text", ""),
+                direct_votes=int(values.get("direct", 0)),
+                delegated_votes=int(values.get("delegated", 0)),
+                total_votes=int(values.get("total", 0)),
+            )
+            for option_id, values in ordered
+        ]
+        results.sort(key=lambda x: x.total_votes, reverse=True)
+        return results
+
+
+async def capture_delegation_routes(
+    db: AsyncSession, delegation: Delegation
+) -> Optional[RouteSnapshot]:
+    """Snapshot the live tally routes a delegation write can change, if enabled."""
+    if not settings.LIVE_TALLY_ENABLED:
+        return None
+    try:
+        return await LiveTallyService(db).capture_routes(
+            delegation.delegator_id,
+            poll_id=delegation.poll_id,
+            label_id=delegation.label_id,
+            other_scope=_has_other_scope(delegation),
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to capture live tally routes",
+            extra={"delegator_id": str(delegation.delegator_id), "error": str(e)},
+        )
+        return None
+
+
+def defer_route_changes(db: AsyncSession, snapshot: Optional[RouteSnapshot]) -> None:
+    """Apply a delegation write's live tally deltas once its transaction commits."""
+    if snapshot is None or not snapshot.routes:
+        return
+
+    async def _apply() -> None:
+        await LiveTallyService(db).apply_route_changes(snapshot)
+
+    defer_until_commit(db, _apply)
+
+
+def tally_scope(
+    delegation: Delegation,
+) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """The ``(poll_id, label_id)`` scope a delegation has in poll tallies, if any."""
+    if _has_other_scope(delegation):
+        return None
+    return (delegation.poll_id, delegation.label_id)
+
+
+def _has_other_scope(delegation: Delegation) -> bool:
+    """Whether a delegation is scoped to something poll tallies ignore."""
+    return any(
+        (
+            delegation.field_id,
+            delegation.institution_id,
+            delegation.value_id,
+            delegation.idea_id,
+        )
+    )
+
+
+def _batches(items: Dict[str, List[str]], size: int) -> Iterable[Dict[str, List[str]]]:
+    """Split a mapping into consecutive mappings of at most ``size`` entries."""
+    keys = list(items)
+    for start in range(0, len(keys), size):
+        yield {key: items[key] for key in keys[start:start + size]}
@@ -1,14 +1,17 @@
-from typing import List, Dict, Any
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
-from sqlalchemy import select, and_
+from sqlalchemy import and_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.config import settings
 from backend.models.poll import Poll
-from backend.models.option import Option
-from backend.models.vote import Vote
-from backend.models.delegation import Delegation
-from backend.models.label import Label
+from backend.models.poll_result_snapshot import PollResultSnapshot
 from backend.schemas.poll import PollResult
+from backend.services.live_tally import LiveTallyService
+from backend.services.poll_tally import PollTallyCore, PollTallyEngine, is_poll_open
 from backend.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -17,169 +20,230 @@ logger = get_logger(__name__)
 async def get_poll_results(poll_id: UUID, db: AsyncSession) -> List[PollResult]:
     """
     Get poll results with delegation support.
-    
+
+    Direct votes and the delegations whose chains reach the poll's voters are
+    loaded with one set-based query per delegation hop; delegated weight is
+    propagated transitively in memory by the tally engine, so each delegator
+    counts towards the option of the first voter in its chain.
+
+    When live tallies are enabled, open polls are served from the Redis
+    counters maintained by vote and delegation writes, and seeded from a full
+    tally on a miss.
+
     Args:
         poll_id: ID of the poll
         db: Database session
-        
+
     Returns:
         List[PollResult]: List of poll results with vote counts
     """
+    engine = PollTallyEngine(db)
+
     # First, verify the poll exists
-    poll_result = await db.execute(
-        select(Poll).where(
-            and_(
-                Poll.id == poll_id,
-                Poll.is_deleted == False
-            )
-        )
-    )
-    poll = poll_result.scalar_one_or_none()
+    poll = await engine.load_poll(poll_id)
     if not poll:
         raise ValueError(f"Poll with id {poll_id} not found")
-    
-    # Get all options for the poll
-    options_result = await db.execute(
-        select(Option).where(
-            and_(
-                Option.poll_id == poll_id,
-                Option.is_deleted == False
-            )
+
+    live_tally = None
+    if settings.LIVE_TALLY_ENABLED and is_poll_open(poll):
+        live_tally = LiveTallyService(db)
+        results = await live_tally.get_results(poll.id)
+        if results is not None:
+            return results
+
+    results = await _calculate_poll_results(engine, poll)
+    if live_tally is not None and results:
+        await live_tally.seed(poll.id, results)
+    return results
+
+
+async def get_closed_poll_snapshot(
+    poll_id: UUID, db: AsyncSession
+) -> Optional[PollResultSnapshot]:
+    """
+    Get the immutable results snapshot of a closed poll.
+
+    An existing snapshot is served with a single indexed read. The first
+    request after a poll closes (status closed/archived or end_date passed)
+    computes the final results once and persists them.
+
+    Args:
+        poll_id: ID of the poll
+        db: Database session
+
+    Returns:
+        Optional[PollResultSnapshot]: The snapshot, or None if the poll is still open
+
+    Raises:
+        ValueError: If the poll does not exist
+    """
+    snapshot = await _load_snapshot(poll_id, db)
+    if snapshot is not None:
+        return snapshot
+
+    engine = PollTallyEngine(db)
+    poll = await engine.load_poll(poll_id)
+    if not poll:
+        raise ValueError(f"Poll with id {poll_id} not found")
+    if is_poll_open(poll):
+        return None
+
+    results = await _calculate_poll_results(engine, poll)
+    snapshot = _build_snapshot(poll.id, results)
+    db.add(snapshot)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent request persisted the snapshot first
+        await db.rollback()
+        return await _load_snapshot(poll_id, db)
+
+    logger.info(
+        "Persisted poll results snapshot",
+        extra={"poll_id": poll_id, "etag": snapshot.etag},
+    )
+    return snapshot
+
+
+async def get_poll_results_batch(
+    poll_ids: Iterable[UUID], db: AsyncSession
+) -> Dict[str, List[PollResult]]:
+    """
+    Get the results of several polls with shared queries.
+
+    Closed polls are served from their snapshots, read with one query, and
+    open polls from live tallies when enabled. The remaining polls are
+    tallied together: their options, direct vote totals, delegations and
+    voter choices are each loaded once for the whole batch. Snapshots of
+    closed polls computed on the way are persisted in a single commit.
+
+    Args:
+        poll_ids: IDs of the polls
+        db: Database session
+
+    Returns:
+        Dict[str, List[PollResult]]: Results keyed by poll ID, in request
+        order; polls that do not exist are left out
+    """
+    poll_ids = list(dict.fromkeys(str(poll_id) for poll_id in poll_ids))
+    results: Dict[str, List[PollResult]] = {}
+
+    for snapshot in await _load_snapshots(poll_ids, db):
+        results[str(snapshot.poll_id)] = [
+            PollResult.model_validate(item) for item in json.loads(snapshot.payload)
+        ]
+
+    engine = PollTallyEngine(db)
+    pending = [poll_id for poll_id in poll_ids if poll_id not in results]
+    polls = await engine.load_polls(pending) if pending else []
+
+    live_tally = None
+    to_seed = set()
+    to_calculate: List[Poll] = []
+    for poll in polls:
+        if settings.LIVE_TALLY_ENABLED and is_poll_open(poll):
+            live_tally = live_tally or LiveTallyService(db)
+            live_results = await live_tally.get_results(poll.id)
+            if live_results is not None:
+                results[str(poll.id)] = live_results
+                continue
+            to_seed.add(poll.id)
+        to_calculate.append(poll)
+
+    if to_calculate:
+        tally_inputs = await engine.load_inputs(to_calculate)
+        snapshots = []
+        for poll in to_calculate:
+            tally_input = tally_inputs[poll.id]
+            poll_results = PollTallyCore.tally(tally_input) if tally_input.options else []
+            results[str(poll.id)] = poll_results
+            if poll.id in to_seed and poll_results:
+                await live_tally.seed(poll.id, poll_results)
+            elif not is_poll_open(poll):
+                snapshots.append(_build_snapshot(poll.id, poll_results))
+
+        if snapshots:
+            db.add_all(snapshots)
+            try:
+                await db.commit()
+            except IntegrityError:
+                # A concurrent request persisted some of them first; the
+                # results computed here are final all the same
+                await db.rollback()
+
+        logger.info(
+            "Calculated poll results batch",
+            extra={
+                "polls_count": len(to_calculate),
+                "snapshots_count": len(snapshots),
+            },
         )
+
+    return {poll_id: results[poll_id] for poll_id in poll_ids if poll_id in results}
+
+
+def serialize_poll_results(results: List[PollResult]) -> bytes:
+    """Serialize poll results to the exact JSON body served by the results endpoint."""
+    return json.dumps(
+        [result.model_dump(mode="json") for result in results],
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _build_snapshot(poll_id, results: List[PollResult]) -> PollResultSnapshot:
+    payload = serialize_poll_results(results)
+    return PollResultSnapshot(
+        poll_id=poll_id,
+        payload=payload,
+        etag=hashlib.sha256(payload).hexdigest(),
     )
-    options = options_result.scalars().all()
-    
-    if not options:
-        return []
-    
-    # Get all direct votes for this poll
-    votes_result = await db.execute(
-        select(Vote).where(
+
+
+async def _load_snapshots(poll_ids: List[str], db: AsyncSession) -> List[PollResultSnapshot]:
+    result = await db.execute(
+        select(PollResultSnapshot)
+        .join(Poll, Poll.id == PollResultSnapshot.poll_id)
+        .where(
             and_(
-                Vote.poll_id == poll_id,
-                Vote.is_deleted == False
+                PollResultSnapshot.poll_id.in_(poll_ids),
+                PollResultSnapshot.is_deleted == False,
+                Poll.is_deleted == False,
             )
         )
     )
-    direct_votes = votes_result.scalars().all()
-    
-    # Get all active delegations (global and label-specific)
-    delegations_result = await db.execute(
-        select(Delegation).where(
+    return list(result.scalars().all())
+
+
+async def _load_snapshot(poll_id: UUID, db: AsyncSession) -> Optional[PollResultSnapshot]:
+    result = await db.execute(
+        select(PollResultSnapshot)
+        .join(Poll, Poll.id == PollResultSnapshot.poll_id)
+        .where(
             and_(
-                Delegation.is_deleted == False
+                PollResultSnapshot.poll_id == poll_id,
+                PollResultSnapshot.is_deleted == False,
+                Poll.is_deleted == False,
             )
         )
     )
-    delegations = delegations_result.scalars().all()
-    
-    # Get poll labels for label-specific delegation matching
-    poll_labels_result = await db.execute(
-        select(Poll.labels).where(Poll.id == poll_id)
-    )
-    poll_labels = poll_labels_result.scalar_one_or_none() or []
-    
-    # Create a mapping of option_id to vote counts
-    option_votes: Dict[UUID, Dict[str, int]] = {}
-    
-    # Initialize all options with zero votes
-    for option in options:
-        option_votes[option.id] = {
-            "direct_votes": 0,
-            "delegated_votes": 0,
-            "total_votes": 0
-        }
-    
-    # Count direct votes
-    for vote in direct_votes:
-        weight = vote.weight or 1
-        option_votes[vote.option_id]["direct_votes"] += weight
-        option_votes[vote.option_id]["total_votes"] += weight
-    
-    # Process delegations and add delegated votes
-    for delegation in delegations:
-        try:
-            # Check if delegator has voted directly
-            delegator_vote_result = await db.execute(
-                select(Vote).where(
-                    and_(
-                        Vote.user_id == delegation.delegator_id,
-                        Vote.poll_id == poll_id,
-                        Vote.is_deleted == False
-                    )
-                )
-            )
-            delegator_vote = delegator_vote_result.scalar_one_or_none()
-            
-            # If delegator hasn't voted directly, check their delegate's vote
-            if not delegator_vote:
-                # Determine if this delegation applies to this poll
-                delegation_applies = False
-                
-                if delegation.label_id:
-                    # Label-specific delegation - check if poll has matching label
-                    for poll_label in poll_labels:
-                        if poll_label.id == delegation.label_id:
-                            delegation_applies = True
-                            break
-                else:
-                    # Global delegation - always applies
-                    delegation_applies = True
-                
-                if delegation_applies:
-                    # Find the delegate's vote
-                    delegate_vote_result = await db.execute(
-                        select(Vote).where(
-                            and_(
-                                Vote.user_id == delegation.delegatee_id,
-                                Vote.poll_id == poll_id,
-                                Vote.is_deleted == False
-                            )
-                        )
-                    )
-                    delegate_vote = delegate_vote_result.scalar_one_or_none()
-                    
-                    if delegate_vote:
-                        # Add the delegation weight to the delegate's chosen option
-                        delegation_weight = 1  # Default weight for delegation
-                        option_votes[delegate_vote.option_id]["delegated_votes"] += delegation_weight
-                        option_votes[delegate_vote.option_id]["total_votes"] += delegation_weight
-                    
-        except Exception as e:
-            logger.warning(
-                "Failed to process delegation for vote counting",
-                extra={
-                    "poll_id": poll_id,
-                    "delegator_id": delegation.delegator_id,
-                    "error": str(e)
-                }
-            )
-            continue
-    
-    # Create PollResult objects
-    results = []
-    for option in options:
-        votes = option_votes[option.id]
-        result = PollResult(
-            option_id=option.id,
-            text=option.text,
-            direct_votes=votes["direct_votes"],
-            delegated_votes=votes["delegated_votes"],
-            total_votes=votes["total_votes"]
-        )
-        results.append(result)
-    
-    # Sort by total votes (descending)
-    results.sort(key=lambda x: x.total_votes, reverse=True)
-    
+    return result.scalar_one_or_none()
+
+
+async def _calculate_poll_results(engine: PollTallyEngine, poll: Poll) -> List[PollResult]:
+    tally_input = await engine.load_input(poll)
+    if not tally_input.options:
+        return []
+
+    results = PollTallyCore.tally(tally_input)
+
     logger.info(
         "Calculated poll results",
         extra={
-            "poll_id": poll_id,
-            "options_count": len(options),
-            "direct_votes_count": len(direct_votes),
-            "delegations_count": len(delegations)
+            "poll_id": poll.id,
+            "options_count": len(tally_input.options),
+            "direct_votes_count": sum(tally_input.direct_votes.values()),
+            "delegations_count": len(tally_input.delegations)
         }
     )
-    
+
     return results
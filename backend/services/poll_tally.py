@@ -0,0 +1,640 @@
+"""Set-based poll tally engine.
+
+This module computes poll results from a bounded number of set-based queries:
+the poll's direct vote weight per option as one aggregate, and only those
+delegations that can route weight to one of the poll's voters, however many
+hops away. Delegated weight is then propagated in memory in a single linear
+pass over the choices of the users those delegations touch, so the cost of a
+tally depends on the delegations reaching the poll rather than on its number
+of votes or the total number of delegations on the platform. Several polls
+can be loaded together, sharing each of those queries.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.delegation import Delegation, DelegationMode
+from backend.models.option import Option
+from backend.models.poll import Poll, PollStatus
+from backend.models.vote import Vote
+from backend.schemas.poll import PollResult
+from backend.services.delegation.chain_resolution import ChainResolutionCore
+
+
+@dataclass
+class OptionTally:
+    """Running vote counts for a single option."""
+
+    direct_votes: int = 0
+    delegated_votes: int = 0
+
+    @property
+    def total_votes(self) -> int:
+        return self.direct_votes + self.delegated_votes
+
+
+@dataclass
+class TallyInput:
+    """Everything the in-memory tally needs, as loaded from the database.
+
+    ``direct_votes`` is the summed vote weight per option; ``voter_choices``
+    maps the users on the given delegations who voted to their option.
+    """
+
+    poll_id: str
+    label_ids: List[str]
+    options: List[Option]
+    direct_votes: Dict[str, int]
+    voter_choices: Dict[str, str]
+    delegations: List[Delegation] = field(default_factory=list)
+
+    @classmethod
+    def from_votes(
+        cls,
+        poll_id: str,
+        label_ids: List[str],
+        options: List[Option],
+        votes: Iterable[Vote],
+        delegations: Optional[List[Delegation]] = None,
+    ) -> "TallyInput":
+        """Build a tally input from individual votes."""
+        direct_votes: Dict[str, int] = {}
+        voter_choices: Dict[str, str] = {}
+        for vote in votes:
+            direct_votes[vote.option_id] = direct_votes.get(vote.option_id, 0) + (vote.weight or 1)
+            voter_choices[vote.user_id] = vote.option_id
+        return cls(
+            poll_id=poll_id,
+            label_ids=label_ids,
+            options=options,
+            direct_votes=direct_votes,
+            voter_choices=voter_choices,
+            delegations=delegations or [],
+        )
+
+
+def is_poll_open(poll: Poll, now: Optional[datetime] = None) -> bool:
+    """Whether a poll can still receive votes (not closed, archived or past its end date)."""
+    if poll.status in (PollStatus.CLOSED, PollStatus.ARCHIVED):
+        return False
+    if poll.end_date is None:
+        return True
+    now = now or datetime.now(timezone.utc)
+    end_date = poll.end_date
+    if end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=timezone.utc)
+    return end_date > now
+
+
+class PollTallyCore:
+    """Pure tally logic with no side effects (no database queries, no logging)."""
+
+    @staticmethod
+    def select_effective_delegations(
+        delegations: Iterable[Delegation],
+        poll_id: str,
+        label_ids: Sequence[str],
+    ) -> Dict[str, Delegation]:
+        """Pick the single delegation that routes each delegator's vote for a poll.
+
+        A poll-specific delegation wins over a label delegation for one of the
+        poll's labels, which in turn wins over a global delegation. Within a
+        scope the first delegation in input order wins, so callers should pass
+        delegations already ordered by mode priority and creation time.
+        """
+        scopes = [{"poll_id": poll_id}]
+        scopes.extend({"label_id": label_id} for label_id in label_ids)
+        scopes.append({})
+
+        by_delegator: Dict[str, List[Delegation]] = {}
+        for delegation in delegations:
+            by_delegator.setdefault(delegation.delegator_id, []).append(delegation)
+
+        effective: Dict[str, Delegation] = {}
+        for delegator_id, candidates in by_delegator.items():
+            for scope in scopes:
+                match = next(
+                    (
+                        d
+                        for d in candidates
+                        if ChainResolutionCore._matches_target_scope(d, **scope)
+                    ),
+                    None,
+                )
+                if match is not None:
+                    effective[delegator_id] = match
+                    break
+        return effective
+
+    @staticmethod
+    def propagate(
+        edges: Dict[str, str], voter_choice: Dict[str, str]
+    ) -> Dict[str, Optional[str]]:
+        """Resolve every delegator to the option chosen by the first voter in its chain.
+
+        Each user is visited once: the walk from a delegator stops at the first
+        user who voted directly (a direct vote overrides that user's own
+        delegation), at a user with no delegation, at a user already resolved
+        by an earlier walk, or when it runs into a cycle. Every user on the
+        walked path then shares the same outcome.
+
+        Args:
+            edges: Map of delegator_id -> delegatee_id (effective delegations)
+            voter_choice: Map of user_id -> option_id for direct voters
+
+        Returns:
+            Dict[str, Optional[str]]: Option for each non-voting delegator, or
+            None when the chain never reaches a voter
+        """
+        resolved: Dict[str, Optional[str]] = {}
+        for start in edges:
+            if start in voter_choice or start in resolved:
+                continue
+
+            path: List[str] = []
+            on_path: Set[str] = set()
+            node = start
+            while True:
+                if node in voter_choice:
+                    outcome = voter_choice[node]
+                    break
+                if node in resolved:
+                    outcome = resolved[node]
+                    break
+                if node in on_path:
+                    outcome = None  # Cycle without a voter
+                    break
+                next_node = edges.get(node)
+                if next_node is None:
+                    outcome = None
+                    break
+                path.append(node)
+                on_path.add(node)
+                node = next_node
+
+            for user_id in path:
+                resolved[user_id] = outcome
+        return resolved
+
+    @staticmethod
+    def tally(tally_input: TallyInput) -> List[PollResult]:
+        """Compute poll results from direct votes and effective delegations."""
+        option_votes: Dict[str, OptionTally] = {
+            option.id: OptionTally() for option in tally_input.options
+        }
+
+        for option_id, weight in tally_input.direct_votes.items():
+            if option_id in option_votes:
+                option_votes[option_id].direct_votes += weight
+        # Votes for deleted options do not count, so those voters still delegate
+        voter_choice = {
+            user_id: option_id
+            for user_id, option_id in tally_input.voter_choices.items()
+            if option_id in option_votes
+        }
+
+        effective = PollTallyCore.select_effective_delegations(
+            tally_input.delegations, tally_input.poll_id, tally_input.label_ids
+        )
+        edges = {
+            delegator_id: delegation.delegatee_id
+            for delegator_id, delegation in effective.items()
+        }
+        resolved = PollTallyCore.propagate(edges, voter_choice)
+        for option_id in resolved.values():
+            if option_id is not None:
+                option_votes[option_id].delegated_votes += 1
+
+        results = [
+            PollResult(
+                option_id=option.id,
+                text=option.text,
+                direct_votes=option_votes[option.id].direct_votes,
+                delegated_votes=option_votes[option.id].delegated_votes,
+                total_votes=option_votes[option.id].total_votes,
+            )
+            for option in tally_input.options
+        ]
+        results.sort(key=lambda x: x.total_votes, reverse=True)
+        return results
+
+
+class PollTallyEngine:
+    """Loads the inputs of a poll tally with set-based queries."""
+
+    # Maximum number of IDs bound into a single IN (...) clause
+    chunk_size = 500
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def load_poll(self, poll_id) -> Optional[Poll]:
+        """Load a non-deleted poll (labels are loaded eagerly by the model)."""
+        result = await self.db.execute(
+            select(Poll).where(and_(Poll.id == poll_id, Poll.is_deleted == False))
+        )
+        return result.scalar_one_or_none()
+
+    async def load_polls(self, poll_ids: Iterable[str]) -> List[Poll]:
+        """Load the non-deleted polls among ``poll_ids`` with one query."""
+        result = await self.db.execute(
+            select(Poll).where(
+                and_(Poll.id.in_(list(poll_ids)), Poll.is_deleted == False)
+            )
+        )
+        return list(result.scalars().all())
+
+    async def load_input(self, poll: Poll) -> TallyInput:
+        """Load options, direct vote totals and relevant delegations for a poll.
+
+        No vote rows are hydrated: direct weight is summed per option by the
+        database, and individual choices are only read for the users that
+        the loaded delegations touch.
+        """
+        return (await self.load_inputs([poll]))[poll.id]
+
+    async def load_inputs(self, polls: Sequence[Poll]) -> Dict[str, TallyInput]:
+        """Load the tally inputs of several polls with shared queries.
+
+        Options, direct vote totals and voter choices are each read with one
+        query for all polls. Delegations are discovered once, walking upstream
+        from the voters of every poll under the union of their scopes; each
+        poll's tally then keeps only the delegations whose scope covers it.
+
+        Returns:
+            Dict[str, TallyInput]: Tally input per poll ID
+        """
+        label_ids = {poll.id: [label.id for label in poll.labels or []] for poll in polls}
+
+        options: Dict[str, List[Option]] = {poll.id: [] for poll in polls}
+        for chunk in _chunks(list(options), self.chunk_size):
+            result = await self.db.execute(
+                select(Option).where(
+                    and_(Option.poll_id.in_(chunk), Option.is_deleted == False)
+                )
+            )
+            for option in result.scalars().all():
+                options[option.poll_id].append(option)
+
+        # Polls without options have nothing to tally
+        tallied = [poll_id for poll_id, poll_options in options.items() if poll_options]
+        direct_votes: Dict[str, Dict[str, int]] = {}
+        delegations: List[Delegation] = []
+        voter_choices: Dict[str, Dict[str, str]] = {}
+        if tallied:
+            direct_votes = await self.load_direct_votes(tallied)
+            delegations = await self._load_delegations_to_voters(
+                tallied, sorted({label_id for poll_id in tallied for label_id in label_ids[poll_id]})
+            )
+            if delegations:
+                voter_choices = await self._load_voter_choices_by_poll(
+                    tallied,
+                    {user_id for d in delegations for user_id in (d.delegator_id, d.delegatee_id)},
+                )
+
+        return {
+            poll.id: TallyInput(
+                poll_id=poll.id,
+                label_ids=label_ids[poll.id],
+                options=options[poll.id],
+                direct_votes=direct_votes.get(poll.id, {}),
+                voter_choices=voter_choices.get(poll.id, {}),
+                delegations=delegations if options[poll.id] else [],
+            )
+            for poll in polls
+        }
+
+    async def load_direct_votes(self, poll_ids: Sequence[str]) -> Dict[str, Dict[str, int]]:
+        """Sum the direct vote weight per poll and option with one aggregate query.
+
+        A missing or zero weight counts as one vote. The aggregate is served
+        by the covering ``ix_votes_poll_tally`` index.
+        """
+        totals: Dict[str, Dict[str, int]] = {}
+        for chunk in _chunks(list(poll_ids), self.chunk_size):
+            result = await self.db.execute(
+                select(
+                    Vote.poll_id,
+                    Vote.option_id,
+                    func.sum(func.coalesce(func.nullif(Vote.weight, 0), 1)),
+                )
+                .where(and_(Vote.poll_id.in_(chunk), Vote.is_deleted == False))
+                .group_by(Vote.poll_id, Vote.option_id)
+            )
+            for poll_id, option_id, weight in result.all():
+                totals.setdefault(poll_id, {})[option_id] = int(weight)
+        return totals
+
+    async def _load_delegations_to_voters(
+        self, poll_ids: Sequence[str], label_ids: Sequence[str]
+    ) -> List[Delegation]:
+        """Load every applicable delegation of users whose chains can reach a voter.
+
+        Delegators are discovered hop by hop, walking delegation edges upstream
+        from the polls' voters with one set-based query per hop. All applicable
+        delegations of the discovered users are then returned, so that scope
+        precedence can be decided in memory.
+        """
+        voters = select(Vote.user_id).where(
+            and_(Vote.poll_id.in_(list(poll_ids)), Vote.is_deleted == False)
+        )
+        applicable = self._applicable_conditions(poll_ids, label_ids)
+
+        result = await self.db.execute(
+            select(Delegation.delegator_id)
+            .where(and_(Delegation.delegatee_id.in_(voters), *applicable))
+            .distinct()
+        )
+        frontier = set(result.scalars().all())
+        discovered: Set[str] = set(frontier)
+
+        while frontier:
+            next_frontier: Set[str] = set()
+            for chunk in _chunks(list(frontier), self.chunk_size):
+                result = await self.db.execute(
+                    select(Delegation.delegator_id)
+                    .where(and_(Delegation.delegatee_id.in_(chunk), *applicable))
+                    .distinct()
+                )
+                next_frontier.update(result.scalars().all())
+            frontier = next_frontier - discovered
+            discovered |= frontier
+
+        delegations: List[Delegation] = []
+        for chunk in _chunks(sorted(discovered), self.chunk_size):
+            result = await self.db.execute(
+                select(Delegation)
+                .where(and_(Delegation.delegator_id.in_(chunk), *applicable))
+                .order_by(
+                    Delegation.delegator_id,
+                    (Delegation.mode == DelegationMode.HYBRID_SEED.value).desc(),
+                    Delegation.created_at.asc(),
+                )
+            )
+            delegations.extend(result.scalars().all())
+        return delegations
+
+    async def load_effective_delegations(
+        self, poll_id: str, label_ids: Sequence[str], user_ids: Iterable[str]
+    ) -> Dict[str, Delegation]:
+        """Load the delegation that routes each given user's vote for a poll."""
+        effective = await self._load_effective_delegations_by_poll(
+            {poll_id: label_ids}, user_ids
+        )
+        return effective[poll_id]
+
+    async def _load_effective_delegations_by_poll(
+        self, label_ids_by_poll: Dict[str, Sequence[str]], user_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Delegation]]:
+        """Load the routing delegation of each given user in several polls at once."""
+        applicable = self._applicable_conditions(
+            list(label_ids_by_poll), _label_union(label_ids_by_poll)
+        )
+        delegations: List[Delegation] = []
+        for chunk in _chunks(sorted(set(user_ids)), self.chunk_size):
+            result = await self.db.execute(
+                select(Delegation)
+                .where(and_(Delegation.delegator_id.in_(chunk), *applicable))
+                .order_by(
+                    Delegation.delegator_id,
+                    (Delegation.mode == DelegationMode.HYBRID_SEED.value).desc(),
+                    Delegation.created_at.asc(),
+                )
+            )
+            delegations.extend(result.scalars().all())
+        return {
+            poll_id: PollTallyCore.select_effective_delegations(
+                delegations, poll_id, label_ids
+            )
+            for poll_id, label_ids in label_ids_by_poll.items()
+        }
+
+    async def load_voter_choices(
+        self, poll_id: str, user_ids: Iterable[str]
+    ) -> Dict[str, str]:
+        """Map each given user who voted on the poll to the option they chose."""
+        choices: Dict[str, str] = {}
+        for chunk in _chunks(sorted(set(user_ids)), self.chunk_size):
+            result = await self.db.execute(
+                select(Vote.user_id, Vote.option_id).where(
+                    and_(
+                        Vote.poll_id == poll_id,
+                        Vote.is_deleted == False,
+                        Vote.user_id.in_(chunk),
+                    )
+                )
+            )
+            choices.update({user_id: option_id for user_id, option_id in result.all()})
+        return choices
+
+    async def _load_voter_choices_by_poll(
+        self, poll_ids: Sequence[str], user_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """Map each given user who voted to their option, per poll."""
+        choices: Dict[str, Dict[str, str]] = {}
+        for chunk in _chunks(sorted(set(user_ids)), self.chunk_size):
+            result = await self.db.execute(
+                select(Vote.poll_id, Vote.user_id, Vote.option_id).where(
+                    and_(
+                        Vote.poll_id.in_(list(poll_ids)),
+                        Vote.is_deleted == False,
+                        Vote.user_id.in_(chunk),
+                    )
+                )
+            )
+            for poll_id, user_id, option_id in result.all():
+                choices.setdefault(poll_id, {})[user_id] = option_id
+        return choices
+
+    async def resolve_downstream(
+        self, poll_id: str, label_ids: Sequence[str], user_id: str
+    ) -> Optional[str]:
+        """Option of the first voter reached by following ``user_id``'s delegation chain.
+
+        The user's own vote is ignored, so the result is where their weight
+        would go if they had not voted. Returns None when the chain ends
+        without reaching a voter or loops back on itself.
+        """
+        visited = {user_id}
+        node = user_id
+        while True:
+            effective = await self.load_effective_delegations(poll_id, label_ids, [node])
+            delegation = effective.get(node)
+            if delegation is None or delegation.delegatee_id in visited:
+                return None
+            node = delegation.delegatee_id
+            choice = (await self.load_voter_choices(poll_id, [node])).get(node)
+            if choice is not None:
+                return choice
+            visited.add(node)
+
+    async def count_upstream_block(
+        self, poll_id: str, label_ids: Sequence[str], user_id: str
+    ) -> int:
+        """Count ``user_id`` plus every non-voter whose chain reaches it before any voter.
+
+        This is the set of users whose weight moves together with
+        ``user_id``'s own routing: when the user votes, changes their vote or
+        changes their delegation, the whole block follows.
+        """
+        applicable = self._applicable_conditions([poll_id], label_ids)
+        block = {user_id}
+        frontier = {user_id}
+        while frontier:
+            candidates: Set[str] = set()
+            for chunk in _chunks(sorted(frontier), self.chunk_size):
+                result = await self.db.execute(
+                    select(Delegation.delegator_id)
+                    .where(and_(Delegation.delegatee_id.in_(chunk), *applicable))
+                    .distinct()
+                )
+                candidates.update(result.scalars().all())
+            candidates -= block
+            if not candidates:
+                break
+
+            effective = await self.load_effective_delegations(poll_id, label_ids, candidates)
+            voters = await self.load_voter_choices(poll_id, candidates)
+            frontier = {
+                candidate
+                for candidate in candidates
+                if candidate not in voters
+                and candidate in effective
+                and effective[candidate].delegatee_id in block
+            }
+            block |= frontier
+        return len(block)
+
+    async def resolve_downstream_many(
+        self, label_ids_by_poll: Dict[str, Sequence[str]], user_id: str
+    ) -> Dict[str, Optional[str]]:
+        """``resolve_downstream`` for one user in several polls at once.
+
+        The chains of all polls are walked together, with one delegation
+        query and one vote query per hop instead of per poll and hop.
+        """
+        resolved: Dict[str, Optional[str]] = {}
+        visited = {poll_id: {user_id} for poll_id in label_ids_by_poll}
+        heads = {poll_id: user_id for poll_id in label_ids_by_poll}
+        while heads:
+            effective = await self._load_effective_delegations_by_poll(
+                {poll_id: label_ids_by_poll[poll_id] for poll_id in heads},
+                set(heads.values()),
+            )
+            next_heads: Dict[str, str] = {}
+            for poll_id, node in heads.items():
+                delegation = effective[poll_id].get(node)
+                if delegation is None or delegation.delegatee_id in visited[poll_id]:
+                    resolved[poll_id] = None
+                else:
+                    next_heads[poll_id] = delegation.delegatee_id
+            if not next_heads:
+                break
+
+            choices = await self._load_voter_choices_by_poll(
+                list(next_heads), set(next_heads.values())
+            )
+            heads = {}
+            for poll_id, node in next_heads.items():
+                choice = choices.get(poll_id, {}).get(node)
+                if choice is not None:
+                    resolved[poll_id] = choice
+                else:
+                    visited[poll_id].add(node)
+                    heads[poll_id] = node
+        return resolved
+
+    async def count_upstream_blocks(
+        self, label_ids_by_poll: Dict[str, Sequence[str]], user_id: str
+    ) -> Dict[str, int]:
+        """``count_upstream_block`` for one user in several polls at once.
+
+        Upstream candidates are discovered for all polls with one query per
+        hop; each poll then keeps the candidates whose own routing reaches its
+        block.
+        """
+        applicable = self._applicable_conditions(
+            list(label_ids_by_poll), _label_union(label_ids_by_poll)
+        )
+        blocks = {poll_id: {user_id} for poll_id in label_ids_by_poll}
+        frontiers = {poll_id: {user_id} for poll_id in label_ids_by_poll}
+        while frontiers:
+            candidates: Set[str] = set()
+            reached = set().union(*frontiers.values())
+            for chunk in _chunks(sorted(reached), self.chunk_size):
+                result = await self.db.execute(
+                    select(Delegation.delegator_id)
+                    .where(and_(Delegation.delegatee_id.in_(chunk), *applicable))
+                    .distinct()
+                )
+                candidates.update(result.scalars().all())
+            pending = {poll_id: candidates - blocks[poll_id] for poll_id in frontiers}
+            lookup = set().union(*pending.values())
+            if not lookup:
+                break
+
+            effective = await self._load_effective_delegations_by_poll(
+                {poll_id: label_ids_by_poll[poll_id] for poll_id in frontiers}, lookup
+            )
+            voters = await self._load_voter_choices_by_poll(list(frontiers), lookup)
+            next_frontiers: Dict[str, Set[str]] = {}
+            for poll_id in frontiers:
+                found = {
+                    candidate
+                    for candidate in pending[poll_id]
+                    if candidate not in voters.get(poll_id, {})
+                    and candidate in effective[poll_id]
+                    and effective[poll_id][candidate].delegatee_id in blocks[poll_id]
+                }
+                if found:
+                    blocks[poll_id] |= found
+                    next_frontiers[poll_id] = found
+            frontiers = next_frontiers
+        return {poll_id: len(block) for poll_id, block in blocks.items()}
+
+    @staticmethod
+    def _applicable_conditions(poll_ids: Sequence[str], label_ids: Sequence[str]) -> list:
+        """SQL conditions for active delegations whose scope covers one of the polls."""
+        scope_clauses = [
+            Delegation.poll_id.in_(list(poll_ids)),
+            and_(
+                Delegation.poll_id.is_(None),
+                Delegation.label_id.is_(None),
+                Delegation.field_id.is_(None),
+                Delegation.institution_id.is_(None),
+                Delegation.value_id.is_(None),
+                Delegation.idea_id.is_(None),
+            ),
+        ]
+        if label_ids:
+            scope_clauses.append(Delegation.label_id.in_(label_ids))
+
+        return [
+            Delegation.is_deleted == False,
+            Delegation.revoked_at.is_(None),
+            or_(*scope_clauses),
+            or_(Delegation.end_date.is_(None), Delegation.end_date > func.now()),
+            or_(Delegation.start_date.is_(None), Delegation.start_date <= func.now()),
+            # Expired legacy terms no longer carry weight
+            or_(
+                Delegation.legacy_term_ends_at.is_(None),
+                Delegation.legacy_term_ends_at > func.now(),
+            ),
+        ]
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _label_union(label_ids_by_poll: Dict[str, Sequence[str]]) -> List[str]:
+    """Every label of the given polls, sorted and without duplicates."""
+    return sorted(
+        {label_id for label_ids in label_ids_by_poll.values() for label_id in label_ids}
+    )
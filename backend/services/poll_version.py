@@ -0,0 +1,155 @@
+"""Per-poll version counters for conditional poll detail requests.
+
+Every write that changes what the poll detail endpoint returns bumps the
+poll's counter in Redis: poll updates, votes, label changes and
+delegations scoped to the poll. The detail endpoint's ETag is derived from
+the counter and the requesting user, so a matching If-None-Match is
+answered with one Redis read and no database work.
+
+A counter starts at a random value rather than zero, so a counter lost to
+eviction, expiry or a flush never repeats a version that was already
+handed out. Reads never create a counter: the endpoint seeds it only once
+the poll is known to exist, so probing unknown IDs leaves no keys behind.
+Counters expire after ``VERSION_TTL_SECONDS`` without writes (an expired
+counter only costs clients one full response) and are deleted with their
+poll.
+
+Some changes happen with time rather than with a write: a delegation on a
+user's chain starting or ending. Each full response schedules the nearest
+such time for its user next to the counter; the poll keeps the earliest
+one, and the first read after it moves the version (and so every user's
+ETag, who then reschedule on their next full response).
+
+Every Redis failure is logged and swallowed: reads then return None and
+the endpoint answers without an ETag.
+"""
+
+import hashlib
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from backend.core.logging_config import get_logger
+from backend.core.redis import get_redis_client
+
+logger = get_logger(__name__)
+
+VERSION_KEY_PREFIX = "poll:version:"
+CHANGE_KEY_PREFIX = "poll:version-change:"
+_CHANGE_MEMBER = "next"
+VERSION_TTL_SECONDS = 24 * 60 * 60
+
+
+def version_key(poll_id) -> str:
+    """Redis key of the version counter for a poll."""
+    return f"{VERSION_KEY_PREFIX}{poll_id}"
+
+
+def change_key(poll_id) -> str:
+    """Redis key of the sorted set holding the time a poll's version moves at."""
+    return f"{CHANGE_KEY_PREFIX}{poll_id}"
+
+
+async def get_poll_version(poll_id) -> Optional[str]:
+    """Current version of a poll, or None if it has none yet or Redis is unavailable.
+
+    A version whose scheduled change time has passed is moved first.
+    """
+    try:
+        redis_client = await get_redis_client()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(version_key(poll_id))
+            pipe.zscore(change_key(poll_id), _CHANGE_MEMBER)
+            version, change_at = await pipe.execute()
+        if version is not None and change_at is not None and float(change_at) <= time.time():
+            await bump_poll_versions([poll_id])
+            version = await redis_client.get(version_key(poll_id))
+    except Exception as e:
+        logger.warning(
+            "Failed to read poll version", extra={"poll_id": str(poll_id), "error": str(e)}
+        )
+        return None
+    return _decode(version)
+
+
+async def seed_poll_version(poll_id) -> Optional[str]:
+    """Version of an existing poll, starting its counter if it has none."""
+    try:
+        redis_client = await get_redis_client()
+        key = version_key(poll_id)
+        await redis_client.set(key, secrets.randbits(62), nx=True, ex=VERSION_TTL_SECONDS)
+        version = await redis_client.get(key)
+    except Exception as e:
+        logger.warning(
+            "Failed to seed poll version", extra={"poll_id": str(poll_id), "error": str(e)}
+        )
+        return None
+    return _decode(version)
+
+
+async def schedule_poll_version_change(poll_id, change_at: datetime) -> None:
+    """Move a poll's version at ``change_at`` (naive means UTC) unless it moves sooner."""
+    if change_at.tzinfo is None:
+        change_at = change_at.replace(tzinfo=timezone.utc)
+    key = change_key(poll_id)
+    try:
+        redis_client = await get_redis_client()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            # LT keeps the earliest time any user's response depends on
+            pipe.zadd(key, {_CHANGE_MEMBER: change_at.timestamp()}, lt=True)
+            pipe.expire(key, VERSION_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(
+            "Failed to schedule poll version change",
+            extra={"poll_id": str(poll_id), "error": str(e)},
+        )
+
+
+async def bump_poll_versions(poll_ids: Iterable) -> None:
+    """Move polls to a new version, invalidating every ETag issued for them."""
+    poll_ids = [poll_id for poll_id in poll_ids if poll_id is not None]
+    keys = {version_key(poll_id) for poll_id in poll_ids}
+    if not keys:
+        return
+    try:
+        redis_client = await get_redis_client()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                # A missing counter restarts at a random value, not at 1
+                pipe.set(key, secrets.randbits(62), nx=True)
+                pipe.incr(key)
+                pipe.expire(key, VERSION_TTL_SECONDS)
+            # The next full response schedules the next timed change again
+            pipe.delete(*(change_key(poll_id) for poll_id in poll_ids))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(
+            "Failed to bump poll versions", extra={"poll_count": len(keys), "error": str(e)}
+        )
+
+
+async def drop_poll_versions(poll_ids: Iterable) -> None:
+    """Delete the counters of deleted polls."""
+    poll_ids = [poll_id for poll_id in poll_ids if poll_id is not None]
+    keys = {version_key(poll_id) for poll_id in poll_ids}
+    if not keys:
+        return
+    try:
+        redis_client = await get_redis_client()
+        await redis_client.delete(*keys, *(change_key(poll_id) for poll_id in poll_ids))
+    except Exception as e:
+        logger.warning(
+            "Failed to drop poll versions", extra={"poll_count": len(keys), "error": str(e)}
+        )
+
+
+def poll_detail_etag(poll_id, user_id, version: str) -> str:
+    """Strong ETag of a poll detail response for one user at one poll version."""
+    digest = hashlib.sha256(f"{poll_id}:{user_id}:{version}".encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _decode(version) -> Optional[str]:
+    return version.decode("utf-8") if isinstance(version, bytes) else version
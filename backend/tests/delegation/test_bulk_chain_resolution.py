@@ -0,0 +1,169 @@
+"""Tests for bulk delegation chain resolution."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.delegation import Delegation
+from backend.models.user import User
+from backend.services.delegation import DelegationService
+from backend.services.delegation.cache import DelegationCache
+from backend.services.delegation.dispatch_async import DelegationAsyncDispatch
+
+
+@pytest.mark.asyncio
+async def test_bulk_chains_match_single_resolution(db_session: AsyncSession):
+    """Chains A -> B -> C -> D and E -> C, a cycle F <-> G, and an undelegated H."""
+    users = [
+        User(
+            id=uuid4(),
+            username=f"bulk_user_{i}",
+            email=f"bulk_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(8)
+    ]
+    a, b, c, d, e, f, g, h = users
+    poll_id = uuid4()
+    start = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all(users)
+    db_session.add_all(
+        [
+            Delegation(delegator_id=a.id, delegatee_id=b.id, start_date=start),
+            Delegation(delegator_id=b.id, delegatee_id=c.id, start_date=start),
+            Delegation(delegator_id=c.id, delegatee_id=d.id, start_date=start),
+            Delegation(delegator_id=e.id, delegatee_id=c.id, start_date=start),
+            Delegation(delegator_id=f.id, delegatee_id=g.id, start_date=start),
+            Delegation(delegator_id=g.id, delegatee_id=f.id, start_date=start),
+            # Poll-scoped delegations do not leak into global resolution
+            Delegation(delegator_id=h.id, delegatee_id=a.id, poll_id=poll_id, start_date=start),
+        ]
+    )
+    await db_session.commit()
+
+    service = DelegationService(db_session)
+    statements = []
+
+    def count_statement(*args):
+        statements.append(args[2])
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count_statement)
+    try:
+        chains = await service.resolve_delegation_chains_bulk(
+            [user.id for user in users], max_depth=5
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+    def path(chain):
+        return [str(delegation.delegatee_id) for delegation in chain]
+
+    assert path(chains[str(a.id)]) == [str(b.id), str(c.id), str(d.id)]
+    assert path(chains[str(e.id)]) == [str(c.id), str(d.id)]
+    assert path(chains[str(d.id)]) == []
+    assert path(chains[str(h.id)]) == []
+    assert len(chains[str(f.id)]) == 5  # cycle stops at max_depth
+
+    # One batch query per hop, not per user
+    assert len(statements) <= 5
+
+    poll_chains = await service.resolve_delegation_chains_bulk([h.id], poll_id=poll_id)
+    assert path(poll_chains[str(h.id)]) == [str(a.id)]
+
+
+@pytest.mark.asyncio
+async def test_bulk_reads_cached_chains_first(db_session: AsyncSession):
+    cache = DelegationCache(fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()))
+    dispatch = DelegationAsyncDispatch(db_session, cache)
+    cached_user, cached_delegatee, uncached_user = uuid4(), uuid4(), uuid4()
+
+    # Only the cache knows about this chain; the database has no delegations
+    cached_delegation = Delegation(
+        id=uuid4(),
+        delegator_id=cached_user,
+        delegatee_id=cached_delegatee,
+        start_date=datetime.utcnow(),
+    )
+    await cache.cache_chain(
+        cache.generate_cache_key(cached_user, epoch=await cache.get_scope_epoch()),
+        [cached_delegation],
+    )
+
+    chains = await dispatch.resolve_delegation_chains_bulk([cached_user, uncached_user])
+
+    assert [str(d.delegatee_id) for d in chains[str(cached_user)]] == [str(cached_delegatee)]
+    assert chains[str(uncached_user)] == []
+
+
+@pytest.mark.asyncio
+async def test_poll_chains_resolved_together_and_cached(db_session: AsyncSession):
+    """One user's chains in three polls: two hops, one hop, and a cycle."""
+    users = [
+        User(
+            id=uuid4(),
+            username=f"poll_chain_user_{i}",
+            email=f"poll_chain_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(3)
+    ]
+    a, b, c = users
+    two_hops, one_hop, cycle, untouched = (uuid4() for _ in range(4))
+    start = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all(users)
+    db_session.add_all(
+        [
+            Delegation(delegator_id=a.id, delegatee_id=b.id, poll_id=two_hops, start_date=start),
+            Delegation(delegator_id=b.id, delegatee_id=c.id, poll_id=two_hops, start_date=start),
+            Delegation(delegator_id=a.id, delegatee_id=c.id, poll_id=one_hop, start_date=start),
+            Delegation(delegator_id=a.id, delegatee_id=b.id, poll_id=cycle, start_date=start),
+            Delegation(delegator_id=b.id, delegatee_id=a.id, poll_id=cycle, start_date=start),
+            # Global delegations do not leak into poll scopes
+            Delegation(delegator_id=a.id, delegatee_id=c.id, start_date=start),
+        ]
+    )
+    await db_session.commit()
+
+    cache = DelegationCache(fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()))
+    dispatch = DelegationAsyncDispatch(db_session, cache)
+    poll_ids = [two_hops, one_hop, cycle, untouched]
+    statements = []
+
+    def count_statement(*args):
+        statements.append(args[2])
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count_statement)
+    try:
+        chains = await dispatch.resolve_poll_delegation_chains(a.id, poll_ids, max_depth=4)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+    def path(chain):
+        return [str(delegation.delegatee_id) for delegation in chain]
+
+    assert path(chains[str(two_hops)]) == [str(b.id), str(c.id)]
+    assert path(chains[str(one_hop)]) == [str(c.id)]
+    assert path(chains[str(cycle)]) == [str(b.id), str(a.id), str(b.id), str(a.id)]
+    assert chains[str(untouched)] == []
+    # One query per hop across every poll
+    assert len(statements) <= 2
+    for poll_id in poll_ids:
+        single = await dispatch.resolve_delegation_chain(a.id, str(poll_id), max_depth=4)
+        assert path(single) == path(chains[str(poll_id)])
+
+    # The resolved chains were written back to the cache
+    epochs = await cache.get_poll_scope_epochs(poll_ids)
+    cached = await cache.batch_get_cached_chains(
+        [
+            cache.generate_cache_key(str(a.id), str(poll_id), epoch=epochs[str(poll_id)])
+            for poll_id in poll_ids
+        ]
+    )
+    assert all(chain is not None for chain in cached.values())
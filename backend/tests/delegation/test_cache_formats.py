@@ -0,0 +1,140 @@
+"""Tests for format-suffixed delegation cache reads."""
+
+import json
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from backend.config import settings
+from backend.services.delegation.cache import DelegationCache
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer())
+
+
+async def _json_entry(cache: DelegationCache, user_id, delegatee_id) -> str:
+    """Store a chain the way a JSON-only writer would and return its base key."""
+    key = cache.generate_cache_key(user_id, epoch=await cache.get_scope_epoch())
+    chain = [{"delegator_id": str(user_id), "delegatee_id": str(delegatee_id)}]
+    await cache.redis.setex(cache._add_format_suffix(key, "json"), 300, json.dumps(chain))
+    return key
+
+
+@pytest.mark.asyncio
+async def test_miss_is_one_round_trip(redis_client, monkeypatch):
+    cache = DelegationCache(redis_client)
+    calls = []
+    original_mget = redis_client.mget
+
+    async def recording_mget(keys, *args):
+        calls.append(keys)
+        return await original_mget(keys, *args)
+
+    async def no_get(*args, **kwargs):
+        raise AssertionError("formats must be fetched together")
+
+    monkeypatch.setattr(redis_client, "mget", recording_mget)
+    monkeypatch.setattr(redis_client, "get", no_get)
+
+    assert await cache.get_cached_chain(cache.generate_cache_key(uuid4())) is None
+    assert await cache.get_fast_path_result(uuid4(), epoch="0.0") is None
+    assert [len(keys) for keys in calls] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_fallback_entries_are_rewritten_to_canonical_format(redis_client, monkeypatch):
+    monkeypatch.setattr(settings, "DELEGATION_CACHE_REWRITE_ON_READ", True)
+    cache = DelegationCache(redis_client)
+    a, b = uuid4(), uuid4()
+    key = await _json_entry(cache, a, b)
+
+    assert (await cache.get_cached_chain(key))[0]["delegatee_id"] == str(b)
+
+    canonical_key = cache._add_format_suffix(key, cache.canonical_format)
+    if cache.canonical_format != "json":
+        assert not await redis_client.exists(cache._add_format_suffix(key, "json"))
+    assert 0 < await redis_client.ttl(canonical_key) <= 300
+
+    # The migrated entry is registered for invalidation like a fresh write
+    await cache.invalidate_delegatee_cache(b)
+    assert await cache.get_cached_chain(key) is None
+
+
+@pytest.mark.asyncio
+async def test_fallback_can_be_turned_off(redis_client, monkeypatch):
+    monkeypatch.setattr(settings, "DELEGATION_CACHE_FORMAT_FALLBACK_ENABLED", False)
+    cache = DelegationCache(redis_client)
+    key = await _json_entry(cache, uuid4(), uuid4())
+
+    if cache.canonical_format != "json":
+        assert await cache.get_cached_chain(key) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_reads_suffixed_keys_in_one_round_trip(redis_client, monkeypatch):
+    cache = DelegationCache(redis_client)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    epoch = await cache.get_scope_epoch()
+    canonical = cache.generate_cache_key(a, epoch=epoch)
+    chain = [{"delegator_id": str(a), "delegatee_id": str(b)}]
+    serialized, format_used, _ = cache._serialize_data(chain)
+    await redis_client.setex(cache._add_format_suffix(canonical, format_used), 300, serialized)
+    fallback = await _json_entry(cache, b, c)
+    missing = cache.generate_cache_key(c, epoch=epoch)
+
+    calls = []
+    original_mget = redis_client.mget
+
+    async def recording_mget(keys, *args):
+        calls.append(keys)
+        return await original_mget(keys, *args)
+
+    monkeypatch.setattr(redis_client, "mget", recording_mget)
+
+    results, outcomes = await cache.batch_lookup_cached_chains([canonical, fallback, missing])
+
+    assert len(calls) == 1
+    assert results[canonical] == chain
+    assert results[fallback][0]["delegatee_id"] == str(c)
+    assert results[missing] is None
+    assert outcomes == {canonical: "l2", fallback: "l2", missing: "miss"}
+
+
+@pytest.mark.asyncio
+async def test_scope_epoch_is_read_with_the_entries(redis_client, monkeypatch):
+    cache = DelegationCache(redis_client)
+    a, b, poll_id = uuid4(), uuid4(), uuid4()
+    key = cache.generate_cache_key(a, poll_id=poll_id, epoch="0.0")
+    chain = [{"delegator_id": str(a), "delegatee_id": str(b)}]
+    serialized, format_used, _ = cache._serialize_data(chain)
+    await redis_client.setex(cache._add_format_suffix(key, format_used), 300, serialized)
+
+    calls = []
+    original_mget = redis_client.mget
+
+    async def recording_mget(keys, *args):
+        calls.append(keys)
+        return await original_mget(keys, *args)
+
+    monkeypatch.setattr(redis_client, "mget", recording_mget)
+
+    epoch, cached = await cache.lookup_scope_chains([a, b], poll_id=poll_id)
+    assert epoch == "0.0"
+    assert cached == {str(a): chain, str(b): None}
+    assert len(calls) == 1
+
+    # A bump is noticed in the same read; only the stale entries are read again
+    await cache.bump_scope_epochs([{"poll_id": poll_id}])
+    calls.clear()
+    epoch, cached = await cache.lookup_scope_chains([a], poll_id=poll_id)
+    assert epoch == "0.1"
+    assert cached == {str(a): None}
+    assert len(calls) == 2
+
+    calls.clear()
+    await cache.lookup_scope_chains([a], poll_id=poll_id)
+    assert len(calls) == 1
@@ -0,0 +1,95 @@
+"""Tests for incrementally maintained delegation cache statistics."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from backend.models.delegation import Delegation, DelegationMode
+from backend.services.delegation.cache import DelegationCache
+from backend.services.delegation.cache_metrics import (
+    CACHE_COUNTERS,
+    get_serialization_stats,
+    observe_serialization,
+    reset_cache_metrics,
+)
+from backend.services.delegation.local_cache import LocalCacheTier
+
+
+def _delegation(delegator_id, delegatee_id) -> Delegation:
+    delegation = Delegation()
+    delegation.id = uuid4()
+    delegation.delegator_id = delegator_id
+    delegation.delegatee_id = delegatee_id
+    delegation.mode = DelegationMode.FLEXIBLE_DOMAIN
+    delegation.start_date = datetime.utcnow()
+    return delegation
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    reset_cache_metrics()
+    yield
+    reset_cache_metrics()
+
+
+@pytest.mark.asyncio
+async def test_events_are_counted_per_tier_and_family():
+    cache = DelegationCache(
+        fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()), local_tier=LocalCacheTier()
+    )
+    a, b, c = uuid4(), uuid4(), uuid4()
+    key = cache.generate_cache_key(a, epoch=await cache.get_scope_epoch())
+
+    assert await cache.get_cached_chain(key) is None
+    await cache.cache_chain(key, [_delegation(a, b), _delegation(b, c)])
+    await cache.get_cached_chain(key)
+    await cache.invalidate_delegatee_cache(c)
+    await cache.get_fast_path_result(a, epoch="0.0")
+
+    tiers = cache.get_tier_stats()
+    assert tiers["l1"]["families"]["chain"] == {
+        "hits": 1, "misses": 1, "sets": 1, "evictions": 1, "hit_ratio": 0.5
+    }
+    assert tiers["l2"]["families"]["chain"] == {
+        "hits": 0, "misses": 1, "sets": 1, "evictions": 1, "hit_ratio": 0.0
+    }
+    assert CACHE_COUNTERS[("l2", "fastpath", "misses")] == 1
+
+
+@pytest.mark.asyncio
+async def test_key_counts_are_estimated_without_scanning(monkeypatch):
+    cache = DelegationCache(fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()))
+    users = [uuid4() for _ in range(5)]
+    for delegator_id, delegatee_id in zip(users, users[1:]):
+        key = cache.generate_cache_key(delegator_id)
+        # Rewriting a key does not count it twice
+        await cache.cache_chain(key, [_delegation(delegator_id, delegatee_id)])
+        await cache.cache_chain(key, [_delegation(delegator_id, delegatee_id)])
+    await cache.cache_fast_path_result(users[0], {"delegatee_id": str(users[1])})
+
+    async def no_scan(*args, **kwargs):
+        raise AssertionError("the keyspace must not be scanned")
+
+    monkeypatch.setattr(cache.redis, "keys", no_scan)
+    monkeypatch.setattr(cache.redis, "scan", no_scan)
+
+    stats = await cache.get_cache_stats()
+
+    assert stats["chain_keys"]["total"] == 4
+    assert stats["chain_keys"][cache.canonical_format] == 4
+    assert stats["fast_path_keys"]["total"] == 1
+
+
+def test_serialization_timings_are_bucketed():
+    for elapsed_ms in (0.02, 0.03, 3.0, 400.0):
+        observe_serialization("cache_chain", "msgpack", elapsed_ms)
+
+    histogram = get_serialization_stats()["cache_chain:msgpack"]
+
+    assert histogram["count"] == 4
+    assert histogram["buckets_ms"]["0.05"] == 2
+    assert histogram["buckets_ms"]["5.0"] == 1
+    assert histogram["buckets_ms"]["+inf"] == 1
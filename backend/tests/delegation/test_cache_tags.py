@@ -0,0 +1,114 @@
+"""Tests for tag-indexed and epoch-versioned delegation cache invalidation."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from backend.models.delegation import Delegation, DelegationMode
+from backend.services.delegation.cache import DelegationCache
+
+
+def _delegation(delegator_id, delegatee_id) -> Delegation:
+    delegation = Delegation()
+    delegation.id = uuid4()
+    delegation.delegator_id = delegator_id
+    delegation.delegatee_id = delegatee_id
+    delegation.mode = DelegationMode.FLEXIBLE_DOMAIN
+    delegation.start_date = datetime.utcnow()
+    return delegation
+
+
+@pytest.fixture
+def cache():
+    return DelegationCache(fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()))
+
+
+@pytest.mark.asyncio
+async def test_invalidation_never_scans_keyspace(cache, monkeypatch):
+    a, b, c = uuid4(), uuid4(), uuid4()
+    a_key = cache.generate_cache_key(a)
+    b_key = cache.generate_cache_key(b)
+    await cache.cache_chain(a_key, [_delegation(a, b), _delegation(b, c)])
+    await cache.cache_chain(b_key, [_delegation(b, c)])
+    await cache.cache_fast_path_result(a, {"delegatee_id": str(b)})
+
+    async def no_keys(*args, **kwargs):
+        raise AssertionError("KEYS must not be used")
+
+    monkeypatch.setattr(cache.redis, "keys", no_keys)
+
+    stats = await cache.get_cache_stats()
+    assert stats["chain_keys"]["total"] == 2
+    assert stats["fast_path_keys"]["total"] == 1
+
+    await cache.invalidate_user_cache(a)
+
+    assert await cache.get_cached_chain(a_key) is None
+    assert await cache.get_fast_path_result(a) is None
+    assert await cache.get_cached_chain(b_key) is not None
+
+
+@pytest.mark.asyncio
+async def test_chains_register_under_their_delegatees(cache):
+    a, b, c = uuid4(), uuid4(), uuid4()
+    await cache.cache_chain(cache.generate_cache_key(a), [_delegation(a, b), _delegation(b, c)])
+
+    _, format_used, _ = cache._serialize_data([])
+    key = cache._add_format_suffix(cache.generate_cache_key(a), format_used)
+    for user_id in (b, c):
+        members = await cache.redis.zrange(cache._delegatee_tag(user_id), 0, -1)
+        assert members == [key.encode()]
+    assert await cache.redis.ttl(cache._user_tag(a)) > 0
+
+
+@pytest.mark.asyncio
+async def test_delegatee_invalidation_evicts_only_dependent_entries(cache):
+    a, b, c, d, e, f = (uuid4() for _ in range(6))
+    through_b = cache.generate_cache_key(a)
+    unrelated = cache.generate_cache_key(e)
+    await cache.cache_chain(through_b, [_delegation(a, b), _delegation(b, c)])
+    await cache.cache_chain(unrelated, [_delegation(e, f)])
+    await cache.cache_fast_path_result(d, {"delegatee_id": str(b), "final_delegatee_id": str(b)})
+
+    # B's delegations changed: only the entries resolving through B go
+    await cache.invalidate_delegatee_cache(b)
+
+    assert await cache.get_cached_chain(through_b) is None
+    assert await cache.get_fast_path_result(d) is None
+    assert await cache.get_cached_chain(unrelated) is not None
+
+
+@pytest.mark.asyncio
+async def test_epoch_bumps_orphan_scope_entries(cache, monkeypatch):
+    a, b = uuid4(), uuid4()
+    poll_id = uuid4()
+
+    async def key(**scope):
+        return cache.generate_cache_key(a, **scope, epoch=await cache.get_scope_epoch(**scope))
+
+    global_key = await key()
+    poll_key = await key(poll_id=poll_id)
+    await cache.cache_chain(global_key, [_delegation(a, b)])
+    await cache.cache_chain(poll_key, [_delegation(a, b)])
+    await cache.cache_fast_path_result(a, {"delegatee_id": str(b)}, poll_id=poll_id)
+
+    # A scope bump only moves that scope's keys
+    await cache.bump_scope_epochs([{"poll_id": str(poll_id)}])
+
+    assert await key(poll_id=poll_id) != poll_key
+    assert await cache.get_cached_chain(await key(poll_id=poll_id)) is None
+    assert await cache.get_fast_path_result(a, poll_id=poll_id) is None
+    assert await key() == global_key
+
+    # Invalidating everything is a single counter increment, not a delete
+    async def no_delete(*args, **kwargs):
+        raise AssertionError("entries must age out by TTL")
+
+    monkeypatch.setattr(cache.redis, "delete", no_delete)
+    await cache.invalidate_all_chain_cache()
+
+    assert await key() != global_key
+    assert await cache.get_cached_chain(await key()) is None
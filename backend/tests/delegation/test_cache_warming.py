@@ -0,0 +1,100 @@
+"""Tests for proactive chain cache warming when a poll opens."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.delegation import Delegation
+from backend.models.label import Label
+from backend.models.user import User
+from backend.services.delegation import cache_warming
+from backend.services.delegation.cache import DelegationCache
+from backend.services.delegation.cache_warming import ChainCacheWarmer
+from backend.services.delegation.dispatch import DelegationDispatch
+
+
+@pytest.mark.asyncio
+async def test_poll_audience_chains_are_warmed(db_session: AsyncSession):
+    users = [
+        User(
+            id=uuid4(),
+            username=f"warm_user_{i}",
+            email=f"warm_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(6)
+    ]
+    a, b, c, d, e, outsider = users
+    label = Label(name="Warming", slug=f"warming-{uuid4().hex[:8]}")
+    start = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all([*users, label])
+    await db_session.commit()
+    db_session.add_all(
+        [
+            Delegation(delegator_id=a.id, delegatee_id=b.id, start_date=start),
+            Delegation(delegator_id=b.id, delegatee_id=c.id, start_date=start),
+            Delegation(delegator_id=d.id, delegatee_id=e.id, label_id=label.id, start_date=start),
+        ]
+    )
+    await db_session.commit()
+
+    cache = DelegationCache(fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()))
+    warmer = ChainCacheWarmer(DelegationDispatch(db_session, cache), batch_size=1, pause_seconds=0)
+    poll_id = uuid4()
+
+    warmed = await warmer.warm_poll(poll_id, [label.id])
+
+    assert warmed == {"global": 2, f"label:{label.id}": 1, "poll": 1}
+
+    global_epoch = await cache.get_scope_epoch()
+    chain = await cache.get_cached_chain(cache.generate_cache_key(a.id, epoch=global_epoch))
+    assert [entry["delegatee_id"] for entry in chain] == [str(b.id), str(c.id)]
+    # Single-hop chains are answered by the fast path
+    fast_path = await cache.get_fast_path_result(b.id, epoch=global_epoch)
+    assert fast_path["is_direct"] and fast_path["delegatee_id"] == str(c.id)
+
+    label_epoch = await cache.get_scope_epoch(label_id=label.id)
+    label_chain = await cache.get_cached_chain(
+        cache.generate_cache_key(d.id, label_id=label.id, epoch=label_epoch)
+    )
+    assert [entry["delegatee_id"] for entry in label_chain] == [str(e.id)]
+
+    # The poll scope is warmed only for poll and label delegators
+    poll_epoch = await cache.get_scope_epoch(poll_id=poll_id)
+    poll_key = cache.generate_cache_key(d.id, poll_id=poll_id, epoch=poll_epoch)
+    assert await cache.get_cached_chain(poll_key) == []
+    for user in (a, b, outsider):
+        key = cache.generate_cache_key(user.id, poll_id=poll_id, epoch=poll_epoch)
+        assert await cache.get_cached_chain(key) is None
+
+    # The next poll only resolves chains not already cached under the current epoch
+    assert await warmer.warm_poll(uuid4(), [label.id]) == {
+        "global": 0,
+        f"label:{label.id}": 0,
+        "poll": 1,
+    }
+    await cache.bump_scope_epochs([{}])
+    assert (await warmer.warm_poll(uuid4()))["global"] == 2
+
+
+@pytest.mark.asyncio
+async def test_warming_is_skipped_while_the_graph_index_is_loaded(
+    db_session: AsyncSession, monkeypatch
+):
+    class LoadedIndex:
+        is_loaded = True
+
+    monkeypatch.setattr(cache_warming, "get_delegation_graph_index", LoadedIndex)
+
+    async def no_bulk_resolution(*args, **kwargs):
+        raise AssertionError("the graph index serves chain lookups")
+
+    cache = DelegationCache(fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()))
+    dispatch = DelegationDispatch(db_session, cache)
+    monkeypatch.setattr(dispatch, "resolve_delegation_chains_bulk", no_bulk_resolution)
+
+    assert await ChainCacheWarmer(dispatch).warm_poll(uuid4()) == {}
@@ -0,0 +1,121 @@
+"""Tests for the binary chain encoding of the delegation cache."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from backend.config import settings
+from backend.models.delegation import Delegation, DelegationMode
+from backend.services.delegation import chain_codec
+from backend.services.delegation.cache import DelegationCache
+from backend.services.delegation.chain_codec import ChainRecord, decode_chain, encode_chain
+from backend.services.delegation.chain_resolution import ChainResolutionCore
+
+
+def _delegation(delegator_id, delegatee_id, **fields) -> Delegation:
+    delegation = Delegation()
+    delegation.id = uuid4()
+    delegation.delegator_id = delegator_id
+    delegation.delegatee_id = delegatee_id
+    delegation.mode = fields.pop("mode", DelegationMode.FLEXIBLE_DOMAIN)
+    delegation.start_date = datetime(2026, 1, 2, 3, 4, 5)
+    delegation.created_at = datetime(2026, 1, 1)
+    for name, value in fields.items():
+        setattr(delegation, name, value)
+    return delegation
+
+
+class TestChainCodec:
+    """Test encoding round-trips and record views."""
+
+    def test_round_trip(self):
+        a, b, c = uuid4(), uuid4(), uuid4()
+        poll_id = uuid4()
+        chain = [
+            _delegation(a, b, poll_id=poll_id),
+            _delegation(
+                b,
+                c,
+                mode=DelegationMode.LEGACY_FIXED_TERM,
+                legacy_term_ends_at=datetime(2030, 1, 1),
+            ),
+        ]
+
+        records = decode_chain(encode_chain(chain))
+
+        assert [(r.id, r.delegator_id, r.delegatee_id) for r in records] == [
+            (str(d.id), str(d.delegator_id), str(d.delegatee_id)) for d in chain
+        ]
+        assert records[0].poll_id == str(poll_id)
+        assert records[0].label_id is None
+        assert records[0].target_type == "poll"
+        assert records[0].start_date == datetime(2026, 1, 2, 3, 4, 5)
+        assert records[0].end_date is None
+        assert records[1].target_type == "global"
+        assert records[1].is_legacy_fixed_term
+        assert records[1].legacy_term_ends_at == datetime(2030, 1, 1)
+
+    def test_timestamps_keep_microseconds(self):
+        created_at = datetime(2026, 1, 1, 12, 30, 15, 123456)
+        delegation = _delegation(uuid4(), uuid4(), created_at=created_at)
+
+        (record,) = decode_chain(encode_chain([delegation]))
+
+        assert record.created_at == created_at
+
+    def test_record_is_unpacked_once(self, monkeypatch):
+        (record,) = decode_chain(encode_chain([_delegation(uuid4(), uuid4())]))
+        calls = []
+        original_unpack_from = chain_codec._RECORD.unpack_from
+
+        class CountingRecord:
+            size = chain_codec._RECORD.size
+
+            @staticmethod
+            def unpack_from(*args):
+                calls.append(args)
+                return original_unpack_from(*args)
+
+        monkeypatch.setattr(chain_codec, "_RECORD", CountingRecord)
+
+        assert record.id and record.delegatee_id and record.start_date and record.target_type
+
+        assert len(calls) == 1
+
+    def test_smaller_than_dict_encoding(self):
+        cache = DelegationCache(fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()))
+        a, b, c = uuid4(), uuid4(), uuid4()
+        chain = [_delegation(a, b), _delegation(b, c)]
+
+        serialized, _, _ = cache._serialize_data(ChainResolutionCore.serialize_chain(chain))
+
+        assert len(encode_chain(chain)) * 2 < len(serialized)
+
+    def test_unrepresentable_delegations_are_rejected(self):
+        with pytest.raises(ValueError):
+            encode_chain([_delegation(uuid4(), uuid4(), poll_id=uuid4(), label_id=uuid4())])
+        with pytest.raises(ValueError):
+            decode_chain(encode_chain([_delegation(uuid4(), uuid4())])[:-1])
+
+
+@pytest.mark.asyncio
+async def test_cache_stores_and_reads_binary_chains(monkeypatch):
+    monkeypatch.setattr(settings, "DELEGATION_CACHE_BINARY_CHAINS_ENABLED", True)
+    cache = DelegationCache(fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()))
+    a, b, c = uuid4(), uuid4(), uuid4()
+    key = cache.generate_cache_key(a, epoch=await cache.get_scope_epoch())
+
+    await cache.cache_chain(key, [_delegation(a, b), _delegation(b, c)])
+    assert await cache.redis.exists(cache._add_format_suffix(key, "binary"))
+
+    cached = await cache.get_cached_chain(key)
+    chain = ChainResolutionCore.deserialize_chain(cached)
+    assert all(isinstance(record, ChainRecord) for record in chain)
+    assert [record.delegatee_id for record in chain] == [str(b), str(c)]
+
+    # Binary entries are registered under the users they run through
+    await cache.invalidate_delegatee_cache(c)
+    assert await cache.get_cached_chain(key) is None
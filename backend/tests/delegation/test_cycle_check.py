@@ -0,0 +1,112 @@
+"""Tests for the circular delegation check on creation."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.core.exceptions.delegation import CircularDelegationError
+from backend.core.post_commit import run_post_commit_hooks
+from backend.models.user import User
+from backend.services.delegation import DelegationService
+from backend.services.delegation.graph_index import get_delegation_graph_index
+
+
+async def _users(db_session: AsyncSession, count: int):
+    users = [
+        User(
+            id=uuid4(),
+            username=f"cycle_user_{i}_{uuid4().hex[:6]}",
+            email=f"cycle_user_{i}_{uuid4().hex[:6]}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+    return users
+
+
+@pytest_asyncio.fixture(params=[False, True], ids=["recursive_query", "reachability_index"])
+async def graph_index_loaded(request, db_session: AsyncSession, monkeypatch):
+    """Answer cycle checks from the reachability index or the recursive query."""
+    index = get_delegation_graph_index()
+    if request.param:
+        monkeypatch.setattr(get_settings(), "DELEGATION_GRAPH_INDEX_ENABLED", True)
+        await index.load(db_session)
+    yield request.param
+    index.clear()
+
+
+async def _create(service: DelegationService, db_session: AsyncSession, **fields):
+    """Create a delegation the way the API does: commit, then run the hooks."""
+    delegation = await service.create_delegation(**fields)
+    await db_session.commit()
+    await run_post_commit_hooks(db_session)
+    return delegation
+
+
+@pytest.mark.asyncio
+async def test_multi_hop_cycle_is_rejected(db_session: AsyncSession, graph_index_loaded):
+    a, b, c, d = await _users(db_session, 4)
+    start = datetime.utcnow() - timedelta(minutes=1)
+    service = DelegationService(db_session)
+
+    await _create(service, db_session, delegator_id=a.id, delegatee_id=b.id, start_date=start)
+    await _create(service, db_session, delegator_id=b.id, delegatee_id=c.id, start_date=start)
+
+    # C -> A would close A -> B -> C -> A
+    with pytest.raises(CircularDelegationError):
+        await service.create_delegation(delegator_id=c.id, delegatee_id=a.id, start_date=start)
+
+    # Joining the chain from outside, or cycling in another scope, is fine
+    await _create(service, db_session, delegator_id=d.id, delegatee_id=a.id, start_date=start)
+    await _create(
+        service, db_session, delegator_id=c.id, delegatee_id=a.id, poll_id=uuid4(), start_date=start
+    )
+
+    # Revoking a hop of the loop lets it be closed
+    poll_id = uuid4()
+    await _create(
+        service, db_session, delegator_id=a.id, delegatee_id=b.id, poll_id=poll_id,
+        start_date=start,
+    )
+    hop = await _create(
+        service, db_session, delegator_id=b.id, delegatee_id=c.id, poll_id=poll_id,
+        start_date=start,
+    )
+    with pytest.raises(CircularDelegationError):
+        await service.create_delegation(
+            delegator_id=c.id, delegatee_id=a.id, poll_id=poll_id, start_date=start
+        )
+    await service.revoke_delegation(hop.id)
+    await db_session.commit()
+    await run_post_commit_hooks(db_session)
+    await _create(
+        service, db_session, delegator_id=c.id, delegatee_id=a.id, poll_id=poll_id,
+        start_date=start,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cycle_longer_than_resolution_depth_is_rejected(
+    db_session: AsyncSession, graph_index_loaded
+):
+    users = await _users(db_session, 13)
+    start = datetime.utcnow() - timedelta(minutes=1)
+    service = DelegationService(db_session)
+
+    for delegator, delegatee in zip(users, users[1:]):
+        await _create(
+            service, db_session, delegator_id=delegator.id, delegatee_id=delegatee.id,
+            start_date=start,
+        )
+
+    # Closing the 13-hop loop is caught past the 10-hop resolution depth
+    with pytest.raises(CircularDelegationError):
+        await service.create_delegation(
+            delegator_id=users[-1].id, delegatee_id=users[0].id, start_date=start
+        )
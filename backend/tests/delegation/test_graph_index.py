@@ -0,0 +1,211 @@
+"""Tests for the in-memory delegation graph index."""
+
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.core.post_commit import run_post_commit_hooks
+from backend.models.delegation import Delegation, DelegationMode
+from backend.models.user import User
+from backend.services.delegation.graph_index import (
+    CHANGES_STREAM_KEY,
+    DelegationGraphIndex,
+    defer_graph_changes,
+)
+
+
+def _delegation(delegator_id, delegatee_id, **fields) -> Delegation:
+    delegation = Delegation()
+    delegation.id = uuid4()
+    delegation.delegator_id = delegator_id
+    delegation.delegatee_id = delegatee_id
+    delegation.mode = fields.pop("mode", DelegationMode.FLEXIBLE_DOMAIN)
+    delegation.start_date = datetime.utcnow() - timedelta(minutes=1)
+    delegation.created_at = datetime.utcnow()
+    for name, value in fields.items():
+        setattr(delegation, name, value)
+    return delegation
+
+
+class TestDelegationGraphIndex:
+    """Test index maintenance and chain resolution."""
+
+    def test_resolve_chain_matches_core(self):
+        user1, user2, user3 = uuid4(), uuid4(), uuid4()
+        index = DelegationGraphIndex()
+        index.upsert(_delegation(user1, user2))
+        index.upsert(_delegation(user2, user3))
+
+        chain = index.resolve_chain(user1)
+
+        assert [d.delegatee_id for d in chain] == [str(user2), str(user3)]
+
+    def test_scopes_are_separate(self):
+        user1, user2, user3 = uuid4(), uuid4(), uuid4()
+        poll_id = uuid4()
+        index = DelegationGraphIndex()
+        index.upsert(_delegation(user1, user2))
+        index.upsert(_delegation(user1, user3, poll_id=poll_id))
+
+        assert index.resolve_chain(user1)[0].delegatee_id == str(user2)
+        assert index.resolve_chain(user1, poll_id=poll_id)[0].delegatee_id == str(user3)
+        assert index.resolve_chain(user1, poll_id=uuid4()) == []
+
+    def test_discard_and_inactive_upserts(self):
+        user1, user2 = uuid4(), uuid4()
+        index = DelegationGraphIndex()
+        delegation = _delegation(user1, user2)
+        index.upsert(delegation)
+        assert len(index) == 1
+
+        index.discard(delegation.id)
+        assert len(index) == 0
+        assert index.resolve_chain(user1) == []
+
+        index.upsert(_delegation(user1, user2, revoked_at=datetime.utcnow()))
+        index.upsert(_delegation(user1, user2, end_date=datetime.utcnow() - timedelta(days=1)))
+        assert len(index) == 0
+
+    def test_upsert_replaces_existing_entry(self):
+        user1, user2, user3 = uuid4(), uuid4(), uuid4()
+        index = DelegationGraphIndex()
+        delegation = _delegation(user1, user2)
+        index.upsert(delegation)
+
+        delegation.delegatee_id = user3
+        index.upsert(delegation)
+
+        assert len(index) == 1
+        assert index.resolve_chain(user1)[0].delegatee_id == str(user3)
+
+
+    def test_is_reachable_follows_chain(self):
+        user1, user2, user3 = uuid4(), uuid4(), uuid4()
+        index = DelegationGraphIndex()
+        index.upsert(_delegation(user1, user2))
+        index.upsert(_delegation(user2, user3))
+
+        assert index.is_reachable(user1, user3)
+        assert index.is_reachable(user2, user3)
+        assert not index.is_reachable(user3, user1)
+        assert not index.is_reachable(user1, user3, poll_id=uuid4())
+
+    def test_reachability_follows_writes_and_ignores_resolution_stops(self):
+        user1, user2, user3, user4 = uuid4(), uuid4(), uuid4(), uuid4()
+        index = DelegationGraphIndex()
+        index.upsert(_delegation(user1, user2))
+        # Chain resolution stops after an expired legacy term; reachability does not
+        index.upsert(
+            _delegation(
+                user2,
+                user3,
+                mode=DelegationMode.LEGACY_FIXED_TERM,
+                legacy_term_ends_at=datetime.utcnow() - timedelta(days=1),
+            )
+        )
+        last_hop = _delegation(user3, user4)
+        index.upsert(last_hop)
+        assert index.is_reachable(user1, user4)
+
+        # Revoked and ended delegations leave the sets of everyone upstream
+        last_hop.revoked_at = datetime.utcnow()
+        index.upsert(last_hop)
+        assert not index.is_reachable(user1, user4)
+        assert index.is_reachable(user1, user3)
+        index.discard(last_hop.id)
+        assert index.is_reachable(user1, user3)
+
+@pytest.mark.asyncio
+async def test_index_follows_writes_from_other_processes(db_session: AsyncSession):
+    users = [
+        User(
+            id=uuid4(),
+            username=f"graph_user_{i}",
+            email=f"graph_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(users)
+    existing = Delegation(
+        delegator_id=users[0].id,
+        delegatee_id=users[1].id,
+        start_date=datetime.utcnow() - timedelta(minutes=1),
+    )
+    db_session.add(existing)
+    await db_session.commit()
+
+    redis_client = fakeredis.aioredis.FakeRedis()
+    index = DelegationGraphIndex(sync_interval_seconds=0)
+    await index.load(db_session, redis_client)
+    assert [d.delegatee_id for d in index.resolve_chain(users[0].id)] == [str(users[1].id)]
+
+    # Another worker adds a hop; this process only sees the published change
+    added = Delegation(
+        delegator_id=users[1].id,
+        delegatee_id=users[2].id,
+        start_date=datetime.utcnow() - timedelta(minutes=1),
+    )
+    db_session.add(added)
+    await db_session.commit()
+    await DelegationGraphIndex().publish_change(redis_client, added.id)
+
+    await index.sync(db_session, redis_client)
+    assert [d.delegatee_id for d in index.resolve_chain(users[0].id)] == [
+        str(users[1].id),
+        str(users[2].id),
+    ]
+
+    # ...then revokes the first hop
+    existing.revoked_at = datetime.utcnow()
+    await db_session.commit()
+    await DelegationGraphIndex().publish_change(redis_client, existing.id)
+
+    await index.sync(db_session, redis_client)
+    assert index.resolve_chain(users[0].id) == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_syncs_reload_once(db_session: AsyncSession, monkeypatch):
+    index = DelegationGraphIndex(sync_interval_seconds=0, reload_interval_seconds=0)
+    load = index.load
+    loads = []
+
+    async def slow_load(db, redis_client=None):
+        loads.append(db)
+        await asyncio.sleep(0.01)
+        await load(db, redis_client)
+
+    monkeypatch.setattr(index, "load", slow_load)
+
+    await asyncio.gather(*(index.sync(db_session, force=True) for _ in range(3)))
+    assert len(loads) == 1 and index.is_loaded
+
+    # A sync requested after that reload is due for its own
+    await index.sync(db_session, force=True)
+    assert len(loads) == 2
+
+
+@pytest.mark.asyncio
+async def test_changes_are_published_only_after_commit(db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(get_settings(), "DELEGATION_GRAPH_INDEX_ENABLED", True)
+    redis_client = fakeredis.aioredis.FakeRedis()
+
+    # A rolled back write is never announced
+    defer_graph_changes(db_session, redis_client, upserted=[_delegation(uuid4(), uuid4())])
+    await db_session.rollback()
+    await run_post_commit_hooks(db_session)
+    assert await redis_client.xlen(CHANGES_STREAM_KEY) == 0
+
+    delegation = _delegation(uuid4(), uuid4())
+    defer_graph_changes(db_session, redis_client, removed_ids=[delegation.id])
+    assert await redis_client.xlen(CHANGES_STREAM_KEY) == 0
+
+    await db_session.commit()
+    await run_post_commit_hooks(db_session)
+    assert await redis_client.xlen(CHANGES_STREAM_KEY) == 1
@@ -0,0 +1,110 @@
+"""Tests for the in-process delegation cache tier."""
+
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from backend.models.delegation import Delegation, DelegationMode
+from backend.services.delegation.cache import DelegationCache
+from backend.services.delegation.cache_metrics import CACHE_COUNTERS
+from backend.services.delegation.local_cache import LocalCacheTier
+
+
+def _delegation(delegator_id, delegatee_id) -> Delegation:
+    delegation = Delegation()
+    delegation.id = uuid4()
+    delegation.delegator_id = delegator_id
+    delegation.delegatee_id = delegatee_id
+    delegation.mode = DelegationMode.FLEXIBLE_DOMAIN
+    delegation.start_date = datetime.utcnow()
+    return delegation
+
+
+class TestLocalCacheTier:
+    """Test LRU bounds, TTL and dependency invalidation."""
+
+    def test_evicts_least_recently_used_over_byte_cap(self):
+        tier = LocalCacheTier(max_bytes=100)
+        tier.set("a", "A", 40, ["u1"])
+        tier.set("b", "B", 40, ["u2"])
+        assert tier.get("a") == "A"
+
+        tier.set("c", "C", 40, ["u3"])
+
+        assert tier.get("b") is None
+        assert tier.get("a") == "A"
+        assert tier.get("c") == "C"
+        assert tier.stats()["bytes"] == 80
+
+    def test_entries_expire(self):
+        tier = LocalCacheTier(ttl_seconds=0)
+        tier.set("a", "A", 1, ["u1"])
+        tier.set_epoch("scope", "1.0")
+
+        assert tier.get("a") is None
+        assert tier.get_epoch("scope") is None
+        assert len(tier) == 0
+
+    def test_messages_drop_dependent_entries_and_epochs(self):
+        tier = LocalCacheTier()
+        tier.set("chain:a", ["a->b->c"], 1, ["a", "b", "c"])
+        tier.set("chain:d", ["d->e"], 1, ["d", "e"])
+        tier.set_epoch("scope", "0.0")
+
+        tier.apply_message(b"user:b")
+        tier.apply_message("epoch")
+
+        assert tier.get("chain:a") is None
+        assert tier.get("chain:d") == ["d->e"]
+        assert tier.get_epoch("scope") is None
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_skip_redis(monkeypatch):
+    redis_client = fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer())
+    cache = DelegationCache(redis_client, local_tier=LocalCacheTier())
+    a, b = uuid4(), uuid4()
+    key = cache.generate_cache_key(a, epoch=await cache.get_scope_epoch())
+    await cache.cache_chain(key, [_delegation(a, b)])
+
+    async def no_network(*args, **kwargs):
+        raise AssertionError("served from the local tier")
+
+    hits = CACHE_COUNTERS[("l1", "chain", "hits")]
+    monkeypatch.setattr(redis_client, "get", no_network)
+    monkeypatch.setattr(redis_client, "mget", no_network)
+
+    assert (await cache.get_cached_chain(key))[0]["delegatee_id"] == str(b)
+    assert await cache.get_scope_epoch() == "0.0"
+    assert CACHE_COUNTERS[("l1", "chain", "hits")] == hits + 1
+    assert cache.get_tier_stats()["l1"]["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidations_reach_other_workers():
+    redis_client = fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer())
+    writer = DelegationCache(redis_client, local_tier=LocalCacheTier())
+    reader_tier = LocalCacheTier()
+    reader = DelegationCache(redis_client, local_tier=reader_tier)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    key = reader.generate_cache_key(a, epoch=await reader.get_scope_epoch())
+    await reader.cache_chain(key, [_delegation(a, b), _delegation(b, c)])
+
+    listener = asyncio.create_task(reader_tier.listen(redis_client))
+    try:
+        await asyncio.sleep(0.05)
+        await writer.invalidate_delegatee_cache(b)
+        for _ in range(50):
+            if reader_tier.get(key) is None:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+    assert reader_tier.get(key) is None
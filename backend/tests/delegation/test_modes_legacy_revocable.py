@@ -4,8 +4,12 @@ import pytest
 from datetime import datetime, timedelta
 from uuid import uuid4
 
+import fakeredis
+import fakeredis.aioredis
+
 from backend.models.delegation import Delegation, DelegationMode
 from backend.services.delegation import DelegationService
+from backend.services.delegation.cache import DelegationCache
 from backend.core.exceptions.delegation import DelegationError
 
 
@@ -78,6 +82,30 @@ class TestLegacyDelegationRevocability:
         # Verify expiry was processed
         assert result["expired_count"] >= 1
 
+    @pytest.mark.asyncio
+    async def test_legacy_expiry_moves_scope_epoch(self, db_session, user1, user2):
+        """Test that the expiry job invalidates cached chains once committed."""
+        delegation_service = DelegationService(db_session)
+        delegation_service.cache = DelegationCache(
+            fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer())
+        )
+        db_session.add(
+            Delegation(
+                delegator_id=user1.id,
+                delegatee_id=user2.id,
+                mode=DelegationMode.LEGACY_FIXED_TERM,
+                start_date=datetime.utcnow() - timedelta(days=2),
+                legacy_term_ends_at=datetime.utcnow() - timedelta(days=1),
+            )
+        )
+        await db_session.commit()
+        epoch = await delegation_service.cache.get_scope_epoch()
+
+        result = await delegation_service.expire_legacy_delegations()
+
+        assert result["expired_count"] >= 1
+        assert await delegation_service.cache.get_scope_epoch() != epoch
+
     @pytest.mark.asyncio
     async def test_user_override_stops_chain_resolution(self, db_session, user1, user2, user3):
         """Test that user overrides stop chain resolution immediately."""
@@ -0,0 +1,150 @@
+"""Tests for single-query recursive delegation chain resolution."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import settings
+from backend.models.delegation import Delegation, DelegationMode
+from backend.models.user import User
+from backend.services.delegation import DelegationService
+from backend.services.delegation.chain_resolution import ChainResolutionCore
+from backend.services.delegation.repository import DelegationRepository
+
+
+async def _users(db_session: AsyncSession, count: int):
+    users = [
+        User(
+            id=uuid4(),
+            username=f"cte_user_{i}_{uuid4().hex[:6]}",
+            email=f"cte_user_{i}_{uuid4().hex[:6]}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+    return users
+
+
+def _path(chain):
+    return [str(delegation.delegatee_id) for delegation in chain]
+
+
+@pytest.mark.asyncio
+async def test_recursive_chain_matches_in_memory_resolution(db_session: AsyncSession):
+    users = await _users(db_session, 6)
+    start = datetime.utcnow() - timedelta(minutes=1)
+    poll_id = uuid4()
+    db_session.add_all(
+        [Delegation(delegator_id=u.id, delegatee_id=v.id, start_date=start) for u, v in zip(users, users[1:])]
+        + [
+            # Scoped and revoked delegations are not part of the global chain
+            Delegation(delegator_id=users[1].id, delegatee_id=users[5].id, poll_id=poll_id, start_date=start),
+            Delegation(
+                delegator_id=users[2].id,
+                delegatee_id=users[0].id,
+                start_date=start,
+                revoked_at=datetime.utcnow(),
+            ),
+        ]
+    )
+    await db_session.commit()
+    repository = DelegationRepository(db_session)
+
+    statements = []
+
+    def count_statement(*args):
+        statements.append(args[2])
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count_statement)
+    try:
+        chain = await repository.get_delegation_chain_recursive(users[0].id)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+    expected = ChainResolutionCore.resolve_chain_from_delegations(
+        str(users[0].id), await repository.get_all_active_delegations()
+    )
+    assert _path(chain) == _path(expected) == [str(u.id) for u in users[1:]]
+    assert len(statements) == 1
+
+    assert _path(await repository.get_delegation_chain_recursive(users[1].id, poll_id=poll_id)) == [
+        str(users[5].id)
+    ]
+    assert _path(await repository.get_delegation_chain_recursive(users[0].id, max_depth=2)) == [
+        str(users[1].id),
+        str(users[2].id),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recursive_chain_priority_cycles_and_legacy_expiry(db_session: AsyncSession):
+    a, b, c, d = await _users(db_session, 4)
+    start = datetime.utcnow() - timedelta(days=2)
+    db_session.add_all(
+        [
+            # Hybrid seed wins over an older flexible delegation
+            Delegation(delegator_id=a.id, delegatee_id=c.id, start_date=start, created_at=start),
+            Delegation(
+                delegator_id=a.id,
+                delegatee_id=b.id,
+                mode=DelegationMode.HYBRID_SEED,
+                start_date=start,
+                created_at=datetime.utcnow(),
+            ),
+            # B <-> C cycle is bounded by max_depth
+            Delegation(delegator_id=b.id, delegatee_id=c.id, start_date=start),
+            Delegation(delegator_id=c.id, delegatee_id=b.id, start_date=start),
+            # An expired legacy delegation ends the chain after itself
+            Delegation(
+                delegator_id=d.id,
+                delegatee_id=a.id,
+                mode=DelegationMode.LEGACY_FIXED_TERM,
+                start_date=start,
+                legacy_term_ends_at=datetime.utcnow() - timedelta(days=1),
+            ),
+        ]
+    )
+    await db_session.commit()
+    repository = DelegationRepository(db_session)
+
+    chain = await repository.get_delegation_chain_recursive(a.id, max_depth=4)
+    assert _path(chain) == [str(b.id), str(c.id), str(b.id), str(c.id)]
+
+    assert _path(await repository.get_delegation_chain_recursive(d.id)) == [str(a.id)]
+
+
+@pytest.mark.asyncio
+async def test_service_uses_recursive_query_when_enabled(db_session: AsyncSession, monkeypatch):
+    a, b, c = await _users(db_session, 3)
+    start = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all(
+        [
+            Delegation(delegator_id=a.id, delegatee_id=b.id, start_date=start),
+            Delegation(delegator_id=b.id, delegatee_id=c.id, start_date=start),
+        ]
+    )
+    await db_session.commit()
+    monkeypatch.setattr(settings, "DELEGATION_CHAIN_CTE_ENABLED", True)
+
+    service = DelegationService(db_session)
+    calls = []
+    original = service.repository.get_delegation_chain_recursive
+
+    async def recording(*args, **kwargs):
+        calls.append(args)
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(
+        service.dispatch.async_dispatch.repository, "get_delegation_chain_recursive", recording
+    )
+
+    chain = await service.resolve_delegation_chain(a.id)
+
+    assert _path(chain) == [str(b.id), str(c.id)]
+    assert len(calls) == 1
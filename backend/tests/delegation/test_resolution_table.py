@@ -0,0 +1,96 @@
+"""Tests for the materialized delegation resolution table."""
+
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import settings
+from backend.models.delegation_resolution import DelegationResolution
+from backend.models.user import User
+from backend.services.delegation import DelegationResolutionStore, DelegationService
+
+
+async def _users(db_session: AsyncSession, count: int):
+    users = [
+        User(
+            id=uuid4(),
+            username=f"resolution_user_{i}_{uuid4().hex[:6]}",
+            email=f"resolution_user_{i}_{uuid4().hex[:6]}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+    return users
+
+
+async def _table(db_session: AsyncSession, scope_key: str = "global"):
+    result = await db_session.execute(
+        select(DelegationResolution).where(DelegationResolution.scope_key == scope_key)
+    )
+    return {
+        row.user_id: (row.final_delegatee_id, row.chain_length)
+        for row in result.scalars()
+    }
+
+
+def test_scope_keys():
+    poll_id = uuid4()
+    assert DelegationResolutionStore.scope_key() == "global"
+    assert DelegationResolutionStore.scope_key(poll_id=poll_id) == f"poll:{poll_id}"
+    assert DelegationResolutionStore.scope_key(label_id=poll_id) == f"label:{poll_id}"
+
+
+@pytest.mark.asyncio
+async def test_writes_repoint_upstream_subtree(db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(settings, "DELEGATION_RESOLUTION_TABLE_ENABLED", True)
+    a, b, c, d = await _users(db_session, 4)
+    ids = {user: str(user.id) for user in (a, b, c, d)}
+    service = DelegationService(db_session)
+    store = DelegationResolutionStore(db_session)
+
+    b_to_c = await service.create_delegation(delegator_id=b.id, delegatee_id=c.id)
+    await service.create_delegation(delegator_id=a.id, delegatee_id=b.id)
+    await service.create_delegation(delegator_id=d.id, delegatee_id=a.id)
+
+    assert await _table(db_session) == {
+        ids[a]: (ids[c], 2),
+        ids[b]: (ids[c], 1),
+        ids[d]: (ids[c], 3),
+    }
+    resolution = await store.get_resolution(d.id)
+    assert json.loads(resolution.path) == [ids[d], ids[a], ids[b], ids[c]]
+    assert await store.count_represented(c.id) == 3
+
+    # Revoking B -> C re-points everyone upstream of B to B
+    await service.revoke_delegation(b_to_c.id)
+
+    assert await _table(db_session) == {
+        ids[a]: (ids[b], 1),
+        ids[d]: (ids[b], 2),
+    }
+    assert await store.get_resolution(b.id) is None
+    assert await store.count_represented(b.id) == 2
+
+    # A full rebuild agrees with the incrementally maintained rows
+    incremental = await _table(db_session)
+    await store.rebuild()
+    assert await _table(db_session) == incremental
+
+
+@pytest.mark.asyncio
+async def test_scopes_are_kept_apart(db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(settings, "DELEGATION_RESOLUTION_TABLE_ENABLED", True)
+    a, b, c = await _users(db_session, 3)
+    poll_id = uuid4()
+    service = DelegationService(db_session)
+
+    await service.create_delegation(delegator_id=a.id, delegatee_id=b.id)
+    await service.create_delegation(delegator_id=a.id, delegatee_id=c.id, poll_id=poll_id)
+
+    assert await _table(db_session) == {str(a.id): (str(b.id), 1)}
+    assert await _table(db_session, f"poll:{poll_id}") == {str(a.id): (str(c.id), 1)}
@@ -0,0 +1,136 @@
+"""Tests for stampede protection on delegation chain cache misses."""
+
+import asyncio
+import random
+from datetime import datetime
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from backend.models.delegation import Delegation, DelegationMode
+from backend.services.delegation.cache import DelegationCache
+from backend.services.delegation.stampede import LEASE_PREFIX, ChainStampedeGuard
+
+
+def _delegation(delegator_id, delegatee_id) -> Delegation:
+    delegation = Delegation()
+    delegation.id = uuid4()
+    delegation.delegator_id = delegator_id
+    delegation.delegatee_id = delegatee_id
+    delegation.mode = DelegationMode.FLEXIBLE_DOMAIN
+    delegation.start_date = datetime.utcnow()
+    return delegation
+
+
+@pytest.fixture
+def cache():
+    return DelegationCache(fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer()))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_resolve_once(cache):
+    guard = ChainStampedeGuard()
+    a, b = uuid4(), uuid4()
+    key = cache.generate_cache_key(a, epoch=await cache.get_scope_epoch())
+    calls = []
+
+    async def resolve():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        chain = [_delegation(a, b)]
+        await cache.cache_chain(key, chain)
+        return chain
+
+    chains = await asyncio.gather(*(guard.run(cache, key, resolve) for _ in range(10)))
+
+    assert len(calls) == 1
+    assert {str(chain[0].delegatee_id) for chain in chains} == {str(b)}
+    assert not await cache.redis.exists(f"{LEASE_PREFIX}:{key}")
+
+
+@pytest.mark.asyncio
+async def test_lease_holder_elsewhere_is_waited_for(cache):
+    # Two guards stand in for two workers sharing Redis
+    holder, waiter = ChainStampedeGuard(), ChainStampedeGuard(poll_interval_seconds=0.01)
+    a, b = uuid4(), uuid4()
+    key = cache.generate_cache_key(a, epoch=await cache.get_scope_epoch())
+    waiter_calls = []
+
+    async def slow_resolve():
+        await asyncio.sleep(0.1)
+        chain = [_delegation(a, b)]
+        await cache.cache_chain(key, chain)
+        return chain
+
+    async def waiter_resolve():
+        waiter_calls.append(1)
+        return []
+
+    leader = asyncio.create_task(holder.run(cache, key, slow_resolve))
+    await asyncio.sleep(0.01)
+    chain = await waiter.run(cache, key, waiter_resolve)
+    await leader
+
+    assert waiter_calls == []
+    assert str(chain[0].delegatee_id) == str(b)
+
+
+@pytest.mark.asyncio
+async def test_failed_resolution_is_not_shared(cache):
+    guard = ChainStampedeGuard()
+    key = cache.generate_cache_key(uuid4(), epoch=await cache.get_scope_epoch())
+
+    async def failing_resolve():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("database unavailable")
+
+    async def resolve():
+        return []
+
+    leader = asyncio.create_task(guard.run(cache, key, failing_resolve))
+    await asyncio.sleep(0)
+    assert await guard.run(cache, key, resolve) == []
+    with pytest.raises(RuntimeError):
+        await leader
+
+
+def test_early_refresh_probability():
+    guard = ChainStampedeGuard()
+
+    assert not guard.should_refresh_early(None)
+    assert guard.should_refresh_early(0)
+    assert not guard.should_refresh_early(3600)
+
+
+def test_early_refresh_probability_rises_as_ttl_runs_out(monkeypatch):
+    guard = ChainStampedeGuard(early_refresh_beta=10.0, recompute_floor_seconds=1.0)
+    rng = random.Random(7)
+    monkeypatch.setattr(random, "random", rng.random)
+
+    def refresh_rate(remaining_seconds: float) -> float:
+        return sum(guard.should_refresh_early(remaining_seconds) for _ in range(2000)) / 2000
+
+    rates = [refresh_rate(remaining) for remaining in (120, 30, 10, 2)]
+
+    assert rates == sorted(rates)
+    assert rates[0] < 0.01
+    # Refreshes are spread over the last tens of seconds, not the last instant
+    assert 0.2 < rates[2] < 0.6
+    assert rates[3] > 0.7
+
+
+@pytest.mark.asyncio
+async def test_recompute_estimate_is_seeded_by_measured_resolution(cache):
+    guard = ChainStampedeGuard(recompute_floor_seconds=0.0)
+    key = cache.generate_cache_key(uuid4(), epoch=await cache.get_scope_epoch())
+    assert guard.recompute_seconds is None
+
+    async def resolve():
+        await asyncio.sleep(0.05)
+        return []
+
+    await guard.run(cache, key, resolve)
+
+    assert guard.recompute_seconds >= 0.05
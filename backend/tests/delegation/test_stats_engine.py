@@ -0,0 +1,105 @@
+"""Tests for whole-graph delegation statistics."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.delegation import Delegation
+from backend.models.user import User
+from backend.services.delegation import DelegationService
+from backend.services.delegation.stats_engine import DelegationStatsCore
+
+# A -> B -> C -> D, E -> C, and a cycle F -> G -> H -> F entered from I
+EDGES = [
+    ("a", "b"),
+    ("b", "c"),
+    ("c", "d"),
+    ("e", "c"),
+    ("f", "g"),
+    ("g", "h"),
+    ("h", "f"),
+    ("i", "f"),
+]
+
+
+def test_chain_lengths_and_cycles():
+    stats = DelegationStatsCore.compute(EDGES, use_numpy=False)
+
+    assert stats["active_delegations"] == 8
+    assert stats["unique_delegators"] == 8
+    assert stats["unique_delegatees"] == 6
+    # a: 3, b: 2, c: 1, e: 2; the cyclic f, g, h and i are left out
+    assert stats["avg_chain_length"] == 2.0
+    assert stats["max_chain_length"] == 3
+    assert stats["cycles_detected"] == 1
+    assert stats["top_delegatees"][:2] == [("c", 2), ("f", 2)]
+
+
+def test_first_edge_per_delegator_is_followed():
+    # A's second delegation is counted but its chain follows A -> B only
+    stats = DelegationStatsCore.compute([("a", "b"), ("a", "c"), ("c", "d")], use_numpy=False)
+
+    assert stats["active_delegations"] == 3
+    assert stats["unique_delegators"] == 2
+    assert stats["max_chain_length"] == 1
+    assert stats["cycles_detected"] == 0
+
+
+def test_empty_graph():
+    stats = DelegationStatsCore.compute([], use_numpy=False)
+
+    assert stats["active_delegations"] == 0
+    assert stats["avg_chain_length"] == 0.0
+    assert stats["max_chain_length"] == 0
+    assert stats["top_delegatees"] == []
+
+
+def test_numpy_matches_python():
+    pytest.importorskip("numpy")
+    edges = EDGES + [("j", "j"), ("k", "l"), ("l", "k"), ("m", "k")]
+
+    assert DelegationStatsCore.compute(edges, use_numpy=True) == DelegationStatsCore.compute(
+        edges, use_numpy=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_stats_over_database(db_session: AsyncSession):
+    users = [
+        User(
+            id=uuid4(),
+            username=f"stats_user_{i}_{uuid4().hex[:6]}",
+            email=f"stats_user_{i}_{uuid4().hex[:6]}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(3)
+    ]
+    a, b, c = users
+    poll_id = uuid4()
+    start = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all(users)
+    db_session.add_all(
+        [
+            Delegation(delegator_id=a.id, delegatee_id=b.id, start_date=start),
+            Delegation(delegator_id=b.id, delegatee_id=c.id, start_date=start),
+            # Delegatee without a user row is reported as orphaned
+            Delegation(delegator_id=c.id, delegatee_id=uuid4(), poll_id=poll_id, start_date=start),
+        ]
+    )
+    await db_session.commit()
+
+    service = DelegationService(db_session)
+
+    stats = await service.get_delegation_stats()
+    assert stats["active_delegations"] == 2
+    assert stats["max_chain_length"] == 2
+    assert stats["orphaned_delegations"] == 0
+    assert stats["top_delegatees"][0][1] == 1
+    assert stats["poll_id"] is None
+
+    poll_stats = await service.get_delegation_stats(poll_id)
+    assert poll_stats["active_delegations"] == 1
+    assert poll_stats["orphaned_delegations"] == 1
+    assert poll_stats["poll_id"] == str(poll_id)
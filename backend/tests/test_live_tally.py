@@ -0,0 +1,213 @@
+"""Tests for live poll tallies kept in Redis."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import settings
+from backend.models.delegation import Delegation
+from backend.models.option import Option
+from backend.models.poll import Poll, PollStatus
+from backend.models.user import User
+from backend.models.vote import Vote
+from backend.services.live_tally import LiveTallyService, TallyDelta
+from backend.services.poll_tally import PollTallyCore, PollTallyEngine
+
+
+def _counts(results):
+    return {str(r.option_id): (r.direct_votes, r.delegated_votes, r.total_votes) for r in results}
+
+
+async def _db_counts(db_session: AsyncSession, poll: Poll):
+    engine = PollTallyEngine(db_session)
+    loaded = await engine.load_poll(poll.id)
+    return _counts(PollTallyCore.tally(await engine.load_input(loaded)))
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest_asyncio.fixture
+async def open_poll(db_session: AsyncSession, test_user: User):
+    users = [
+        User(
+            id=uuid4(),
+            username=f"live_user_{i}",
+            email=f"live_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(4)
+    ]
+    poll = Poll(id=uuid4(), title="Live Poll", created_by=test_user.id, status=PollStatus.ACTIVE)
+    db_session.add_all(users + [poll])
+    await db_session.commit()
+
+    yes = Option(id=uuid4(), poll_id=poll.id, text="Yes")
+    no = Option(id=uuid4(), poll_id=poll.id, text="No")
+    db_session.add_all([yes, no])
+    await db_session.commit()
+    return poll, yes, no, users
+
+
+def test_tally_delta_fields():
+    delta = TallyDelta()
+    delta.add("a", direct=1, delegated=2)
+    delta.add("b", delegated=-2)
+    delta.add("a", delegated=-2)
+
+    assert delta.fields() == {
+        "a:direct": 1,
+        "a:total": 1,
+        "b:delegated": -2,
+        "b:total": -2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_results_unseeded_until_seed(db_session: AsyncSession, redis_client, open_poll):
+    poll, yes, no, _ = open_poll
+    service = LiveTallyService(db_session, redis_client)
+
+    assert await service.get_results(poll.id) is None
+
+    # Deltas alone never make a tally trusted
+    delta = TallyDelta()
+    delta.add(yes.id, direct=1)
+    await service.apply(poll.id, delta)
+    assert await service.get_results(poll.id) is None
+
+    engine = PollTallyEngine(db_session)
+    results = PollTallyCore.tally(await engine.load_input(await engine.load_poll(poll.id)))
+    await service.seed(poll.id, results)
+
+    live = await service.get_results(poll.id)
+    assert _counts(live) == _counts(results)
+    assert [r.text for r in live] == [r.text for r in results]
+
+
+@pytest.mark.asyncio
+async def test_vote_and_delegation_deltas_match_database(
+    db_session: AsyncSession, redis_client, open_poll
+):
+    """A -> B -> C chain: live counters follow votes and delegation writes."""
+    poll, yes, no, (a, b, c, d) = open_poll
+    service = LiveTallyService(db_session, redis_client)
+    start = datetime.utcnow() - timedelta(minutes=1)
+
+    db_session.add_all(
+        [
+            Delegation(delegator_id=a.id, delegatee_id=b.id, start_date=start),
+            Delegation(delegator_id=b.id, delegatee_id=c.id, start_date=start),
+        ]
+    )
+    await db_session.commit()
+    engine = PollTallyEngine(db_session)
+    await service.seed(
+        poll.id, PollTallyCore.tally(await engine.load_input(await engine.load_poll(poll.id)))
+    )
+
+    # C votes: A and B follow
+    vote_c = Vote(user_id=c.id, poll_id=poll.id, option_id=yes.id, weight=1)
+    db_session.add(vote_c)
+    await db_session.commit()
+    await service.record_vote_cast(vote_c)
+    assert _counts(await service.get_results(poll.id)) == await _db_counts(db_session, poll)
+    assert _counts(await service.get_results(poll.id))[str(yes.id)] == (1, 2, 3)
+
+    # B overrides with a direct vote for "No": A follows B
+    vote_b = Vote(user_id=b.id, poll_id=poll.id, option_id=no.id, weight=1)
+    db_session.add(vote_b)
+    await db_session.commit()
+    await service.record_vote_cast(vote_b)
+    assert _counts(await service.get_results(poll.id)) == await _db_counts(db_session, poll)
+
+    # B switches to "Yes"
+    vote_b.option_id = yes.id
+    await db_session.commit()
+    await service.record_vote_changed(vote_b, no.id, 1)
+    assert _counts(await service.get_results(poll.id)) == await _db_counts(db_session, poll)
+
+    # D delegates to A: joins the block behind B
+    delegation = Delegation(delegator_id=d.id, delegatee_id=a.id, start_date=start)
+    snapshot = await service.capture_routes(d.id)
+    db_session.add(delegation)
+    await db_session.flush()
+    await service.apply_route_changes(snapshot)
+    assert _counts(await service.get_results(poll.id)) == await _db_counts(db_session, poll)
+
+    # B removes their vote: A and D flow on to C
+    await db_session.delete(vote_b)
+    await db_session.commit()
+    await service.record_vote_removed(vote_b)
+    assert _counts(await service.get_results(poll.id)) == await _db_counts(db_session, poll)
+    assert _counts(await service.get_results(poll.id))[str(yes.id)] == (1, 3, 4)
+
+
+@pytest.mark.asyncio
+async def test_global_delegation_patches_every_open_poll(
+    db_session: AsyncSession, redis_client, open_poll, test_user: User, monkeypatch
+):
+    """Global writes are routed in batches across open polls instead of dropping tallies."""
+    monkeypatch.setattr(settings, "LIVE_TALLY_DELTA_BATCH_SIZE", 1)
+    poll, yes, no, (a, b, c, d) = open_poll
+    other = Poll(id=uuid4(), title="Other Poll", created_by=test_user.id, status=PollStatus.ACTIVE)
+    db_session.add(other)
+    await db_session.commit()
+    other_yes = Option(id=uuid4(), poll_id=other.id, text="Yes")
+    db_session.add(other_yes)
+    await db_session.commit()
+
+    start = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all(
+        [
+            Delegation(delegator_id=a.id, delegatee_id=b.id, start_date=start),
+            Vote(user_id=c.id, poll_id=poll.id, option_id=no.id, weight=1),
+            Vote(user_id=c.id, poll_id=other.id, option_id=other_yes.id, weight=1),
+        ]
+    )
+    await db_session.commit()
+    service = LiveTallyService(db_session, redis_client)
+    engine = PollTallyEngine(db_session)
+    for seeded in (poll, other):
+        loaded = await engine.load_poll(seeded.id)
+        await service.seed(seeded.id, PollTallyCore.tally(await engine.load_input(loaded)))
+
+    # B delegates to C: B and A now follow C in both polls
+    snapshot = await service.capture_routes(b.id)
+    db_session.add(Delegation(delegator_id=b.id, delegatee_id=c.id, start_date=start))
+    await db_session.commit()
+    await service.apply_route_changes(snapshot)
+
+    for patched in (poll, other):
+        assert _counts(await service.get_results(patched.id)) == await _db_counts(
+            db_session, patched
+        )
+    assert _counts(await service.get_results(other.id))[str(other_yes.id)] == (1, 2, 3)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_corrects_drift(db_session: AsyncSession, redis_client, open_poll):
+    poll, yes, no, (a, *_) = open_poll
+    service = LiveTallyService(db_session, redis_client)
+
+    db_session.add(Vote(user_id=a.id, poll_id=poll.id, option_id=yes.id, weight=1))
+    await db_session.commit()
+    engine = PollTallyEngine(db_session)
+    await service.seed(
+        poll.id, PollTallyCore.tally(await engine.load_input(await engine.load_poll(poll.id)))
+    )
+
+    drift = TallyDelta()
+    drift.add(no.id, direct=5)
+    await service.apply(poll.id, drift)
+
+    summary = await service.reconcile_open_polls()
+
+    assert summary == {"checked": 1, "corrected": 1}
+    assert _counts(await service.get_results(poll.id)) == await _db_counts(db_session, poll)
@@ -0,0 +1,178 @@
+"""Tests for version-keyed conditional GETs of the poll detail endpoint."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.delegation import Delegation
+from backend.models.option import Option
+from backend.models.poll import Poll
+from backend.models.user import User
+from backend.services import poll_version
+
+
+@pytest.fixture
+def version_redis(monkeypatch):
+    redis_client = fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer())
+
+    async def get_redis_client():
+        return redis_client
+
+    monkeypatch.setattr(poll_version, "get_redis_client", get_redis_client)
+    return redis_client
+
+
+@pytest.mark.asyncio
+async def test_unchanged_poll_detail_is_not_modified(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers, version_redis
+):
+    poll = Poll(id=uuid4(), title="ETag Poll", created_by=test_user.id)
+    db_session.add(poll)
+    await db_session.commit()
+    option = Option(id=uuid4(), poll_id=poll.id, text="Yes")
+    db_session.add(option)
+    await db_session.commit()
+
+    response = await client.get(f"/api/polls/{poll.id}", headers=auth_headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('"')
+
+    statements = []
+
+    def count_statement(*args):
+        statements.append(args[2])
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count_statement)
+    try:
+        response = await client.get(
+            f"/api/polls/{poll.id}", headers={**auth_headers, "If-None-Match": etag}
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_statement)
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    # Only authentication touches the database
+    assert not any("polls" in statement for statement in statements)
+
+    # A vote moves the poll to a new version
+    response = await client.post(
+        "/api/votes/",
+        json={"poll_id": str(poll.id), "option_id": str(option.id)},
+        headers=auth_headers,
+    )
+    assert response.status_code in (200, 201)
+    response = await client.get(
+        f"/api/polls/{poll.id}", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["your_vote_status"]["status"] == "voted"
+
+
+@pytest.mark.asyncio
+async def test_unknown_poll_leaves_no_version(
+    client: AsyncClient, auth_headers, version_redis
+):
+    response = await client.get(f"/api/polls/{uuid4()}", headers=auth_headers)
+    assert response.status_code == 404
+    assert await version_redis.keys("*") == []
+
+
+@pytest.mark.asyncio
+async def test_pending_delegation_moves_the_version_when_it_starts(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    test_user2: User,
+    auth_headers,
+    version_redis,
+):
+    poll = Poll(id=uuid4(), title="Timed Poll", created_by=test_user.id)
+    db_session.add(poll)
+    await db_session.commit()
+    starts_at = datetime.utcnow() + timedelta(hours=1)
+    db_session.add(
+        Delegation(
+            delegator_id=test_user.id,
+            delegatee_id=test_user2.id,
+            poll_id=poll.id,
+            start_date=starts_at,
+        )
+    )
+    await db_session.commit()
+
+    response = await client.get(f"/api/polls/{poll.id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["your_vote_status"]["status"] == "none"
+    etag = response.headers["etag"]
+    change_key = poll_version.change_key(poll.id)
+    scheduled = await version_redis.zscore(change_key, "next")
+    assert scheduled == pytest.approx(starts_at.replace(tzinfo=timezone.utc).timestamp(), abs=1)
+
+    # Once the start time has passed, the old ETag no longer matches
+    await version_redis.zadd(change_key, {"next": time.time() - 1})
+    response = await client.get(
+        f"/api/polls/{poll.id}", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_versions_are_stable_until_bumped_and_etags_per_user(version_redis):
+    first = await poll_version.seed_poll_version("poll-a")
+    assert first is not None
+    assert await poll_version.get_poll_version("poll-a") == first
+    assert poll_version.poll_detail_etag("poll-a", "u1", first) != poll_version.poll_detail_etag(
+        "poll-a", "u2", first
+    )
+
+    await poll_version.bump_poll_versions(["poll-a", None])
+    assert await poll_version.get_poll_version("poll-a") != first
+
+
+@pytest.mark.asyncio
+async def test_version_counters_expire_and_are_dropped(version_redis):
+    key = poll_version.version_key("poll-b")
+
+    # Reads never create counters; seeded ones expire
+    assert await poll_version.get_poll_version("poll-b") is None
+    assert await version_redis.exists(key) == 0
+    await poll_version.seed_poll_version("poll-b")
+    assert 0 < await version_redis.ttl(key) <= poll_version.VERSION_TTL_SECONDS
+
+    # A bump after eviction restarts at a random value, never at 1
+    await version_redis.delete(key)
+    await poll_version.bump_poll_versions(["poll-b"])
+    assert int(await version_redis.get(key)) > 1
+    assert await version_redis.ttl(key) > 0
+
+    await poll_version.schedule_poll_version_change("poll-b", datetime.utcnow())
+    await poll_version.drop_poll_versions(["poll-b"])
+    assert await version_redis.exists(key, poll_version.change_key("poll-b")) == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduled_changes_keep_the_earliest_and_move_the_version(version_redis):
+    first = await poll_version.seed_poll_version("poll-c")
+    now = datetime.utcnow()
+    await poll_version.schedule_poll_version_change("poll-c", now + timedelta(hours=2))
+    await poll_version.schedule_poll_version_change("poll-c", now + timedelta(hours=1))
+    await poll_version.schedule_poll_version_change("poll-c", now + timedelta(hours=3))
+    assert await poll_version.get_poll_version("poll-c") == first
+
+    await poll_version.schedule_poll_version_change("poll-c", now - timedelta(seconds=1))
+    moved = await poll_version.get_poll_version("poll-c")
+    assert moved != first
+    # The bump clears the schedule until the next full response sets it again
+    assert await poll_version.get_poll_version("poll-c") == moved
+    assert await version_redis.exists(poll_version.change_key("poll-c")) == 0
@@ -0,0 +1,163 @@
+"""Tests for keyset-paginated poll listing."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.models.label import Label
+from backend.models.poll import Poll
+from backend.models.poll_label import poll_labels
+from backend.models.user import User
+
+
+async def _pages(client: AsyncClient, auth_headers, **params):
+    pages, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = await client.get("/api/polls/", params=query, headers=auth_headers)
+        assert response.status_code == 200
+        pages.append([poll["title"] for poll in response.json()])
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_follow_created_at_and_id(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "LABELS_ENABLED", True)
+    first_label = Label(name="Keyset One", slug=f"keyset-one-{uuid4().hex[:8]}")
+    second_label = Label(name="Keyset Two", slug=f"keyset-two-{uuid4().hex[:8]}")
+    base = datetime.utcnow() - timedelta(days=1)
+    # Two polls share a timestamp, so the id breaks the tie
+    polls = [
+        Poll(
+            id=uuid4(),
+            title=f"keyset-{i}",
+            created_by=test_user.id,
+            created_at=base + timedelta(minutes=min(i, 3)),
+        )
+        for i in range(5)
+    ]
+    db_session.add_all([first_label, second_label, *polls])
+    await db_session.commit()
+    await db_session.execute(
+        poll_labels.insert(),
+        [
+            *({"poll_id": poll.id, "label_id": first_label.id} for poll in polls),
+            *({"poll_id": poll.id, "label_id": second_label.id} for poll in polls[:2]),
+        ],
+    )
+    await db_session.commit()
+
+    expected = [
+        poll.title
+        for poll in sorted(polls, key=lambda poll: (poll.created_at, str(poll.id)), reverse=True)
+    ]
+    both_labels = f"{first_label.slug},{second_label.slug}"
+
+    pages = await _pages(client, auth_headers, limit=2, label=both_labels)
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [title for page in pages for title in page] == expected
+
+    # Offset paging still works and agrees with the cursor order
+    response = await client.get(
+        "/api/polls/", params={"skip": 2, "limit": 2, "label": both_labels}, headers=auth_headers
+    )
+    assert [poll["title"] for poll in response.json()] == expected[2:4]
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(client: AsyncClient, auth_headers):
+    response = await client.get("/api/polls/", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_includes_vote_status_matching_poll_detail(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers
+):
+    from backend.models.delegation import Delegation
+    from backend.models.option import Option
+    from backend.models.vote import Vote
+
+    middle, final = [
+        User(
+            id=uuid4(),
+            username=f"status_user_{i}",
+            email=f"status_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(2)
+    ]
+    voted, delegated, untouched, withdrawn = [
+        Poll(id=uuid4(), title=f"status-{name}", created_by=test_user.id)
+        for name in ("voted", "delegated", "untouched", "withdrawn")
+    ]
+    db_session.add_all([middle, final, voted, delegated, untouched, withdrawn])
+    await db_session.commit()
+    option = Option(id=uuid4(), poll_id=voted.id, text="Yes")
+    withdrawn_option = Option(id=uuid4(), poll_id=withdrawn.id, text="Yes")
+    db_session.add_all([option, withdrawn_option])
+    await db_session.commit()
+
+    start = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all(
+        [
+            Vote(user_id=test_user.id, poll_id=voted.id, option_id=option.id, weight=1),
+            # A soft-deleted vote no longer counts as voting
+            Vote(
+                user_id=test_user.id,
+                poll_id=withdrawn.id,
+                option_id=withdrawn_option.id,
+                weight=1,
+                is_deleted=True,
+            ),
+            Delegation(
+                delegator_id=test_user.id,
+                delegatee_id=middle.id,
+                poll_id=delegated.id,
+                start_date=start,
+            ),
+            Delegation(
+                delegator_id=middle.id,
+                delegatee_id=final.id,
+                poll_id=delegated.id,
+                start_date=start,
+            ),
+            # A delegation on another poll does not reach the untouched one
+            Delegation(
+                delegator_id=test_user.id,
+                delegatee_id=final.id,
+                poll_id=voted.id,
+                start_date=start,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    response = await client.get(
+        "/api/polls/", params={"include_vote_status": "true"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    statuses = {poll["id"]: poll["your_vote_status"] for poll in response.json()}
+
+    assert statuses[str(voted.id)]["status"] == "voted"
+    assert statuses[str(untouched.id)]["status"] == "none"
+    assert statuses[str(withdrawn.id)]["status"] == "none"
+    assert statuses[str(delegated.id)]["status"] == "delegated"
+    assert statuses[str(delegated.id)]["resolved_vote_path"] == [
+        str(test_user.id), str(middle.id), str(final.id)
+    ]
+    for poll in (voted, delegated, untouched, withdrawn):
+        detail = await client.get(f"/api/polls/{poll.id}", headers=auth_headers)
+        assert detail.json()["your_vote_status"] == statuses[str(poll.id)]
+
+    # Without the flag, list responses carry no status
+    response = await client.get("/api/polls/", headers=auth_headers)
+    assert all(poll["your_vote_status"] is None for poll in response.json())
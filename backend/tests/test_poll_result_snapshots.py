@@ -0,0 +1,177 @@
+"""Tests for immutable results snapshots of closed polls."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.voting import create_vote
+from backend.models.option import Option
+from backend.models.poll import Poll, PollStatus
+from backend.models.poll_result_snapshot import PollResultSnapshot
+from backend.models.user import User
+from backend.models.vote import Vote
+
+
+async def _poll_with_vote(db_session: AsyncSession, user: User, **poll_fields):
+    poll = Poll(id=uuid4(), title="Snapshot Poll", created_by=user.id, **poll_fields)
+    db_session.add(poll)
+    await db_session.commit()
+
+    yes = Option(id=uuid4(), poll_id=poll.id, text="Yes")
+    no = Option(id=uuid4(), poll_id=poll.id, text="No")
+    db_session.add_all([yes, no])
+    await db_session.commit()
+
+    db_session.add(Vote(user_id=user.id, poll_id=poll.id, option_id=yes.id, weight=1))
+    await db_session.commit()
+    return poll, yes, no
+
+
+@pytest.mark.asyncio
+async def test_closed_poll_results_served_from_snapshot(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers
+):
+    poll, yes, no = await _poll_with_vote(db_session, test_user, status=PollStatus.CLOSED)
+
+    response = await client.get(f"/api/polls/{poll.id}/results", headers=auth_headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+    by_text = {r["text"]: r for r in response.json()}
+    assert by_text["Yes"]["direct_votes"] == 1
+
+    snapshots = (await db_session.execute(select(PollResultSnapshot))).scalars().all()
+    assert len(snapshots) == 1
+
+    # Later writes never change the snapshot
+    other = User(
+        id=uuid4(), username="late_voter", email="late@example.com", hashed_password="hashed"
+    )
+    db_session.add(other)
+    await db_session.commit()
+    db_session.add(Vote(user_id=other.id, poll_id=poll.id, option_id=no.id, weight=1))
+    await db_session.commit()
+
+    # ...and vote writes refuse late votes instead of dropping them silently
+    latecomer = User(
+        id=uuid4(), username="latecomer", email="latecomer@example.com", hashed_password="hashed"
+    )
+    db_session.add(latecomer)
+    await db_session.commit()
+    with pytest.raises(ValueError, match="closed"):
+        await create_vote(
+            db_session, {"poll_id": poll.id, "option_id": no.id, "weight": 1}, latecomer
+        )
+
+    response = await client.get(f"/api/polls/{poll.id}/results", headers=auth_headers)
+    assert response.headers["etag"] == etag
+    assert {r["text"]: r for r in response.json()}["No"]["total_votes"] == 0
+
+    response = await client.get(
+        f"/api/polls/{poll.id}/results",
+        headers={**auth_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_poll_past_end_date_is_snapshotted(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers
+):
+    poll, _, _ = await _poll_with_vote(
+        db_session,
+        test_user,
+        status=PollStatus.ACTIVE,
+        end_date=datetime.utcnow() - timedelta(hours=1),
+    )
+
+    response = await client.get(f"/api/polls/{poll.id}/results", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert "etag" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_open_poll_results_not_snapshotted(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers
+):
+    poll, _, _ = await _poll_with_vote(db_session, test_user, status=PollStatus.ACTIVE)
+
+    response = await client.get(f"/api/polls/{poll.id}/results", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    snapshots = (await db_session.execute(select(PollResultSnapshot))).scalars().all()
+    assert snapshots == []
+
+
+@pytest.mark.asyncio
+async def test_batch_results_endpoint(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers
+):
+    closed, _, _ = await _poll_with_vote(db_session, test_user, status=PollStatus.CLOSED)
+    open_poll, _, _ = await _poll_with_vote(db_session, test_user)
+    missing = uuid4()
+
+    response = await client.post(
+        "/api/polls/results:batch",
+        json={"poll_ids": [str(closed.id), str(open_poll.id), str(missing)]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["results"]) == {str(closed.id), str(open_poll.id)}
+    assert body["not_found"] == [str(missing)]
+    for poll_id in (closed.id, open_poll.id):
+        by_text = {r["text"]: r for r in body["results"][str(poll_id)]}
+        assert by_text["Yes"]["direct_votes"] == 1
+
+    # Only the closed poll gets a snapshot, and the single-poll endpoint reuses it
+    snapshots = (await db_session.execute(select(PollResultSnapshot))).scalars().all()
+    assert [snapshot.poll_id for snapshot in snapshots] == [str(closed.id)]
+    response = await client.get(f"/api/polls/{closed.id}/results", headers=auth_headers)
+    assert response.json() == body["results"][str(closed.id)]
+
+
+@pytest.mark.asyncio
+async def test_batch_results_endpoint_limits_poll_count(
+    client: AsyncClient, auth_headers, monkeypatch
+):
+    from backend.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "POLL_RESULTS_BATCH_MAX_POLLS", 2)
+    response = await client.post(
+        "/api/polls/results:batch",
+        json={"poll_ids": [str(uuid4()) for _ in range(3)]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_vote_writes_on_closed_poll_are_rejected_alike(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers
+):
+    poll, yes, no = await _poll_with_vote(db_session, test_user, status=PollStatus.CLOSED)
+    vote_id = (
+        await db_session.execute(select(Vote.id).where(Vote.poll_id == poll.id))
+    ).scalar_one()
+
+    responses = [
+        await client.post(
+            "/api/votes/",
+            json={"poll_id": str(poll.id), "option_id": str(no.id)},
+            headers=auth_headers,
+        ),
+        await client.patch(
+            f"/api/votes/{vote_id}", json={"option_id": str(no.id)}, headers=auth_headers
+        ),
+        await client.delete(f"/api/votes/{vote_id}", headers=auth_headers),
+    ]
+
+    assert [response.status_code for response in responses] == [400, 400, 400]
@@ -0,0 +1,395 @@
+"""Tests for the set-based poll tally engine."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.delegation import Delegation, DelegationMode
+from backend.models.label import Label
+from backend.models.option import Option
+from backend.models.poll import Poll
+from backend.models.poll_label import poll_labels
+from backend.models.user import User
+from backend.models.vote import Vote
+from backend.services.poll import get_poll_results, get_poll_results_batch
+from backend.services.poll_tally import PollTallyCore, TallyInput
+
+
+def _delegation(delegator_id, delegatee_id, **scope) -> Delegation:
+    delegation = Delegation()
+    delegation.id = str(uuid4())
+    delegation.delegator_id = delegator_id
+    delegation.delegatee_id = delegatee_id
+    delegation.mode = scope.pop("mode", DelegationMode.FLEXIBLE_DOMAIN)
+    delegation.poll_id = scope.get("poll_id")
+    delegation.label_id = scope.get("label_id")
+    delegation.created_at = datetime.utcnow()
+    return delegation
+
+
+def _option(poll_id, text) -> Option:
+    option = Option(poll_id=poll_id, text=text)
+    option.id = str(uuid4())
+    return option
+
+
+def _vote(user_id, poll_id, option_id, weight=1) -> Vote:
+    return Vote(user_id=user_id, poll_id=poll_id, option_id=option_id, weight=weight)
+
+
+class TestPollTallyCore:
+    """Test the in-memory tally."""
+
+    def test_direct_and_delegated_votes(self):
+        poll_id = str(uuid4())
+        alice, bob, carol = str(uuid4()), str(uuid4()), str(uuid4())
+        yes, no = _option(poll_id, "Yes"), _option(poll_id, "No")
+
+        results = PollTallyCore.tally(
+            TallyInput.from_votes(
+                poll_id=poll_id,
+                label_ids=[],
+                options=[yes, no],
+                votes=[_vote(bob, poll_id, yes.id), _vote(carol, poll_id, no.id)],
+                delegations=[_delegation(alice, bob)],
+            )
+        )
+
+        by_text = {r.text: r for r in results}
+        assert by_text["Yes"].direct_votes == 1
+        assert by_text["Yes"].delegated_votes == 1
+        assert by_text["Yes"].total_votes == 2
+        assert by_text["No"].total_votes == 1
+        assert results[0].text == "Yes"
+
+    def test_direct_vote_overrides_delegation(self):
+        poll_id = str(uuid4())
+        alice, bob = str(uuid4()), str(uuid4())
+        yes, no = _option(poll_id, "Yes"), _option(poll_id, "No")
+
+        results = PollTallyCore.tally(
+            TallyInput.from_votes(
+                poll_id=poll_id,
+                label_ids=[],
+                options=[yes, no],
+                votes=[_vote(alice, poll_id, no.id), _vote(bob, poll_id, yes.id)],
+                delegations=[_delegation(alice, bob)],
+            )
+        )
+
+        by_text = {r.text: r for r in results}
+        assert by_text["Yes"].delegated_votes == 0
+        assert by_text["No"].direct_votes == 1
+
+    def test_poll_delegation_takes_precedence_over_global(self):
+        poll_id = str(uuid4())
+        alice, bob, carol = str(uuid4()), str(uuid4()), str(uuid4())
+        yes, no = _option(poll_id, "Yes"), _option(poll_id, "No")
+
+        results = PollTallyCore.tally(
+            TallyInput.from_votes(
+                poll_id=poll_id,
+                label_ids=[],
+                options=[yes, no],
+                votes=[_vote(bob, poll_id, yes.id), _vote(carol, poll_id, no.id)],
+                delegations=[
+                    _delegation(alice, bob),
+                    _delegation(alice, carol, poll_id=poll_id),
+                ],
+            )
+        )
+
+        by_text = {r.text: r for r in results}
+        assert by_text["No"].delegated_votes == 1
+        assert by_text["Yes"].delegated_votes == 0
+
+    def test_label_delegation_for_other_label_is_ignored(self):
+        poll_id = str(uuid4())
+        alice, bob = str(uuid4()), str(uuid4())
+        yes = _option(poll_id, "Yes")
+
+        results = PollTallyCore.tally(
+            TallyInput.from_votes(
+                poll_id=poll_id,
+                label_ids=[str(uuid4())],
+                options=[yes],
+                votes=[_vote(bob, poll_id, yes.id)],
+                delegations=[_delegation(alice, bob, label_id=str(uuid4()))],
+            )
+        )
+
+        assert results[0].delegated_votes == 0
+
+    def test_multi_hop_chain_credits_every_delegator(self):
+        poll_id = str(uuid4())
+        alice, bob, carol = str(uuid4()), str(uuid4()), str(uuid4())
+        yes = _option(poll_id, "Yes")
+
+        results = PollTallyCore.tally(
+            TallyInput.from_votes(
+                poll_id=poll_id,
+                label_ids=[],
+                options=[yes],
+                votes=[_vote(carol, poll_id, yes.id)],
+                delegations=[_delegation(alice, bob), _delegation(bob, carol)],
+            )
+        )
+
+        assert results[0].direct_votes == 1
+        assert results[0].delegated_votes == 2
+
+    def test_chain_stops_at_first_voter(self):
+        poll_id = str(uuid4())
+        alice, bob, carol = str(uuid4()), str(uuid4()), str(uuid4())
+        yes, no = _option(poll_id, "Yes"), _option(poll_id, "No")
+
+        results = PollTallyCore.tally(
+            TallyInput.from_votes(
+                poll_id=poll_id,
+                label_ids=[],
+                options=[yes, no],
+                votes=[_vote(bob, poll_id, no.id), _vote(carol, poll_id, yes.id)],
+                delegations=[_delegation(alice, bob), _delegation(bob, carol)],
+            )
+        )
+
+        by_text = {r.text: r for r in results}
+        assert by_text["No"].delegated_votes == 1
+        assert by_text["Yes"].delegated_votes == 0
+
+    def test_propagate_handles_cycles(self):
+        alice, bob, carol, dave = (str(uuid4()) for _ in range(4))
+        option_id = str(uuid4())
+
+        resolved = PollTallyCore.propagate(
+            {alice: bob, bob: carol, carol: alice, dave: alice},
+            {},
+        )
+        assert resolved == {alice: None, bob: None, carol: None, dave: None}
+
+        resolved = PollTallyCore.propagate(
+            {alice: bob, bob: carol, dave: alice}, {carol: option_id}
+        )
+        assert resolved == {alice: option_id, bob: option_id, dave: option_id}
+
+
+@pytest.mark.asyncio
+async def test_get_poll_results_ignores_unrelated_delegations(
+    db_session: AsyncSession, test_user: User
+):
+    """Delegations that do not reach a voter, or target another scope, add nothing."""
+    users = [
+        User(
+            id=uuid4(),
+            username=f"tally_user_{i}",
+            email=f"tally_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(4)
+    ]
+    voter, delegator, label_delegator, bystander = users
+    label = Label(id=uuid4(), name="Tally Label", slug="tally-label")
+    other_label = Label(id=uuid4(), name="Other Label", slug="other-label")
+    poll = Poll(id=uuid4(), title="Tally Poll", created_by=test_user.id)
+    db_session.add_all(users + [label, other_label, poll])
+    await db_session.commit()
+
+    await db_session.execute(
+        poll_labels.insert().values(poll_id=poll.id, label_id=label.id)
+    )
+    yes = Option(id=uuid4(), poll_id=poll.id, text="Yes")
+    no = Option(id=uuid4(), poll_id=poll.id, text="No")
+    db_session.add_all([yes, no])
+    await db_session.commit()
+
+    now = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all(
+        [
+            Vote(user_id=voter.id, poll_id=poll.id, option_id=yes.id, weight=1),
+            Delegation(
+                delegator_id=delegator.id, delegatee_id=voter.id, start_date=now
+            ),
+            Delegation(
+                delegator_id=label_delegator.id,
+                delegatee_id=voter.id,
+                label_id=label.id,
+                start_date=now,
+            ),
+            Delegation(
+                delegator_id=bystander.id,
+                delegatee_id=voter.id,
+                label_id=other_label.id,
+                start_date=now,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    results = await get_poll_results(poll.id, db_session)
+
+    by_text = {r.text: r for r in results}
+    assert by_text["Yes"].direct_votes == 1
+    assert by_text["Yes"].delegated_votes == 2
+    assert by_text["Yes"].total_votes == 3
+    assert by_text["No"].total_votes == 0
+
+
+@pytest.mark.asyncio
+async def test_get_poll_results_multi_hop(db_session: AsyncSession, test_user: User):
+    """A -> B -> C with only C voting credits both A and B."""
+    users = [
+        User(
+            id=uuid4(),
+            username=f"hop_user_{i}",
+            email=f"hop_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(3)
+    ]
+    a, b, c = users
+    poll = Poll(id=uuid4(), title="Multi-hop Poll", created_by=test_user.id)
+    db_session.add_all(users + [poll])
+    await db_session.commit()
+
+    yes = Option(id=uuid4(), poll_id=poll.id, text="Yes")
+    db_session.add(yes)
+    await db_session.commit()
+
+    now = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all(
+        [
+            Vote(user_id=c.id, poll_id=poll.id, option_id=yes.id, weight=1),
+            Delegation(delegator_id=a.id, delegatee_id=b.id, start_date=now),
+            Delegation(delegator_id=b.id, delegatee_id=c.id, start_date=now),
+        ]
+    )
+    await db_session.commit()
+
+    results = await get_poll_results(poll.id, db_session)
+
+    assert results[0].direct_votes == 1
+    assert results[0].delegated_votes == 2
+    assert results[0].total_votes == 3
+
+
+@pytest.mark.asyncio
+async def test_get_poll_results_aggregates_direct_votes(db_session: AsyncSession, test_user: User):
+    """Direct weight is summed in SQL; no Vote rows are hydrated."""
+    users = [
+        User(
+            id=uuid4(),
+            username=f"aggregate_user_{i}",
+            email=f"aggregate_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(4)
+    ]
+    heavy, light, unweighted, delegator = users
+    poll = Poll(id=uuid4(), title="Aggregate Poll", created_by=test_user.id)
+    db_session.add_all(users + [poll])
+    await db_session.commit()
+
+    yes = Option(id=uuid4(), poll_id=poll.id, text="Yes")
+    no = Option(id=uuid4(), poll_id=poll.id, text="No")
+    db_session.add_all([yes, no])
+    await db_session.commit()
+
+    db_session.add_all(
+        [
+            Vote(user_id=heavy.id, poll_id=poll.id, option_id=yes.id, weight=3),
+            Vote(user_id=light.id, poll_id=poll.id, option_id=no.id, weight=1),
+            Vote(user_id=unweighted.id, poll_id=poll.id, option_id=no.id, weight=0),
+            Delegation(
+                delegator_id=delegator.id,
+                delegatee_id=light.id,
+                start_date=datetime.utcnow() - timedelta(minutes=1),
+            ),
+        ]
+    )
+    await db_session.commit()
+    db_session.expunge_all()
+
+    loaded_votes = []
+
+    def count_load(target, context):
+        loaded_votes.append(target)
+
+    event.listen(Vote, "load", count_load)
+    try:
+        results = await get_poll_results(poll.id, db_session)
+    finally:
+        event.remove(Vote, "load", count_load)
+
+    by_text = {r.text: r for r in results}
+    assert by_text["Yes"].direct_votes == 3
+    assert by_text["No"].direct_votes == 2
+    assert by_text["No"].delegated_votes == 1
+    assert loaded_votes == []
+
+
+@pytest.mark.asyncio
+async def test_get_poll_results_batch_matches_single_poll_results(
+    db_session: AsyncSession, test_user: User
+):
+    """Each poll in a batch only counts the delegations whose scope covers it."""
+    users = [
+        User(
+            id=uuid4(),
+            username=f"batch_user_{i}",
+            email=f"batch_user_{i}@example.com",
+            hashed_password="hashed",
+        )
+        for i in range(4)
+    ]
+    voter, global_delegator, poll_delegator, label_delegator = users
+    label = Label(id=uuid4(), name="Batch Label", slug="batch-label")
+    first = Poll(id=uuid4(), title="First Batch Poll", created_by=test_user.id)
+    second = Poll(id=uuid4(), title="Second Batch Poll", created_by=test_user.id)
+    db_session.add_all(users + [label, first, second])
+    await db_session.commit()
+
+    await db_session.execute(
+        poll_labels.insert().values(poll_id=second.id, label_id=label.id)
+    )
+    first_yes = Option(id=uuid4(), poll_id=first.id, text="Yes")
+    second_yes = Option(id=uuid4(), poll_id=second.id, text="Yes")
+    db_session.add_all([first_yes, second_yes])
+    await db_session.commit()
+
+    now = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add_all(
+        [
+            Vote(user_id=voter.id, poll_id=first.id, option_id=first_yes.id, weight=1),
+            Vote(user_id=voter.id, poll_id=second.id, option_id=second_yes.id, weight=2),
+            Delegation(
+                delegator_id=global_delegator.id, delegatee_id=voter.id, start_date=now
+            ),
+            Delegation(
+                delegator_id=poll_delegator.id,
+                delegatee_id=voter.id,
+                poll_id=first.id,
+                start_date=now,
+            ),
+            Delegation(
+                delegator_id=label_delegator.id,
+                delegatee_id=voter.id,
+                label_id=label.id,
+                start_date=now,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    missing = uuid4()
+    batch = await get_poll_results_batch([second.id, missing, first.id], db_session)
+
+    assert list(batch) == [str(second.id), str(first.id)]
+    assert batch[str(first.id)][0].direct_votes == 1
+    assert batch[str(first.id)][0].delegated_votes == 2
+    assert batch[str(second.id)][0].direct_votes == 2
+    assert batch[str(second.id)][0].delegated_votes == 2
+    for poll in (first, second):
+        assert batch[str(poll.id)] == await get_poll_results(poll.id, db_session)